@@ -0,0 +1,143 @@
+#include "Commands/BlueprintAction/BuildFunctionCallIndexCommand.h"
+#include "Dom/JsonObject.h"
+#include "Dom/JsonValue.h"
+#include "Serialization/JsonSerializer.h"
+#include "Serialization/JsonReader.h"
+#include "Serialization/JsonWriter.h"
+#include "Engine/Blueprint.h"
+#include "EdGraph/EdGraph.h"
+#include "EdGraph/EdGraphNode.h"
+#include "K2Node_CallFunction.h"
+#include "Misc/PackageName.h"
+#include "Misc/Paths.h"
+#include "Services/AssetDiscoveryService.h"
+#include "Utils/GraphUtils.h"
+
+FBuildFunctionCallIndexCommand::FBuildFunctionCallIndexCommand(TSharedPtr<IBlueprintActionService> InBlueprintActionService)
+	: BlueprintActionService(InBlueprintActionService)
+{
+}
+
+FString FBuildFunctionCallIndexCommand::Execute(const FString& Parameters)
+{
+	TSharedPtr<FJsonObject> JsonObject;
+	TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(Parameters);
+
+	if (!FJsonSerializer::Deserialize(Reader, JsonObject) || !JsonObject.IsValid())
+	{
+		return CreateErrorResponse(TEXT("Invalid JSON parameters"));
+	}
+
+	FString Path = JsonObject->GetStringField(TEXT("path"));
+	if (Path.IsEmpty())
+	{
+		Path = TEXT("/Game");
+	}
+
+	TArray<FString> BlueprintPaths = FAssetDiscoveryService::Get().FindBlueprints(TEXT(""), Path);
+
+	TArray<TSharedPtr<FJsonValue>> BlueprintsArray;
+	TArray<TSharedPtr<FJsonValue>> CallsArray;
+
+	for (const FString& BPPath : BlueprintPaths)
+	{
+		UBlueprint* Blueprint = LoadObject<UBlueprint>(nullptr, *BPPath);
+		if (!Blueprint)
+		{
+			continue;
+		}
+
+		// The package file lets the caller notice when the blueprint is saved again
+		const FString PackageName = Blueprint->GetOutermost()->GetName();
+		const FString PackageFile = FPaths::ConvertRelativePathToFull(
+			FPackageName::LongPackageNameToFilename(PackageName, FPackageName::GetAssetPackageExtension()));
+
+		TSharedPtr<FJsonObject> BlueprintObj = MakeShared<FJsonObject>();
+		BlueprintObj->SetStringField(TEXT("blueprint_path"), Blueprint->GetPathName());
+		BlueprintObj->SetStringField(TEXT("blueprint_name"), Blueprint->GetName());
+		BlueprintObj->SetStringField(TEXT("package_file"), PackageFile);
+		BlueprintsArray.Add(MakeShared<FJsonValueObject>(BlueprintObj));
+
+		CollectFunctionCalls(Blueprint, CallsArray);
+	}
+
+	FString RootDir;
+	if (FPackageName::TryConvertLongPackageNameToFilename(Path / TEXT(""), RootDir))
+	{
+		RootDir = FPaths::ConvertRelativePathToFull(RootDir);
+	}
+
+	TSharedPtr<FJsonObject> ResponseObj = MakeShared<FJsonObject>();
+	ResponseObj->SetBoolField(TEXT("success"), true);
+	ResponseObj->SetStringField(TEXT("path"), Path);
+	ResponseObj->SetStringField(TEXT("root_dir"), RootDir);
+	ResponseObj->SetNumberField(TEXT("blueprints_indexed"), BlueprintsArray.Num());
+	ResponseObj->SetNumberField(TEXT("call_count"), CallsArray.Num());
+	ResponseObj->SetArrayField(TEXT("blueprints"), BlueprintsArray);
+	ResponseObj->SetArrayField(TEXT("calls"), CallsArray);
+
+	FString OutputString;
+	TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+	FJsonSerializer::Serialize(ResponseObj.ToSharedRef(), Writer);
+
+	return OutputString;
+}
+
+FString FBuildFunctionCallIndexCommand::GetCommandName() const
+{
+	return TEXT("build_function_call_index");
+}
+
+bool FBuildFunctionCallIndexCommand::ValidateParams(const FString& Parameters) const
+{
+	TSharedPtr<FJsonObject> JsonObject;
+	TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(Parameters);
+
+	return FJsonSerializer::Deserialize(Reader, JsonObject) && JsonObject.IsValid();
+}
+
+void FBuildFunctionCallIndexCommand::CollectFunctionCalls(UBlueprint* Blueprint, TArray<TSharedPtr<FJsonValue>>& OutCalls) const
+{
+	TArray<UEdGraph*> AllGraphs;
+	Blueprint->GetAllGraphs(AllGraphs);
+
+	for (UEdGraph* Graph : AllGraphs)
+	{
+		if (!Graph)
+		{
+			continue;
+		}
+
+		for (UEdGraphNode* Node : Graph->Nodes)
+		{
+			UK2Node_CallFunction* CallFunc = Cast<UK2Node_CallFunction>(Node);
+			if (!CallFunc)
+			{
+				continue;
+			}
+
+			TSharedPtr<FJsonObject> CallObj = MakeShared<FJsonObject>();
+			CallObj->SetStringField(TEXT("blueprint_path"), Blueprint->GetPathName());
+			CallObj->SetStringField(TEXT("blueprint_name"), Blueprint->GetName());
+			CallObj->SetStringField(TEXT("graph_name"), Graph->GetName());
+			CallObj->SetStringField(TEXT("node_id"), FGraphUtils::GetReliableNodeId(Node));
+			CallObj->SetStringField(TEXT("node_title"), Node->GetNodeTitle(ENodeTitleType::ListView).ToString());
+			CallObj->SetStringField(TEXT("function_name"), CallFunc->FunctionReference.GetMemberName().ToString());
+
+			OutCalls.Add(MakeShared<FJsonValueObject>(CallObj));
+		}
+	}
+}
+
+FString FBuildFunctionCallIndexCommand::CreateErrorResponse(const FString& ErrorMessage) const
+{
+	TSharedPtr<FJsonObject> ResponseObj = MakeShared<FJsonObject>();
+	ResponseObj->SetBoolField(TEXT("success"), false);
+	ResponseObj->SetStringField(TEXT("error"), ErrorMessage);
+
+	FString OutputString;
+	TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+	FJsonSerializer::Serialize(ResponseObj.ToSharedRef(), Writer);
+
+	return OutputString;
+}
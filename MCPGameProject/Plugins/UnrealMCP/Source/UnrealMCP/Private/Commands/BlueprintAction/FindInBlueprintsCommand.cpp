@@ -30,10 +30,11 @@ FString FFindInBlueprintsCommand::Execute(const FString& Parameters)
 	EBlueprintSearchType SearchType;
 	FString Path;
 	int32 MaxResults;
+	int32 Offset;
 	bool bCaseSensitive;
 	FString ParseError;
 
-	if (!ParseParameters(Parameters, SearchQuery, SearchType, Path, MaxResults, bCaseSensitive, ParseError))
+	if (!ParseParameters(Parameters, SearchQuery, SearchType, Path, MaxResults, Offset, bCaseSensitive, ParseError))
 	{
 		return CreateErrorResponse(ParseError);
 	}
@@ -43,6 +44,7 @@ FString FFindInBlueprintsCommand::Execute(const FString& Parameters)
 
 	TArray<FBlueprintSearchMatch> AllMatches;
 	int32 BlueprintsSearched = 0;
+	int32 MatchesToSkip = Offset;
 
 	for (const FString& BPPath : BlueprintPaths)
 	{
@@ -56,7 +58,7 @@ FString FFindInBlueprintsCommand::Execute(const FString& Parameters)
 		BlueprintsSearched++;
 
 		// Search this blueprint
-		SearchBlueprint(Blueprint, SearchQuery, SearchType, bCaseSensitive, AllMatches, MaxResults);
+		SearchBlueprint(Blueprint, SearchQuery, SearchType, bCaseSensitive, AllMatches, MaxResults, MatchesToSkip);
 
 		// Stop if we have enough results
 		if (AllMatches.Num() >= MaxResults)
@@ -77,7 +79,9 @@ FString FFindInBlueprintsCommand::Execute(const FString& Parameters)
 		default: SearchTypeStr = TEXT("all"); break;
 	}
 
-	return CreateSuccessResponse(AllMatches, SearchQuery, SearchTypeStr, BlueprintsSearched);
+	// A full page may have more matches after it; the next page starts where this one ended
+	const bool bHasMore = AllMatches.Num() >= MaxResults;
+	return CreateSuccessResponse(AllMatches, SearchQuery, SearchTypeStr, BlueprintsSearched, Offset, bHasMore);
 }
 
 FString FFindInBlueprintsCommand::GetCommandName() const
@@ -106,6 +110,7 @@ bool FFindInBlueprintsCommand::ParseParameters(
 	EBlueprintSearchType& OutSearchType,
 	FString& OutPath,
 	int32& OutMaxResults,
+	int32& OutOffset,
 	bool& OutCaseSensitive,
 	FString& OutError) const
 {
@@ -153,6 +158,19 @@ bool FFindInBlueprintsCommand::ParseParameters(
 		return false;
 	}
 
+	// Parse offset (matches to skip, for fetching later pages) with default 0
+	OutOffset = 0;
+	if (JsonObject->HasField(TEXT("offset")))
+	{
+		OutOffset = JsonObject->GetIntegerField(TEXT("offset"));
+	}
+
+	if (OutOffset < 0)
+	{
+		OutError = TEXT("offset must not be negative");
+		return false;
+	}
+
 	// Parse case_sensitive with default false
 	OutCaseSensitive = false;
 	if (JsonObject->HasField(TEXT("case_sensitive")))
@@ -199,7 +217,8 @@ void FFindInBlueprintsCommand::SearchBlueprint(
 	EBlueprintSearchType SearchType,
 	bool bCaseSensitive,
 	TArray<FBlueprintSearchMatch>& OutMatches,
-	int32 MaxResults) const
+	int32 MaxResults,
+	int32& InOutMatchesToSkip) const
 {
 	if (!Blueprint)
 	{
@@ -233,6 +252,13 @@ void FFindInBlueprintsCommand::SearchBlueprint(
 			FString MatchContext;
 			if (MatchesSearchCriteria(Node, SearchQuery, SearchType, bCaseSensitive, MatchContext))
 			{
+				// Matches before the requested offset belong to earlier pages
+				if (InOutMatchesToSkip > 0)
+				{
+					--InOutMatchesToSkip;
+					continue;
+				}
+
 				FBlueprintSearchMatch Match;
 				Match.BlueprintPath = Blueprint->GetPathName();
 				Match.BlueprintName = Blueprint->GetName();
@@ -405,7 +431,9 @@ FString FFindInBlueprintsCommand::CreateSuccessResponse(
 	const TArray<FBlueprintSearchMatch>& Matches,
 	const FString& SearchQuery,
 	const FString& SearchType,
-	int32 BlueprintsSearched) const
+	int32 BlueprintsSearched,
+	int32 Offset,
+	bool bHasMore) const
 {
 	TSharedPtr<FJsonObject> ResponseObj = MakeShared<FJsonObject>();
 	ResponseObj->SetBoolField(TEXT("success"), true);
@@ -413,6 +441,12 @@ FString FFindInBlueprintsCommand::CreateSuccessResponse(
 	ResponseObj->SetStringField(TEXT("search_type"), SearchType);
 	ResponseObj->SetNumberField(TEXT("blueprints_searched"), BlueprintsSearched);
 	ResponseObj->SetNumberField(TEXT("match_count"), Matches.Num());
+	ResponseObj->SetNumberField(TEXT("offset"), Offset);
+	ResponseObj->SetBoolField(TEXT("has_more"), bHasMore);
+	if (bHasMore)
+	{
+		ResponseObj->SetNumberField(TEXT("next_offset"), Offset + Matches.Num());
+	}
 
 	// Build matches array
 	TArray<TSharedPtr<FJsonValue>> MatchesArray;
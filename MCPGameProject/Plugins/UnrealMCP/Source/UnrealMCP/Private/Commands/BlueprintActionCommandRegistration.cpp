@@ -6,6 +6,7 @@
 #include "Commands/BlueprintAction/SearchBlueprintActionsCommand.h"
 #include "Commands/BlueprintAction/GetNodePinInfoCommand.h"
 #include "Commands/BlueprintAction/FindInBlueprintsCommand.h"
+#include "Commands/BlueprintAction/BuildFunctionCallIndexCommand.h"
 #include "Services/IBlueprintActionService.h"
 
 // Static member definition
@@ -45,6 +46,10 @@ void FBlueprintActionCommandRegistration::RegisterCommands(FUnrealMCPCommandRegi
     TSharedPtr<IUnrealMCPCommand> FindInBlueprintsCommand = MakeShared<FFindInBlueprintsCommand>(BlueprintActionService);
     RegisterAndTrackCommand(FindInBlueprintsCommand);
 
+    // Register BuildFunctionCallIndex command
+    TSharedPtr<IUnrealMCPCommand> BuildFunctionCallIndexCommand = MakeShared<FBuildFunctionCallIndexCommand>(BlueprintActionService);
+    RegisterAndTrackCommand(BuildFunctionCallIndexCommand);
+
     UE_LOG(LogTemp, Log, TEXT("FBlueprintActionCommandRegistration::RegisterCommands: Successfully registered %d Blueprint Action commands"), RegisteredCommands.Num());
 }
 
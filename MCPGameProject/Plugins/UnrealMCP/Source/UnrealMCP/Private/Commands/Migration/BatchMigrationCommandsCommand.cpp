@@ -0,0 +1,149 @@
+#include "Commands/Migration/BatchMigrationCommandsCommand.h"
+#include "Commands/UnrealMCPCommandRegistry.h"
+#include "Dom/JsonObject.h"
+#include "Dom/JsonValue.h"
+#include "Serialization/JsonSerializer.h"
+#include "Serialization/JsonWriter.h"
+
+DEFINE_LOG_CATEGORY_STATIC(LogMigrationBatch, Log, All);
+
+FString FBatchMigrationCommandsCommand::Execute(const FString& Parameters)
+{
+    TSharedPtr<FJsonObject> JsonObject;
+    TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(Parameters);
+
+    if (!FJsonSerializer::Deserialize(Reader, JsonObject) || !JsonObject.IsValid())
+    {
+        return CreateErrorResponse(TEXT("Invalid JSON parameters"));
+    }
+
+    const TArray<TSharedPtr<FJsonValue>>* CommandsArray = nullptr;
+    if (!JsonObject->TryGetArrayField(TEXT("commands"), CommandsArray) || !CommandsArray)
+    {
+        return CreateErrorResponse(TEXT("Missing 'commands' parameter"));
+    }
+
+    bool bStopOnError = false;
+    JsonObject->TryGetBoolField(TEXT("stop_on_error"), bStopOnError);
+
+    TArray<TSharedPtr<FJsonValue>> ResultsArray;
+    ResultsArray.Reserve(CommandsArray->Num());
+    bool bAllSucceeded = true;
+
+    for (const TSharedPtr<FJsonValue>& CommandValue : *CommandsArray)
+    {
+        TSharedPtr<FJsonObject> SubResult;
+        if (CommandValue.IsValid() && CommandValue->Type == EJson::Object)
+        {
+            SubResult = ExecuteSubCommand(CommandValue->AsObject());
+        }
+        else
+        {
+            SubResult = CreateErrorObject(TEXT("Batch entry must be an object with 'type' and 'params'"));
+        }
+
+        bool bSubSuccess = false;
+        SubResult->TryGetBoolField(TEXT("success"), bSubSuccess);
+        ResultsArray.Add(MakeShared<FJsonValueObject>(SubResult));
+
+        if (!bSubSuccess)
+        {
+            bAllSucceeded = false;
+            if (bStopOnError)
+            {
+                break;
+            }
+        }
+    }
+
+    UE_LOG(LogMigrationBatch, Log, TEXT("Executed %d of %d batched commands"), ResultsArray.Num(), CommandsArray->Num());
+
+    TSharedPtr<FJsonObject> ResultJson = MakeShared<FJsonObject>();
+    ResultJson->SetBoolField(TEXT("success"), bAllSucceeded);
+    ResultJson->SetNumberField(TEXT("command_count"), ResultsArray.Num());
+    ResultJson->SetArrayField(TEXT("results"), ResultsArray);
+    if (!bAllSucceeded)
+    {
+        ResultJson->SetStringField(TEXT("error"), TEXT("One or more batched commands failed"));
+    }
+
+    FString OutputString;
+    TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+    FJsonSerializer::Serialize(ResultJson.ToSharedRef(), Writer);
+
+    return OutputString;
+}
+
+TSharedPtr<FJsonObject> FBatchMigrationCommandsCommand::ExecuteSubCommand(const TSharedPtr<FJsonObject>& CommandJson) const
+{
+    FString CommandType;
+    if (!CommandJson->TryGetStringField(TEXT("type"), CommandType) || CommandType.IsEmpty())
+    {
+        return CreateErrorObject(TEXT("Batch entry is missing 'type'"));
+    }
+
+    if (CommandType == GetCommandName())
+    {
+        return CreateErrorObject(TEXT("Nested batches are not supported"));
+    }
+
+    FUnrealMCPCommandRegistry& Registry = FUnrealMCPCommandRegistry::Get();
+    if (!Registry.IsCommandRegistered(CommandType))
+    {
+        return CreateErrorObject(FString::Printf(TEXT("Command '%s' cannot be batched"), *CommandType));
+    }
+
+    TSharedPtr<FJsonObject> Params = MakeShared<FJsonObject>();
+    const TSharedPtr<FJsonObject>* ParamsObject = nullptr;
+    if (CommandJson->TryGetObjectField(TEXT("params"), ParamsObject) && ParamsObject)
+    {
+        Params = *ParamsObject;
+    }
+
+    FString ParamsString;
+    TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> ParamsWriter = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&ParamsString);
+    FJsonSerializer::Serialize(Params.ToSharedRef(), ParamsWriter.Get());
+
+    FString CommandResult = Registry.ExecuteCommand(CommandType, ParamsString);
+
+    TSharedPtr<FJsonObject> ParsedResult;
+    TSharedRef<TJsonReader<>> ResultReader = TJsonReaderFactory<>::Create(CommandResult);
+    if (!FJsonSerializer::Deserialize(ResultReader, ParsedResult) || !ParsedResult.IsValid())
+    {
+        return CreateErrorObject(FString::Printf(TEXT("Failed to parse result of '%s'"), *CommandType));
+    }
+
+    ParsedResult->SetStringField(TEXT("command"), CommandType);
+    return ParsedResult;
+}
+
+bool FBatchMigrationCommandsCommand::ValidateParams(const FString& Parameters) const
+{
+    TSharedPtr<FJsonObject> JsonObject;
+    TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(Parameters);
+
+    if (!FJsonSerializer::Deserialize(Reader, JsonObject) || !JsonObject.IsValid())
+    {
+        return false;
+    }
+
+    const TArray<TSharedPtr<FJsonValue>>* CommandsArray = nullptr;
+    return JsonObject->TryGetArrayField(TEXT("commands"), CommandsArray) && CommandsArray && CommandsArray->Num() > 0;
+}
+
+TSharedPtr<FJsonObject> FBatchMigrationCommandsCommand::CreateErrorObject(const FString& ErrorMessage) const
+{
+    TSharedPtr<FJsonObject> ResponseObj = MakeShared<FJsonObject>();
+    ResponseObj->SetBoolField(TEXT("success"), false);
+    ResponseObj->SetStringField(TEXT("error"), ErrorMessage);
+    return ResponseObj;
+}
+
+FString FBatchMigrationCommandsCommand::CreateErrorResponse(const FString& ErrorMessage) const
+{
+    FString OutputString;
+    TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+    FJsonSerializer::Serialize(CreateErrorObject(ErrorMessage).ToSharedRef(), Writer);
+
+    return OutputString;
+}
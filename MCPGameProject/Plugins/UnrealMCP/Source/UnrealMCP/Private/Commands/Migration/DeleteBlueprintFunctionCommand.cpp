@@ -49,15 +49,7 @@ FString FDeleteBlueprintFunctionCommand::Execute(const FString& Parameters)
     JsonObject->TryGetBoolField(TEXT("backup"), bBackup);
 
     // Load Blueprint
-    UBlueprint* Blueprint = LoadObject<UBlueprint>(nullptr, *BlueprintPath);
-    if (!Blueprint)
-    {
-        TArray<FString> FoundBlueprints = FAssetDiscoveryService::Get().FindBlueprints(BlueprintPath);
-        if (FoundBlueprints.Num() > 0)
-        {
-            Blueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
-        }
-    }
+    UBlueprint* Blueprint = FAssetDiscoveryService::Get().LoadBlueprint(BlueprintPath);
 
     if (!Blueprint)
     {
@@ -16,6 +16,7 @@
 #include "Engine/SimpleConstructionScript.h"
 #include "Engine/SCS_Node.h"
 #include "Misc/FileHelper.h"
+#include "HAL/FileManager.h"
 #include "Misc/Paths.h"
 #include "HAL/PlatformFileManager.h"
 #include "Dom/JsonObject.h"
@@ -25,6 +26,16 @@
 
 DEFINE_LOG_CATEGORY_STATIC(LogMigrationExport, Log, All);
 
+// Fields whose values repeat heavily across an export (class names, pin types,
+// GUIDs referenced by every connection). Only these are interned, so a reader
+// can tell an interned index from a genuine number.
+static const TCHAR* InternedExportFields[] = {
+    TEXT("name"), TEXT("class"), TEXT("type"), TEXT("subtype"), TEXT("node_type"),
+    TEXT("direction"), TEXT("category"), TEXT("subcategory"), TEXT("function_name"),
+    TEXT("function_class"), TEXT("function_class_path"), TEXT("event_class"),
+    TEXT("guid"), TEXT("node_guid"), TEXT("pin_name")
+};
+
 FString FExportBlueprintGraphCommand::Execute(const FString& Parameters)
 {
     TSharedPtr<FJsonObject> JsonObject;
@@ -42,20 +53,7 @@ FString FExportBlueprintGraphCommand::Execute(const FString& Parameters)
     }
 
     // Try to load Blueprint by path or name
-    UBlueprint* Blueprint = nullptr;
-
-    // First try as full path
-    Blueprint = LoadObject<UBlueprint>(nullptr, *BlueprintPath);
-
-    // If that fails, try to find by name using discovery service
-    if (!Blueprint)
-    {
-        TArray<FString> FoundBlueprints = FAssetDiscoveryService::Get().FindBlueprints(BlueprintPath);
-        if (FoundBlueprints.Num() > 0)
-        {
-            Blueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
-        }
-    }
+    UBlueprint* Blueprint = FAssetDiscoveryService::Get().LoadBlueprint(BlueprintPath);
 
     if (!Blueprint)
     {
@@ -72,17 +70,32 @@ FString FExportBlueprintGraphCommand::Execute(const FString& Parameters)
     bool bIncludeDefaults = false;
     JsonObject->TryGetBoolField(TEXT("include_defaults"), bIncludeDefaults);
 
-    // Build export JSON
-    TSharedPtr<FJsonObject> ExportJson = MakeShared<FJsonObject>();
-    ExportJson->SetStringField(TEXT("blueprint_name"), Blueprint->GetName());
-    ExportJson->SetStringField(TEXT("blueprint_path"), Blueprint->GetPathName());
+    bool bInternStrings = false;
+    JsonObject->TryGetBoolField(TEXT("intern_strings"), bInternStrings);
 
-    if (Blueprint->ParentClass)
+    bool bDedupeConnections = false;
+    JsonObject->TryGetBoolField(TEXT("dedupe_connections"), bDedupeConnections);
+
+    bool bChunked = false;
+    JsonObject->TryGetBoolField(TEXT("chunked"), bChunked);
+
+    FString Layout = TEXT("aos");
+    JsonObject->TryGetStringField(TEXT("layout"), Layout);
+
+    bool bInline = false;
+    JsonObject->TryGetBoolField(TEXT("inline"), bInline);
+
+    bool bStream = false;
+    JsonObject->TryGetBoolField(TEXT("stream"), bStream);
+
+    if (bStream && !bInline)
     {
-        ExportJson->SetStringField(TEXT("parent_class"), Blueprint->ParentClass->GetName());
-        ExportJson->SetStringField(TEXT("parent_class_path"), Blueprint->ParentClass->GetPathName());
+        return WriteStreamedExport(Blueprint, GraphName, bIncludeComponents, bIncludeDefaults, bDedupeConnections);
     }
 
+    // Build export JSON
+    TSharedPtr<FJsonObject> ExportJson = SerializeBlueprintHeader(Blueprint, bIncludeComponents);
+
     // Get all graphs
     TArray<UEdGraph*> AllGraphs;
     Blueprint->GetAllGraphs(AllGraphs);
@@ -101,7 +114,7 @@ FString FExportBlueprintGraphCommand::Execute(const FString& Parameters)
                 continue;
             }
 
-            TSharedPtr<FJsonObject> GraphJson = SerializeGraph(Graph, bIncludeDefaults);
+            TSharedPtr<FJsonObject> GraphJson = SerializeGraph(Graph, bIncludeDefaults, bDedupeConnections);
             if (GraphJson.IsValid())
             {
                 GraphsArray.Add(MakeShared<FJsonValueObject>(GraphJson));
@@ -112,6 +125,86 @@ FString FExportBlueprintGraphCommand::Execute(const FString& Parameters)
     }
     ExportJson->SetArrayField(TEXT("graphs"), GraphsArray);
 
+    if (bDedupeConnections)
+    {
+        ExportJson->SetBoolField(TEXT("output_connections_only"), true);
+    }
+
+    if (bInternStrings)
+    {
+        TMap<FString, int32> StringIndices;
+        TArray<TSharedPtr<FJsonValue>> StringTable;
+        InternStringFields(ExportJson, StringIndices, StringTable);
+
+        TArray<TSharedPtr<FJsonValue>> InternedFieldsArray;
+        for (const TCHAR* FieldName : InternedExportFields)
+        {
+            InternedFieldsArray.Add(MakeShared<FJsonValueString>(FieldName));
+        }
+
+        ExportJson->SetArrayField(TEXT("strings"), StringTable);
+        ExportJson->SetArrayField(TEXT("interned_fields"), InternedFieldsArray);
+    }
+
+    // Columns are built last so interning and deduplication see the node objects
+    if (Layout == TEXT("soa"))
+    {
+        for (const TSharedPtr<FJsonValue>& GraphValue : GraphsArray)
+        {
+            ConvertNodesToColumns(GraphValue->AsObject());
+        }
+        ExportJson->SetStringField(TEXT("node_layout"), TEXT("soa"));
+    }
+
+    if (bInline)
+    {
+        TSharedPtr<FJsonObject> ResponseObj = MakeShared<FJsonObject>();
+        ResponseObj->SetBoolField(TEXT("success"), true);
+        ResponseObj->SetNumberField(TEXT("graph_count"), GraphCount);
+        ResponseObj->SetNumberField(TEXT("node_count"), TotalNodeCount);
+        ResponseObj->SetObjectField(TEXT("export"), ExportJson);
+
+        FString OutputString;
+        TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&OutputString);
+        FJsonSerializer::Serialize(ResponseObj.ToSharedRef(), Writer);
+        return OutputString;
+    }
+
+    // Write to file
+    FString FileName = GenerateExportFileName(Blueprint->GetName());
+    FString FilePath;
+    if (bChunked)
+    {
+        // Graphs are written as separate documents after the header
+        ExportJson->RemoveField(TEXT("graphs"));
+        ExportJson->SetNumberField(TEXT("graph_count"), GraphCount);
+        FilePath = WriteChunkedJsonToTempFile(FPaths::ChangeExtension(FileName, TEXT("jsonchunks")), ExportJson, GraphsArray);
+    }
+    else
+    {
+        FilePath = WriteJsonToTempFile(FileName, ExportJson);
+    }
+
+    if (FilePath.IsEmpty())
+    {
+        return CreateErrorResponse(TEXT("Failed to write export file"));
+    }
+
+    return CreateSuccessResponse(FilePath, GraphCount, TotalNodeCount);
+}
+
+TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeBlueprintHeader(UBlueprint* Blueprint, bool bIncludeComponents)
+{
+    TSharedPtr<FJsonObject> ExportJson = MakeShared<FJsonObject>();
+    ExportJson->SetStringField(TEXT("blueprint_name"), Blueprint->GetName());
+    ExportJson->SetStringField(TEXT("blueprint_path"), Blueprint->GetPathName());
+
+    if (Blueprint->ParentClass)
+    {
+        ExportJson->SetStringField(TEXT("parent_class"), Blueprint->ParentClass->GetName());
+        ExportJson->SetStringField(TEXT("parent_class_path"), Blueprint->ParentClass->GetPathName());
+    }
+
     // Include components if requested
     if (bIncludeComponents && Blueprint->SimpleConstructionScript)
     {
@@ -155,16 +248,107 @@ FString FExportBlueprintGraphCommand::Execute(const FString& Parameters)
     }
     ExportJson->SetArrayField(TEXT("variables"), VariablesArray);
 
-    // Write to file
-    FString FileName = GenerateExportFileName(Blueprint->GetName());
-    FString FilePath = WriteJsonToTempFile(FileName, ExportJson);
+    return ExportJson;
+}
 
-    if (FilePath.IsEmpty())
+FString FExportBlueprintGraphCommand::WriteStreamedExport(UBlueprint* Blueprint, const FString& GraphName, bool bIncludeComponents, bool bIncludeDefaults, bool bDedupeConnections)
+{
+    const FString FilePath = FPaths::Combine(GetExportDirectory(),
+        FPaths::ChangeExtension(GenerateExportFileName(Blueprint->GetName()), TEXT("ndjson")));
+
+    TUniquePtr<FArchive> Writer(IFileManager::Get().CreateFileWriter(*FilePath));
+    if (!Writer)
     {
+        UE_LOG(LogMigrationExport, Error, TEXT("Failed to open streamed export file: %s"), *FilePath);
         return CreateErrorResponse(TEXT("Failed to write export file"));
     }
 
-    return CreateSuccessResponse(FilePath, GraphCount, TotalNodeCount);
+    // One condensed JSON object per line, written as soon as it is built, so
+    // only a single record is ever held in memory
+    auto WriteRecord = [&Writer](const TCHAR* RecordType, const TSharedPtr<FJsonObject>& Record)
+    {
+        Record->SetStringField(TEXT("record"), RecordType);
+
+        FString JsonString;
+        TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> JsonWriter = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&JsonString);
+        FJsonSerializer::Serialize(Record.ToSharedRef(), JsonWriter);
+        JsonString.AppendChar(TEXT('\n'));
+
+        FTCHARToUTF8 Utf8Json(*JsonString);
+        Writer->Serialize(const_cast<ANSICHAR*>(Utf8Json.Get()), Utf8Json.Length());
+    };
+
+    TSharedPtr<FJsonObject> HeaderJson = SerializeBlueprintHeader(Blueprint, bIncludeComponents);
+    if (bDedupeConnections)
+    {
+        HeaderJson->SetBoolField(TEXT("output_connections_only"), true);
+    }
+    WriteRecord(TEXT("blueprint"), HeaderJson);
+
+    TArray<UEdGraph*> AllGraphs;
+    Blueprint->GetAllGraphs(AllGraphs);
+
+    int32 GraphCount = 0;
+    int32 NodeCount = 0;
+    int32 EdgeCount = 0;
+
+    for (UEdGraph* Graph : AllGraphs)
+    {
+        if (!Graph || (!GraphName.IsEmpty() && !Graph->GetName().Contains(GraphName)))
+        {
+            continue;
+        }
+
+        // Node records follow the graph record they belong to
+        TSharedPtr<FJsonObject> GraphJson = MakeShared<FJsonObject>();
+        GraphJson->SetStringField(TEXT("name"), Graph->GetName());
+        GraphJson->SetStringField(TEXT("class"), Graph->GetClass()->GetName());
+        GraphJson->SetNumberField(TEXT("node_count"), Graph->Nodes.Num());
+        WriteRecord(TEXT("graph"), GraphJson);
+        GraphCount++;
+
+        for (UEdGraphNode* Node : Graph->Nodes)
+        {
+            TSharedPtr<FJsonObject> NodeJson = SerializeNode(Node, bDedupeConnections);
+            if (!NodeJson.IsValid())
+            {
+                continue;
+            }
+            WriteRecord(TEXT("node"), NodeJson);
+            NodeCount++;
+
+            for (UEdGraphPin* Pin : Node->Pins)
+            {
+                if (Pin && Pin->Direction == EGPD_Output)
+                {
+                    EdgeCount += Pin->LinkedTo.Num();
+                }
+            }
+        }
+    }
+
+    const int64 BytesWritten = Writer->Tell();
+    if (!Writer->Close())
+    {
+        UE_LOG(LogMigrationExport, Error, TEXT("Failed to write streamed export file: %s"), *FilePath);
+        return CreateErrorResponse(TEXT("Failed to write export file"));
+    }
+
+    UE_LOG(LogMigrationExport, Log, TEXT("Wrote streamed export file: %s"), *FilePath);
+
+    TSharedPtr<FJsonObject> ResponseObj = MakeShared<FJsonObject>();
+    ResponseObj->SetBoolField(TEXT("success"), true);
+    ResponseObj->SetStringField(TEXT("file_path"), FilePath);
+    ResponseObj->SetNumberField(TEXT("graph_count"), GraphCount);
+    ResponseObj->SetNumberField(TEXT("node_count"), NodeCount);
+    ResponseObj->SetNumberField(TEXT("edge_count"), EdgeCount);
+    ResponseObj->SetNumberField(TEXT("bytes"), static_cast<double>(BytesWritten));
+
+    FString OutputString;
+    TSharedRef<TJsonWriter<>> ResponseWriter = TJsonWriterFactory<>::Create(&OutputString);
+    FJsonSerializer::Serialize(ResponseObj.ToSharedRef(), ResponseWriter);
+
+    return OutputString;
 }
 
 bool FExportBlueprintGraphCommand::ValidateParams(const FString& Parameters) const
@@ -181,6 +365,104 @@ bool FExportBlueprintGraphCommand::ValidateParams(const FString& Parameters) con
     return JsonObject->TryGetStringField(TEXT("blueprint_path"), BlueprintPath) && !BlueprintPath.IsEmpty();
 }
 
+void FExportBlueprintGraphCommand::ConvertNodesToColumns(const TSharedPtr<FJsonObject>& GraphJson) const
+{
+    const TArray<TSharedPtr<FJsonValue>>* NodesArray = nullptr;
+    if (!GraphJson->TryGetArrayField(TEXT("nodes"), NodesArray))
+    {
+        return;
+    }
+
+    const int32 NodeCount = NodesArray->Num();
+    const TSharedPtr<FJsonValue> NullValue = MakeShared<FJsonValueNull>();
+
+    // Field name -> one value per node, in first-seen field order
+    TMap<FString, TArray<TSharedPtr<FJsonValue>>> Columns;
+    for (int32 NodeIndex = 0; NodeIndex < NodeCount; ++NodeIndex)
+    {
+        const TSharedPtr<FJsonObject> NodeJson = (*NodesArray)[NodeIndex]->AsObject();
+        if (!NodeJson.IsValid())
+        {
+            continue;
+        }
+
+        for (const TPair<FString, TSharedPtr<FJsonValue>>& Pair : NodeJson->Values)
+        {
+            TArray<TSharedPtr<FJsonValue>>& Column = Columns.FindOrAdd(Pair.Key);
+            while (Column.Num() < NodeIndex)
+            {
+                Column.Add(NullValue);
+            }
+            Column.Add(Pair.Value);
+        }
+    }
+
+    TSharedPtr<FJsonObject> ColumnsJson = MakeShared<FJsonObject>();
+    for (TPair<FString, TArray<TSharedPtr<FJsonValue>>>& Pair : Columns)
+    {
+        while (Pair.Value.Num() < NodeCount)
+        {
+            Pair.Value.Add(NullValue);
+        }
+        ColumnsJson->SetArrayField(Pair.Key, Pair.Value);
+    }
+
+    GraphJson->SetObjectField(TEXT("nodes"), ColumnsJson);
+}
+
+void FExportBlueprintGraphCommand::InternStringFields(const TSharedPtr<FJsonObject>& JsonObject, TMap<FString, int32>& StringIndices, TArray<TSharedPtr<FJsonValue>>& StringTable)
+{
+    for (TPair<FString, TSharedPtr<FJsonValue>>& Pair : JsonObject->Values)
+    {
+        if (!Pair.Value.IsValid())
+        {
+            continue;
+        }
+
+        switch (Pair.Value->Type)
+        {
+        case EJson::String:
+            for (const TCHAR* FieldName : InternedExportFields)
+            {
+                if (Pair.Key == FieldName)
+                {
+                    const FString Value = Pair.Value->AsString();
+                    int32 Index;
+                    if (const int32* ExistingIndex = StringIndices.Find(Value))
+                    {
+                        Index = *ExistingIndex;
+                    }
+                    else
+                    {
+                        Index = StringTable.Add(MakeShared<FJsonValueString>(Value));
+                        StringIndices.Add(Value, Index);
+                    }
+                    Pair.Value = MakeShared<FJsonValueNumber>(Index);
+                    break;
+                }
+            }
+            break;
+
+        case EJson::Object:
+            InternStringFields(Pair.Value->AsObject(), StringIndices, StringTable);
+            break;
+
+        case EJson::Array:
+            for (const TSharedPtr<FJsonValue>& Element : Pair.Value->AsArray())
+            {
+                if (Element.IsValid() && Element->Type == EJson::Object)
+                {
+                    InternStringFields(Element->AsObject(), StringIndices, StringTable);
+                }
+            }
+            break;
+
+        default:
+            break;
+        }
+    }
+}
+
 FString FExportBlueprintGraphCommand::GetExportDirectory()
 {
     FString ExportDir = FPaths::Combine(FPaths::ProjectSavedDir(), TEXT("UnrealMCP"), TEXT("Exports"));
@@ -208,11 +490,15 @@ FString FExportBlueprintGraphCommand::WriteJsonToTempFile(const FString& FileNam
     FString ExportDir = GetExportDirectory();
     FString FilePath = FPaths::Combine(ExportDir, FileName);
 
+    // Condensed output: the export is read by tools, not people, and the pretty
+    // printer's indentation makes up a large share of deeply nested graph files
     FString JsonString;
-    TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&JsonString);
+    TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&JsonString);
     FJsonSerializer::Serialize(JsonContent.ToSharedRef(), Writer);
 
-    if (FFileHelper::SaveStringToFile(JsonString, *FilePath))
+    // Always UTF-8: auto-detect falls back to UTF-16 as soon as a name contains a
+    // non-ANSI character, doubling the file size and breaking UTF-8 readers
+    if (FFileHelper::SaveStringToFile(JsonString, *FilePath, FFileHelper::EEncodingOptions::ForceUTF8WithoutBOM))
     {
         UE_LOG(LogMigrationExport, Log, TEXT("Wrote export file: %s"), *FilePath);
         return FilePath;
@@ -279,7 +565,7 @@ TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializePin(UEdGraphPin*
     return PinJson;
 }
 
-TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeNode(UEdGraphNode* Node)
+TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeNode(UEdGraphNode* Node, bool bDedupeConnections)
 {
     if (!Node)
     {
@@ -371,7 +657,9 @@ TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeNode(UEdGraphNode
     {
         if (Pin)
         {
-            TSharedPtr<FJsonObject> PinJson = SerializePin(Pin, true);
+            // Every link joins an output pin to an input pin, so listing it on the
+            // output side alone loses nothing
+            TSharedPtr<FJsonObject> PinJson = SerializePin(Pin, !bDedupeConnections || Pin->Direction == EGPD_Output);
             if (PinJson.IsValid())
             {
                 if (Pin->Direction == EGPD_Input)
@@ -392,7 +680,7 @@ TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeNode(UEdGraphNode
     return NodeJson;
 }
 
-TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeGraph(UEdGraph* Graph, bool bIncludeDefaults)
+TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeGraph(UEdGraph* Graph, bool bIncludeDefaults, bool bDedupeConnections)
 {
     if (!Graph)
     {
@@ -411,7 +699,7 @@ TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeGraph(UEdGraph* G
     {
         if (Node)
         {
-            TSharedPtr<FJsonObject> NodeJson = SerializeNode(Node);
+            TSharedPtr<FJsonObject> NodeJson = SerializeNode(Node, bDedupeConnections);
             if (NodeJson.IsValid())
             {
                 NodesArray.Add(MakeShared<FJsonValueObject>(NodeJson));
@@ -423,6 +711,45 @@ TSharedPtr<FJsonObject> FExportBlueprintGraphCommand::SerializeGraph(UEdGraph* G
     return GraphJson;
 }
 
+FString FExportBlueprintGraphCommand::WriteChunkedJsonToTempFile(const FString& FileName, const TSharedPtr<FJsonObject>& HeaderContent, const TArray<TSharedPtr<FJsonValue>>& Graphs)
+{
+    FString ExportDir = GetExportDirectory();
+    FString FilePath = FPaths::Combine(ExportDir, FileName);
+
+    TArray<uint8> Buffer;
+    auto AppendDocument = [&Buffer](const TSharedPtr<FJsonObject>& Document)
+    {
+        FString JsonString;
+        TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&JsonString);
+        FJsonSerializer::Serialize(Document.ToSharedRef(), Writer);
+
+        FTCHARToUTF8 Utf8Json(*JsonString);
+        const uint32 Length = static_cast<uint32>(Utf8Json.Length());
+
+        // Little-endian length prefix, independent of the host byte order
+        Buffer.Add(static_cast<uint8>(Length));
+        Buffer.Add(static_cast<uint8>(Length >> 8));
+        Buffer.Add(static_cast<uint8>(Length >> 16));
+        Buffer.Add(static_cast<uint8>(Length >> 24));
+        Buffer.Append(reinterpret_cast<const uint8*>(Utf8Json.Get()), Utf8Json.Length());
+    };
+
+    AppendDocument(HeaderContent);
+    for (const TSharedPtr<FJsonValue>& Graph : Graphs)
+    {
+        AppendDocument(Graph->AsObject());
+    }
+
+    if (FFileHelper::SaveArrayToFile(Buffer, *FilePath))
+    {
+        UE_LOG(LogMigrationExport, Log, TEXT("Wrote chunked export file: %s"), *FilePath);
+        return FilePath;
+    }
+
+    UE_LOG(LogMigrationExport, Error, TEXT("Failed to write chunked export file: %s"), *FilePath);
+    return FString();
+}
+
 FString FExportBlueprintGraphCommand::CreateSuccessResponse(const FString& FilePath, int32 GraphCount, int32 NodeCount) const
 {
     TSharedPtr<FJsonObject> ResponseObj = MakeShared<FJsonObject>();
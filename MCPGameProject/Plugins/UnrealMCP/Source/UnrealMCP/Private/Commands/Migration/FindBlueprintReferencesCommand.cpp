@@ -41,15 +41,7 @@ FString FFindBlueprintReferencesCommand::Execute(const FString& Parameters)
     IAssetRegistry& AssetRegistry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>("AssetRegistry").Get();
 
     // Try to load the target Blueprint
-    UBlueprint* TargetBlueprint = LoadObject<UBlueprint>(nullptr, *TargetPath);
-    if (!TargetBlueprint)
-    {
-        TArray<FString> FoundBlueprints = FAssetDiscoveryService::Get().FindBlueprints(TargetPath);
-        if (FoundBlueprints.Num() > 0)
-        {
-            TargetBlueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
-        }
-    }
+    UBlueprint* TargetBlueprint = FAssetDiscoveryService::Get().LoadBlueprint(TargetPath);
 
     // Get referencers
     TArray<FAssetIdentifier> Referencers;
@@ -65,7 +57,12 @@ FString FFindBlueprintReferencesCommand::Execute(const FString& Parameters)
         TargetId = FAssetIdentifier(FName(*TargetPath));
     }
 
-    AssetRegistry.GetReferencers(TargetId, Referencers);
+    // The asset registry keeps its reverse-dependency index current as assets change,
+    // so referencers are looked up and classified from registry data alone
+    const UE::AssetRegistry::FDependencyQuery ReferenceQuery = bIncludeSoftReferences
+        ? UE::AssetRegistry::FDependencyQuery()
+        : UE::AssetRegistry::FDependencyQuery(UE::AssetRegistry::EDependencyQuery::Hard);
+    AssetRegistry.GetReferencers(TargetId, Referencers, UE::AssetRegistry::EDependencyCategory::Package, ReferenceQuery);
 
     // Build detailed reference list
     TArray<TSharedPtr<FJsonValue>> ReferencersArray;
@@ -83,15 +80,21 @@ FString FFindBlueprintReferencesCommand::Execute(const FString& Parameters)
         TSharedPtr<FJsonObject> RefJson = MakeShared<FJsonObject>();
         RefJson->SetStringField(TEXT("referencer_path"), RefPath);
 
-        // Try to get more details about how it's referenced
-        UBlueprint* ReferencerBP = LoadObject<UBlueprint>(nullptr, *RefPath);
-        if (ReferencerBP)
+        TArray<FAssetData> RefAssets;
+        AssetRegistry.GetAssetsByPackageName(RefId.PackageName, RefAssets);
+        const FAssetData* BlueprintAsset = RefAssets.FindByPredicate([](const FAssetData& Asset)
+        {
+            return Asset.IsInstanceOf(UBlueprint::StaticClass());
+        });
+
+        if (BlueprintAsset)
         {
-            RefJson->SetStringField(TEXT("referencer_name"), ReferencerBP->GetName());
+            RefJson->SetStringField(TEXT("referencer_name"), BlueprintAsset->AssetName.ToString());
             RefJson->SetStringField(TEXT("type"), TEXT("Blueprint"));
 
-            // If looking for function references, scan the graphs
-            if (!TargetFunction.IsEmpty())
+            // Only loaded when its graphs have to be scanned for function references
+            UBlueprint* ReferencerBP = TargetFunction.IsEmpty() ? nullptr : Cast<UBlueprint>(BlueprintAsset->GetAsset());
+            if (ReferencerBP)
             {
                 TArray<TSharedPtr<FJsonValue>> LocationsArray;
 
@@ -29,15 +29,7 @@ FString FGetBlueprintDependenciesCommand::Execute(const FString& Parameters)
     }
 
     // Try to load Blueprint
-    UBlueprint* Blueprint = LoadObject<UBlueprint>(nullptr, *BlueprintPath);
-    if (!Blueprint)
-    {
-        TArray<FString> FoundBlueprints = FAssetDiscoveryService::Get().FindBlueprints(BlueprintPath);
-        if (FoundBlueprints.Num() > 0)
-        {
-            Blueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
-        }
-    }
+    UBlueprint* Blueprint = FAssetDiscoveryService::Get().LoadBlueprint(BlueprintPath);
 
     if (!Blueprint)
     {
@@ -50,6 +42,12 @@ FString FGetBlueprintDependenciesCommand::Execute(const FString& Parameters)
     bool bRecursive = true;
     JsonObject->TryGetBoolField(TEXT("recursive"), bRecursive);
 
+    FString SortMode = TEXT("topological");
+    JsonObject->TryGetStringField(TEXT("sort"), SortMode);
+
+    int32 OverflowThreshold = 256;
+    JsonObject->TryGetNumberField(TEXT("overflow_threshold"), OverflowThreshold);
+
     // Get asset registry
     IAssetRegistry& AssetRegistry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>("AssetRegistry").Get();
 
@@ -169,6 +167,57 @@ FString FGetBlueprintDependenciesCommand::Execute(const FString& Parameters)
     }
     ResultJson->SetArrayField(TEXT("function_calls"), FunctionsArray);
 
+    // Blueprint dependency order, so callers can visit each Blueprint once, after its dependencies
+    if (SortMode == TEXT("topological"))
+    {
+        TMap<FName, TArray<FName>> DependencyGraph;
+        TMap<FName, int32> Overflow;
+        CollectBlueprintDependencyGraph(AssetRegistry, Blueprint->GetPackage()->GetFName(), bRecursive, OverflowThreshold, DependencyGraph, Overflow);
+
+        TArray<FName> Order;
+        const bool bAcyclic = SortDependenciesTopologically(DependencyGraph, Order);
+
+        TArray<TSharedPtr<FJsonValue>> OrderArray;
+        for (const FName& Package : Order)
+        {
+            OrderArray.Add(MakeShared<FJsonValueString>(Package.ToString()));
+        }
+        ResultJson->SetArrayField(TEXT("order"), OrderArray);
+
+        TArray<TSharedPtr<FJsonValue>> EdgesArray;
+        for (const TPair<FName, TArray<FName>>& Pair : DependencyGraph)
+        {
+            for (const FName& Dependency : Pair.Value)
+            {
+                if (Overflow.Contains(Dependency))
+                {
+                    continue;
+                }
+
+                TArray<TSharedPtr<FJsonValue>> EdgeArray;
+                EdgeArray.Add(MakeShared<FJsonValueString>(Pair.Key.ToString()));
+                EdgeArray.Add(MakeShared<FJsonValueString>(Dependency.ToString()));
+                EdgesArray.Add(MakeShared<FJsonValueArray>(EdgeArray));
+            }
+        }
+        ResultJson->SetArrayField(TEXT("edges"), EdgesArray);
+
+        // Heavily shared Blueprints stand for "everything"; only their dependent count is kept
+        TArray<TSharedPtr<FJsonValue>> OverflowArray;
+        for (const TPair<FName, int32>& Pair : Overflow)
+        {
+            TSharedPtr<FJsonObject> OverflowObj = MakeShared<FJsonObject>();
+            OverflowObj->SetStringField(TEXT("path"), Pair.Key.ToString());
+            TArray<TSharedPtr<FJsonValue>> DependentsArray;
+            DependentsArray.Add(MakeShared<FJsonValueString>(TEXT("<overflow>")));
+            OverflowObj->SetArrayField(TEXT("dependents"), DependentsArray);
+            OverflowObj->SetNumberField(TEXT("dependent_count"), Pair.Value);
+            OverflowArray.Add(MakeShared<FJsonValueObject>(OverflowObj));
+        }
+        ResultJson->SetArrayField(TEXT("overflow"), OverflowArray);
+        ResultJson->SetBoolField(TEXT("has_cycles"), !bAcyclic);
+    }
+
     FString OutputString;
     TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
     FJsonSerializer::Serialize(ResultJson.ToSharedRef(), Writer);
@@ -176,6 +225,131 @@ FString FGetBlueprintDependenciesCommand::Execute(const FString& Parameters)
     return OutputString;
 }
 
+void FGetBlueprintDependenciesCommand::CollectBlueprintDependencyGraph(IAssetRegistry& AssetRegistry, FName RootPackage, bool bRecursive, int32 OverflowThreshold,
+    TMap<FName, TArray<FName>>& OutGraph, TMap<FName, int32>& OutOverflow) const
+{
+    TMap<FName, int32> DependentCounts;
+
+    // Breadth-first, so shared Blueprints reach the threshold before their own dependencies are walked
+    TArray<FName> Pending;
+    Pending.Add(RootPackage);
+
+    for (int32 Index = 0; Index < Pending.Num(); ++Index)
+    {
+        const FName Package = Pending[Index];
+        if (OutGraph.Contains(Package))
+        {
+            continue;
+        }
+
+        // Overflowed Blueprints, and without recursion the root's dependencies, are kept as
+        // leaves instead of being expanded, so every edge points at a package in the graph
+        if (OutOverflow.Contains(Package) || (!bRecursive && Package != RootPackage))
+        {
+            OutGraph.Add(Package);
+            continue;
+        }
+
+        TArray<FName>& BlueprintDependencies = OutGraph.Add(Package);
+
+        TArray<FName> Dependencies;
+        AssetRegistry.GetDependencies(Package, Dependencies);
+
+        for (const FName& Dependency : Dependencies)
+        {
+            FString DependencyPath = Dependency.ToString();
+            if (DependencyPath.StartsWith(TEXT("/Script/")) || DependencyPath.StartsWith(TEXT("/Engine/")) || Dependency == Package)
+            {
+                continue;
+            }
+
+            TArray<FAssetData> Assets;
+            AssetRegistry.GetAssetsByPackageName(Dependency, Assets);
+
+            bool bIsBlueprint = false;
+            for (const FAssetData& Asset : Assets)
+            {
+                if (Asset.AssetClassPath.GetAssetName() == TEXT("Blueprint"))
+                {
+                    bIsBlueprint = true;
+                    break;
+                }
+            }
+
+            if (bIsBlueprint && !BlueprintDependencies.Contains(Dependency))
+            {
+                BlueprintDependencies.Add(Dependency);
+
+                int32& DependentCount = DependentCounts.FindOrAdd(Dependency);
+                ++DependentCount;
+                if (OverflowThreshold > 0 && DependentCount > OverflowThreshold)
+                {
+                    OutOverflow.Add(Dependency, DependentCount);
+                }
+                Pending.Add(Dependency);
+            }
+        }
+    }
+}
+
+bool FGetBlueprintDependenciesCommand::SortDependenciesTopologically(const TMap<FName, TArray<FName>>& Graph, TArray<FName>& OutOrder) const
+{
+    // Number of unresolved dependencies per package, and who depends on each package
+    TMap<FName, int32> RemainingDependencies;
+    TMap<FName, TArray<FName>> Dependents;
+    for (const TPair<FName, TArray<FName>>& Pair : Graph)
+    {
+        RemainingDependencies.Add(Pair.Key, Pair.Value.Num());
+        for (const FName& Dependency : Pair.Value)
+        {
+            Dependents.FindOrAdd(Dependency).Add(Pair.Key);
+        }
+    }
+
+    TArray<FName> Ready;
+    for (const TPair<FName, int32>& Pair : RemainingDependencies)
+    {
+        if (Pair.Value == 0)
+        {
+            Ready.Add(Pair.Key);
+        }
+    }
+
+    OutOrder.Reset(Graph.Num());
+    for (int32 Index = 0; Index < Ready.Num(); ++Index)
+    {
+        const FName Package = Ready[Index];
+        OutOrder.Add(Package);
+
+        if (const TArray<FName>* PackageDependents = Dependents.Find(Package))
+        {
+            for (const FName& Dependent : *PackageDependents)
+            {
+                int32& Remaining = RemainingDependencies[Dependent];
+                if (--Remaining == 0)
+                {
+                    Ready.Add(Dependent);
+                }
+            }
+        }
+    }
+
+    if (OutOrder.Num() == Graph.Num())
+    {
+        return true;
+    }
+
+    // Packages in (or behind) a cycle never reach zero; keep them, in discovery order
+    for (const TPair<FName, TArray<FName>>& Pair : Graph)
+    {
+        if (RemainingDependencies[Pair.Key] > 0)
+        {
+            OutOrder.Add(Pair.Key);
+        }
+    }
+    return false;
+}
+
 bool FGetBlueprintDependenciesCommand::ValidateParams(const FString& Parameters) const
 {
     TSharedPtr<FJsonObject> JsonObject;
@@ -31,15 +31,7 @@ FString FGetBlueprintFunctionsCommand::Execute(const FString& Parameters)
     JsonObject->TryGetBoolField(TEXT("include_inherited"), bIncludeInherited);
 
     // Load Blueprint
-    UBlueprint* Blueprint = LoadObject<UBlueprint>(nullptr, *BlueprintPath);
-    if (!Blueprint)
-    {
-        TArray<FString> FoundBlueprints = FAssetDiscoveryService::Get().FindBlueprints(BlueprintPath);
-        if (FoundBlueprints.Num() > 0)
-        {
-            Blueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
-        }
-    }
+    UBlueprint* Blueprint = FAssetDiscoveryService::Get().LoadBlueprint(BlueprintPath);
 
     if (!Blueprint)
     {
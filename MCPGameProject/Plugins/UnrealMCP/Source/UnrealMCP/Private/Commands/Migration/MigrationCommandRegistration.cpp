@@ -7,6 +7,7 @@
 #include "Commands/Migration/DeleteBlueprintFunctionCommand.h"
 #include "Commands/Migration/SetBlueprintParentClassCommand.h"
 #include "Commands/Migration/GetBlueprintFunctionsCommand.h"
+#include "Commands/Migration/BatchMigrationCommandsCommand.h"
 
 // Static member definition
 TArray<FString> FMigrationCommandRegistration::RegisteredCommandNames;
@@ -26,6 +27,7 @@ void FMigrationCommandRegistration::RegisterAllMigrationCommands()
     RegisterDeleteBlueprintFunctionCommand();
     RegisterSetBlueprintParentClassCommand();
     RegisterGetBlueprintFunctionsCommand();
+    RegisterBatchMigrationCommandsCommand();
 
     UE_LOG(LogTemp, Log, TEXT("FMigrationCommandRegistration::RegisterAllMigrationCommands: Registered %d Migration commands"),
         RegisteredCommandNames.Num());
@@ -94,6 +96,12 @@ void FMigrationCommandRegistration::RegisterGetBlueprintFunctionsCommand()
     RegisterAndTrackCommand(Command);
 }
 
+void FMigrationCommandRegistration::RegisterBatchMigrationCommandsCommand()
+{
+    TSharedPtr<FBatchMigrationCommandsCommand> Command = MakeShared<FBatchMigrationCommandsCommand>();
+    RegisterAndTrackCommand(Command);
+}
+
 void FMigrationCommandRegistration::RegisterAndTrackCommand(TSharedPtr<IUnrealMCPCommand> Command)
 {
     if (!Command.IsValid())
@@ -55,15 +55,7 @@ FString FRedirectFunctionCallCommand::Execute(const FString& Parameters)
     JsonObject->TryGetBoolField(TEXT("backup"), bBackup);
 
     // Load source Blueprint
-    UBlueprint* SourceBlueprint = LoadObject<UBlueprint>(nullptr, *SourceBlueprintPath);
-    if (!SourceBlueprint)
-    {
-        TArray<FString> FoundBlueprints = FAssetDiscoveryService::Get().FindBlueprints(SourceBlueprintPath);
-        if (FoundBlueprints.Num() > 0)
-        {
-            SourceBlueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
-        }
-    }
+    UBlueprint* SourceBlueprint = FAssetDiscoveryService::Get().LoadBlueprint(SourceBlueprintPath);
 
     if (!SourceBlueprint)
     {
@@ -37,15 +37,7 @@ FString FSetBlueprintParentClassCommand::Execute(const FString& Parameters)
     JsonObject->TryGetBoolField(TEXT("backup"), bBackup);
 
     // Load Blueprint
-    UBlueprint* Blueprint = LoadObject<UBlueprint>(nullptr, *BlueprintPath);
-    if (!Blueprint)
-    {
-        TArray<FString> FoundBlueprints = FAssetDiscoveryService::Get().FindBlueprints(BlueprintPath);
-        if (FoundBlueprints.Num() > 0)
-        {
-            Blueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
-        }
-    }
+    UBlueprint* Blueprint = FAssetDiscoveryService::Get().LoadBlueprint(BlueprintPath);
 
     if (!Blueprint)
     {
@@ -84,6 +76,24 @@ FString FSetBlueprintParentClassCommand::Execute(const FString& Parameters)
         return CreateErrorResponse(FString::Printf(TEXT("Parent class not found: %s"), *NewParentClassName));
     }
 
+    // Already reparented: nothing to back up, refresh or recompile
+    if (NewParentClass == Blueprint->ParentClass)
+    {
+        TSharedPtr<FJsonObject> ResultJson = MakeShared<FJsonObject>();
+        ResultJson->SetBoolField(TEXT("success"), true);
+        ResultJson->SetStringField(TEXT("blueprint_path"), Blueprint->GetPathName());
+        ResultJson->SetStringField(TEXT("old_parent_class"), OldParentClassName);
+        ResultJson->SetStringField(TEXT("new_parent_class"), NewParentClass->GetName());
+        ResultJson->SetStringField(TEXT("new_parent_class_path"), NewParentClass->GetPathName());
+        ResultJson->SetBoolField(TEXT("requires_compile"), false);
+        ResultJson->SetStringField(TEXT("message"), FString::Printf(TEXT("Blueprint already has parent class '%s'"), *OldParentClassName));
+
+        FString OutputString;
+        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&OutputString);
+        FJsonSerializer::Serialize(ResultJson.ToSharedRef(), Writer);
+        return OutputString;
+    }
+
     // Verify the new parent is compatible
     if (Blueprint->ParentClass && !NewParentClass->IsChildOf(Blueprint->ParentClass->GetSuperClass()))
     {
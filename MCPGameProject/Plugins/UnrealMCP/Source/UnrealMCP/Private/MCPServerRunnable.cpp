@@ -10,10 +10,16 @@
 #include "JsonObjectConverter.h"
 #include "Misc/ScopeLock.h"
 #include "HAL/PlatformTime.h"
+#include "Misc/Compression.h"
 
 // Buffer size for receiving data - renamed to avoid UE 5.7 template conflicts
 const int32 MCPBufferSize = 8192;
 
+// Responses at least this large are gzip-compressed for clients that accept it. Graph exports,
+// metadata and dependency lists are mostly repeated keys and class paths, so even a few KB
+// shrink several times over and the client parses less
+const int32 MCPCompressionThreshold = 4 * 1024;
+
 FMCPServerRunnable::FMCPServerRunnable(UUnrealMCPBridge* InBridge, TSharedPtr<FSocket> InListenerSocket)
     : Bridge(InBridge)
     , ListenerSocket(InListenerSocket)
@@ -112,10 +118,15 @@ uint32 FMCPServerRunnable::Run()
                 bool bNonBlockingResult = ClientSocket->SetNonBlocking(true);
                 UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: SetNonBlocking(true) result: %s"), bNonBlockingResult ? TEXT("Success") : TEXT("Failed"));
                 
-                uint8 Buffer[8192];
+                // Requests are newline-terminated; a single request without a newline is also accepted.
+                // Clients that send "keep_alive": true keep the connection open for further requests,
+                // which may be pipelined, and get their responses in request order.
+                uint8 Buffer[MCPBufferSize];
+                TArray<uint8> ReceiveBuffer;
                 int32 ConnectionAttempts = 0;
                 double ConnectionStartTime = FPlatformTime::Seconds();
                 constexpr double ReceiveTimeoutSeconds = 30.0; // Max time to wait for data
+                bool bKeepAlive = false;
                 
                 while (bRunning)
                 {
@@ -129,30 +140,99 @@ uint32 FMCPServerRunnable::Run()
                     }
                     
                     ConnectionAttempts++;
-                    int32 BytesRead = 0;
-                    
-                    // Check for pending data before attempting to receive (non-blocking check)
-                    uint32 PendingDataSize = 0;
-                    bool bHasPendingData = ClientSocket->HasPendingData(PendingDataSize);
-                    
-                    // If no pending data, sleep briefly and continue to avoid tight loop
-                    if (!bHasPendingData || PendingDataSize == 0)
-                    {
-                        FPlatformProcess::Sleep(0.01f); // 10ms sleep
-                        continue;
-                    }
-                    
-                    // Log only when we have data to reduce spam
-                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Attempt %d - HasPendingData: Yes, PendingSize: %d"), 
-                           ConnectionAttempts, PendingDataSize);
-                    
-                    bool bRecvResult = ClientSocket->Recv(Buffer, sizeof(Buffer), BytesRead);
                     
-                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Recv result - Success: %s, BytesRead: %d"), 
-                           bRecvResult ? TEXT("Yes") : TEXT("No"), BytesRead);
-                    
-                    if (bRecvResult)
+                    // A pipelined request may already be buffered; only read when no complete one is
+                    if (!ReceiveBuffer.Contains('\n'))
                     {
+                        int32 BytesRead = 0;
+                        
+                        // Check for pending data before attempting to receive (non-blocking check)
+                        uint32 PendingDataSize = 0;
+                        bool bHasPendingData = ClientSocket->HasPendingData(PendingDataSize);
+                        
+                        // If no pending data, sleep briefly and continue to avoid tight loop
+                        if (!bHasPendingData || PendingDataSize == 0)
+                        {
+                            // An idle kept-alive connection makes way for other clients; it reconnects when needed
+                            bool bConnectionPending = false;
+                            if (bKeepAlive && ReceiveBuffer.Num() == 0
+                                && ListenerSocket->HasPendingConnection(bConnectionPending) && bConnectionPending)
+                            {
+                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Closing idle kept-alive connection for a pending client"));
+                                ClientSocket->Close();
+                                break;
+                            }
+                            
+                            FPlatformProcess::Sleep(0.01f); // 10ms sleep
+                            continue;
+                        }
+                        
+                        // Log only when we have data to reduce spam
+                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Attempt %d - HasPendingData: Yes, PendingSize: %d"), 
+                               ConnectionAttempts, PendingDataSize);
+                        
+                        bool bRecvResult = ClientSocket->Recv(Buffer, sizeof(Buffer), BytesRead);
+                        
+                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Recv result - Success: %s, BytesRead: %d"), 
+                               bRecvResult ? TEXT("Yes") : TEXT("No"), BytesRead);
+                        
+                        if (!bRecvResult)
+                        {
+                            int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+                            ESocketConnectionState CurrentState = ClientSocket->GetConnectionState();
+                            
+                            // Log detailed error information
+                            FString ErrorDescription;
+                            bool bShouldBreak = true;
+                            
+                            // Check for "would block" error which isn't a real error for non-blocking sockets
+                            if (LastError == SE_EWOULDBLOCK) 
+                            {
+                                ErrorDescription = TEXT("Socket would block (normal for non-blocking)");
+                                UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: %s, continuing..."), *ErrorDescription);
+                                bShouldBreak = false;
+                                // Small sleep to prevent tight loop when no data
+                                FPlatformProcess::Sleep(0.01f);
+                            }
+                            // Check for other transient errors we might want to tolerate
+                            else if (LastError == SE_EINTR) // Interrupted system call
+                            {
+                                ErrorDescription = TEXT("Socket read interrupted");
+                                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: %s, continuing..."), *ErrorDescription);
+                                bShouldBreak = false;
+                            }
+                            else 
+                            {
+                                // Map common error codes to descriptions
+                                switch (LastError)
+                                {
+                                    case 0: // No error - normal graceful disconnection
+                                        ErrorDescription = TEXT("Graceful disconnection (no error)");
+                                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected gracefully after %d attempts. Connection completed successfully."), 
+                                               ConnectionAttempts);
+                                        break;
+                                    case SE_ECONNRESET: ErrorDescription = TEXT("Connection reset by peer"); break;
+                                    case SE_ECONNABORTED: ErrorDescription = TEXT("Connection aborted"); break;
+                                    case SE_ENETDOWN: ErrorDescription = TEXT("Network is down"); break;
+                                    case SE_ENETUNREACH: ErrorDescription = TEXT("Network unreachable"); break;
+                                    case SE_ENOTCONN: ErrorDescription = TEXT("Socket not connected"); break;
+                                    case SE_ESHUTDOWN: ErrorDescription = TEXT("Socket shutdown"); break;
+                                    case SE_ETIMEDOUT: ErrorDescription = TEXT("Connection timed out"); break;
+                                    default: 
+                                        ErrorDescription = FString::Printf(TEXT("Unknown error code %d"), LastError);
+                                        UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error after %d attempts. Error: %s, ConnectionState: %d"), 
+                                               ConnectionAttempts, *ErrorDescription, (int32)CurrentState);
+                                        break;
+                                }
+                            }
+                            
+                            if (bShouldBreak)
+                            {
+                                break;
+                            }
+                            continue;
+                        }
+                        
                         if (BytesRead == 0)
                         {
                             double ConnectionDuration = FPlatformTime::Seconds() - ConnectionStartTime;
@@ -164,164 +244,155 @@ uint32 FMCPServerRunnable::Run()
                             UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Last socket error code: %d"), LastError);
                             break;
                         }
-
-                        // Convert received data to string
-                        Buffer[BytesRead] = '\0';
-                        FString ReceivedText = UTF8_TO_TCHAR(Buffer);
-                        
-                        // Log first 200 characters to avoid spam with large payloads
-                        FString LogText = ReceivedText.Len() > 200 ? ReceivedText.Left(200) + TEXT("...") : ReceivedText;
-                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received %d bytes: %s"), BytesRead, *LogText);
-
-                        // Parse JSON
-                        TSharedPtr<FJsonObject> JsonObject;
-                        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
                         
-                        double ParseStartTime = FPlatformTime::Seconds();
-                        bool bParseSuccess = FJsonSerializer::Deserialize(Reader, JsonObject);
-                        double ParseDuration = FPlatformTime::Seconds() - ParseStartTime;
+                        ReceiveBuffer.Append(Buffer, BytesRead);
+                    }
+                    
+                    // Take the next request: up to the newline, or the whole buffer for an unterminated one
+                    int32 NewlineIndex = INDEX_NONE;
+                    const bool bTerminated = ReceiveBuffer.Find('\n', NewlineIndex);
+                    const int32 MessageLength = bTerminated ? NewlineIndex : ReceiveBuffer.Num();
+                    
+                    // An unterminated request is only complete once it ends with the closing brace of
+                    // its object; don't probe-parse it after every chunk of a large request
+                    if (!bTerminated)
+                    {
+                        int32 LastIndex = MessageLength - 1;
+                        while (LastIndex >= 0 && FChar::IsWhitespace(ReceiveBuffer[LastIndex]))
+                        {
+                            --LastIndex;
+                        }
+                        if (LastIndex < 0 || ReceiveBuffer[LastIndex] != '}')
+                        {
+                            continue;
+                        }
+                    }
+                    
+                    TArray<uint8> MessageBytes(ReceiveBuffer.GetData(), MessageLength);
+                    MessageBytes.Add('\0');
+                    FString ReceivedText = UTF8_TO_TCHAR(reinterpret_cast<const ANSICHAR*>(MessageBytes.GetData()));
+                    
+                    // Log first 200 characters to avoid spam with large payloads
+                    FString LogText = ReceivedText.Len() > 200 ? ReceivedText.Left(200) + TEXT("...") : ReceivedText;
+                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received %d bytes: %s"), MessageLength, *LogText);
+                    
+                    // Parse JSON
+                    TSharedPtr<FJsonObject> JsonObject;
+                    TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
+                    
+                    double ParseStartTime = FPlatformTime::Seconds();
+                    bool bParseSuccess = FJsonSerializer::Deserialize(Reader, JsonObject);
+                    double ParseDuration = FPlatformTime::Seconds() - ParseStartTime;
+                    
+                    if (!bParseSuccess && !bTerminated)
+                    {
+                        // Part of an unterminated request; wait for the rest
+                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Incomplete request (%d bytes), waiting for more data"), MessageLength);
+                        continue;
+                    }
+                    
+                    ReceiveBuffer.RemoveAt(0, bTerminated ? MessageLength + 1 : MessageLength);
+                    
+                    if (bParseSuccess && JsonObject.IsValid())
+                    {
+                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: JSON parsed successfully in %.3f seconds"), ParseDuration);
                         
-                        if (bParseSuccess && JsonObject.IsValid())
+                        // Get command type
+                        FString CommandType;
+                        if (JsonObject->TryGetStringField(TEXT("type"), CommandType))
                         {
-                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: JSON parsed successfully in %.3f seconds"), ParseDuration);
+                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Executing command: %s"), *CommandType);
+                            
+                            // Execute command with timing
+                            double ExecuteStartTime = FPlatformTime::Seconds();
+                            FString Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
+                            double ExecuteDuration = FPlatformTime::Seconds() - ExecuteStartTime;
+                            
+                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Command executed in %.3f seconds"), ExecuteDuration);
+                            
+                            // Log response for debugging
+                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response: %s"), *Response);
+                            
+                            // Clients that send "framed": true get a length-prefixed response
+                            bool bFramed = false;
+                            JsonObject->TryGetBoolField(TEXT("framed"), bFramed);
+                            
+                            FString AcceptCompression;
+                            JsonObject->TryGetStringField(TEXT("accept_compression"), AcceptCompression);
+                            const bool bCompress = AcceptCompression == TEXT("gzip");
+                            
+                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response (%d characters, framed: %s)"), Response.Len(), bFramed ? TEXT("Yes") : TEXT("No"));
                             
-                            // Get command type
-                            FString CommandType;
-                            if (JsonObject->TryGetStringField(TEXT("type"), CommandType))
+                            int32 BytesSent = 0;
+                            double SendStartTime = FPlatformTime::Seconds();
+                            bool bSendSuccess = SendResponse(ClientSocket.Get(), Response, bFramed, bCompress, BytesSent);
+                            double SendDuration = FPlatformTime::Seconds() - SendStartTime;
+                            
+                            if (!bSendSuccess)
                             {
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Executing command: %s"), *CommandType);
-                                
-                                // Execute command with timing
-                                double ExecuteStartTime = FPlatformTime::Seconds();
-                                FString Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
-                                double ExecuteDuration = FPlatformTime::Seconds() - ExecuteStartTime;
-                                
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Command executed in %.3f seconds"), ExecuteDuration);
-                                
-                                // Log response for debugging
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response: %s"), *Response);
-                                
-                                // Convert to UTF-8 and get actual byte length
-                                FTCHARToUTF8 UTF8Response(*Response);
-                                int32 UTF8ByteLength = UTF8Response.Length();
-                                
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response (%d characters, %d UTF-8 bytes)"), Response.Len(), UTF8ByteLength);
-                                
-                                // Send response with correct byte length
-                                int32 BytesSent = 0;
-                                double SendStartTime = FPlatformTime::Seconds();
-                                bool bSendSuccess = ClientSocket->Send((const uint8*)UTF8Response.Get(), UTF8ByteLength, BytesSent);
-                                double SendDuration = FPlatformTime::Seconds() - SendStartTime;
-                                
-                                if (!bSendSuccess)
-                                {
-                                    int32 SendError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
-                                    UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Failed to send response. Error: %d, Duration: %.3f seconds"), SendError, SendDuration);
-                                }
-                                else {
-                                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully - %d bytes in %.3f seconds"), BytesSent, SendDuration);
-                                }
-
-                                // Graceful shutdown: signal we're done sending, then wait briefly for client to receive
-                                // This prevents RST being sent before data is ACKed on Windows
-                                ClientSocket->Shutdown(ESocketShutdownMode::Write);
-                                FPlatformProcess::Sleep(0.05f); // 50ms for client to read buffered data
-
-                                // Close connection after response - single request-response model
-                                ClientSocket->Close();
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Connection closed after response"));
-                                break;
+                                int32 SendError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+                                UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Failed to send response. Error: %d, Duration: %.3f seconds"), SendError, SendDuration);
+                            }
+                            else {
+                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully - %d bytes in %.3f seconds"), BytesSent, SendDuration);
                             }
-                            else
+                            
+                            // Only framed responses can share a connection, as the client cannot tell
+                            // where an unframed one ends
+                            bKeepAlive = false;
+                            JsonObject->TryGetBoolField(TEXT("keep_alive"), bKeepAlive);
+                            bKeepAlive = bKeepAlive && bFramed;
+                            if (bKeepAlive && bSendSuccess)
                             {
-                                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command JSON"));
-                                
-                                // Log available fields for debugging
-                                TArray<FString> FieldNames;
-                                JsonObject->Values.GetKeys(FieldNames);
-                                FString FieldList = FString::Join(FieldNames, TEXT(", "));
-                                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Available fields: %s"), *FieldList);
-                                
-                                // Close and break on protocol error - don't hang waiting for more data
-                                ClientSocket->Close();
-                                UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Connection closed due to missing 'type' field"));
-                                break;
+                                // The receive timeout now measures idle time before the next request
+                                ConnectionStartTime = FPlatformTime::Seconds();
+                                continue;
                             }
+                            
+                            // Graceful shutdown: signal we're done sending, then wait briefly for client to receive
+                            // This prevents RST being sent before data is ACKed on Windows
+                            ClientSocket->Shutdown(ESocketShutdownMode::Write);
+                            FPlatformProcess::Sleep(0.05f); // 50ms for client to read buffered data
+                            
+                            // Close connection after response - single request-response model
+                            ClientSocket->Close();
+                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Connection closed after response"));
+                            break;
                         }
                         else
                         {
-                            UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Failed to parse JSON in %.3f seconds. Raw data: %s"), ParseDuration, *ReceivedText);
+                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command JSON"));
                             
-                            // Try to identify the issue
-                            if (ReceivedText.IsEmpty())
-                            {
-                                UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Received empty string"));
-                            }
-                            else if (!ReceivedText.StartsWith(TEXT("{")))
-                            {
-                                UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Data doesn't start with '{' - not valid JSON"));
-                            }
+                            // Log available fields for debugging
+                            TArray<FString> FieldNames;
+                            JsonObject->Values.GetKeys(FieldNames);
+                            FString FieldList = FString::Join(FieldNames, TEXT(", "));
+                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Available fields: %s"), *FieldList);
                             
-                            // Close and break on parse failure - don't hang waiting for more data
+                            // Close and break on protocol error - don't hang waiting for more data
                             ClientSocket->Close();
-                            UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Connection closed due to JSON parse failure"));
+                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Connection closed due to missing 'type' field"));
                             break;
                         }
                     }
                     else
                     {
-                        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
-                        ESocketConnectionState CurrentState = ClientSocket->GetConnectionState();
-                        
-                        // Log detailed error information
-                        FString ErrorDescription;
-                        bool bShouldBreak = true;
+                        UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Failed to parse JSON in %.3f seconds. Raw data: %s"), ParseDuration, *ReceivedText);
                         
-                        // Check for "would block" error which isn't a real error for non-blocking sockets
-                        if (LastError == SE_EWOULDBLOCK) 
-                        {
-                            ErrorDescription = TEXT("Socket would block (normal for non-blocking)");
-                            UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: %s, continuing..."), *ErrorDescription);
-                            bShouldBreak = false;
-                            // Small sleep to prevent tight loop when no data
-                            FPlatformProcess::Sleep(0.01f);
-                        }
-                        // Check for other transient errors we might want to tolerate
-                        else if (LastError == SE_EINTR) // Interrupted system call
+                        // Try to identify the issue
+                        if (ReceivedText.IsEmpty())
                         {
-                            ErrorDescription = TEXT("Socket read interrupted");
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: %s, continuing..."), *ErrorDescription);
-                            bShouldBreak = false;
+                            UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Received empty string"));
                         }
-                        else 
+                        else if (!ReceivedText.StartsWith(TEXT("{")))
                         {
-                            // Map common error codes to descriptions
-                            switch (LastError)
-                            {
-                                case 0: // No error - normal graceful disconnection
-                                    ErrorDescription = TEXT("Graceful disconnection (no error)");
-                                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected gracefully after %d attempts. Connection completed successfully."), 
-                                           ConnectionAttempts);
-                                    break;
-                                case SE_ECONNRESET: ErrorDescription = TEXT("Connection reset by peer"); break;
-                                case SE_ECONNABORTED: ErrorDescription = TEXT("Connection aborted"); break;
-                                case SE_ENETDOWN: ErrorDescription = TEXT("Network is down"); break;
-                                case SE_ENETUNREACH: ErrorDescription = TEXT("Network unreachable"); break;
-                                case SE_ENOTCONN: ErrorDescription = TEXT("Socket not connected"); break;
-                                case SE_ESHUTDOWN: ErrorDescription = TEXT("Socket shutdown"); break;
-                                case SE_ETIMEDOUT: ErrorDescription = TEXT("Connection timed out"); break;
-                                default: 
-                                    ErrorDescription = FString::Printf(TEXT("Unknown error code %d"), LastError);
-                                    UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error after %d attempts. Error: %s, ConnectionState: %d"), 
-                                           ConnectionAttempts, *ErrorDescription, (int32)CurrentState);
-                                    break;
-                            }
+                            UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Data doesn't start with '{' - not valid JSON"));
                         }
                         
-                        if (bShouldBreak)
-                        {
-                            break;
-                        }
+                        // Close and break on parse failure - don't hang waiting for more data
+                        ClientSocket->Close();
+                        UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Connection closed due to JSON parse failure"));
+                        break;
                     }
                 }
             }
@@ -348,6 +419,64 @@ void FMCPServerRunnable::Exit()
 {
 }
 
+bool FMCPServerRunnable::SendResponse(FSocket* Socket, const FString& Response, bool bFramed, bool bCompress, int32& OutBytesSent)
+{
+    FTCHARToUTF8 UTF8Response(*Response);
+    const uint8* Body = reinterpret_cast<const uint8*>(UTF8Response.Get());
+    int32 BodyLength = UTF8Response.Length();
+
+    // Large responses are mostly repeated class paths and pin types and compress very well
+    TArray<uint8> CompressedBody;
+    if (bCompress && BodyLength >= MCPCompressionThreshold)
+    {
+        int32 CompressedLength = FCompression::CompressMemoryBound(NAME_Gzip, BodyLength);
+        CompressedBody.SetNumUninitialized(CompressedLength);
+        if (FCompression::CompressMemory(NAME_Gzip, CompressedBody.GetData(), CompressedLength, Body, BodyLength, COMPRESS_BiasSpeed)
+            && CompressedLength < BodyLength)
+        {
+            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Compressed response from %d to %d bytes"), BodyLength, CompressedLength);
+            Body = CompressedBody.GetData();
+            BodyLength = CompressedLength;
+        }
+    }
+
+    TArray<uint8> SendBuffer;
+    SendBuffer.Reserve(BodyLength + sizeof(uint32));
+    if (bFramed)
+    {
+        const uint32 FrameLength = static_cast<uint32>(BodyLength);
+        SendBuffer.Add(FrameLength & 0xFF);
+        SendBuffer.Add((FrameLength >> 8) & 0xFF);
+        SendBuffer.Add((FrameLength >> 16) & 0xFF);
+        SendBuffer.Add((FrameLength >> 24) & 0xFF);
+    }
+    SendBuffer.Append(Body, BodyLength);
+
+    constexpr double SendTimeoutSeconds = 30.0;
+    const double SendStartTime = FPlatformTime::Seconds();
+
+    OutBytesSent = 0;
+    while (OutBytesSent < SendBuffer.Num())
+    {
+        int32 BytesSent = 0;
+        if (Socket->Send(SendBuffer.GetData() + OutBytesSent, SendBuffer.Num() - OutBytesSent, BytesSent))
+        {
+            OutBytesSent += BytesSent;
+            continue;
+        }
+
+        // The send buffer is full; wait for the client to drain it
+        if (ISocketSubsystem::Get()->GetLastErrorCode() != SE_EWOULDBLOCK
+            || FPlatformTime::Seconds() - SendStartTime > SendTimeoutSeconds)
+        {
+            return false;
+        }
+        FPlatformProcess::Sleep(0.001f);
+    }
+
+    return true;
+}
+
 void FMCPServerRunnable::HandleClientConnection(TSharedPtr<FSocket> InClientSocket)
 {
     if (!InClientSocket.IsValid())
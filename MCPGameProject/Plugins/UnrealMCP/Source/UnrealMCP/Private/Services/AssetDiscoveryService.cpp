@@ -262,6 +262,27 @@ UWidgetBlueprint* FAssetDiscoveryService::FindWidgetBlueprint(const FString& Wid
     return nullptr;
 }
 
+UBlueprint* FAssetDiscoveryService::LoadBlueprint(const FString& BlueprintPath)
+{
+    if (UBlueprint* CachedBlueprint = ResolvedBlueprints.GetBlueprint(BlueprintPath))
+    {
+        return CachedBlueprint;
+    }
+
+    UBlueprint* Blueprint = LoadObject<UBlueprint>(nullptr, *BlueprintPath);
+    if (!Blueprint)
+    {
+        TArray<FString> FoundBlueprints = FindBlueprints(BlueprintPath);
+        if (FoundBlueprints.Num() > 0)
+        {
+            Blueprint = LoadObject<UBlueprint>(nullptr, *FoundBlueprints[0]);
+        }
+    }
+
+    ResolvedBlueprints.CacheBlueprint(BlueprintPath, Blueprint);
+    return Blueprint;
+}
+
 UObject* FAssetDiscoveryService::FindAssetByPath(const FString& AssetPath)
 {
     UE_LOG(LogTemp, Display, TEXT("AssetDiscoveryService: Searching for asset: %s"), *AssetPath);
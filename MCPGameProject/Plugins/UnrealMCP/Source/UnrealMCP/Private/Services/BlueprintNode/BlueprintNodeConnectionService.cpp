@@ -165,6 +165,9 @@ bool FBlueprintNodeConnectionService::ConnectBlueprintNodes(UBlueprint* Blueprin
         return false;
     }
 
+    TMap<FString, UEdGraphNode*> NodeIndex;
+    BuildNodeIdIndex(SearchGraph, NodeIndex);
+
     for (const FBlueprintNodeConnectionParams& Connection : Connections)
     {
         FString ValidationError;
@@ -175,8 +178,8 @@ bool FBlueprintNodeConnectionService::ConnectBlueprintNodes(UBlueprint* Blueprin
             continue;
         }
 
-        UEdGraphNode* SourceNode = FindNodeByIdOrType(SearchGraph, Connection.SourceNodeId);
-        UEdGraphNode* TargetNode = FindNodeByIdOrType(SearchGraph, Connection.TargetNodeId);
+        UEdGraphNode* SourceNode = FindNodeByIdOrType(SearchGraph, NodeIndex, Connection.SourceNodeId);
+        UEdGraphNode* TargetNode = FindNodeByIdOrType(SearchGraph, NodeIndex, Connection.TargetNodeId);
 
         if (!SourceNode || !TargetNode)
         {
@@ -254,6 +257,9 @@ bool FBlueprintNodeConnectionService::ConnectBlueprintNodesEnhanced(UBlueprint*
         return false;
     }
 
+    TMap<FString, UEdGraphNode*> NodeIndex;
+    BuildNodeIdIndex(SearchGraph, NodeIndex);
+
     for (const FBlueprintNodeConnectionParams& Connection : Connections)
     {
         FConnectionResultInfo Result;
@@ -270,8 +276,8 @@ bool FBlueprintNodeConnectionService::ConnectBlueprintNodesEnhanced(UBlueprint*
             continue;
         }
 
-        UEdGraphNode* SourceNode = FindNodeByIdOrType(SearchGraph, Connection.SourceNodeId);
-        UEdGraphNode* TargetNode = FindNodeByIdOrType(SearchGraph, Connection.TargetNodeId);
+        UEdGraphNode* SourceNode = FindNodeByIdOrType(SearchGraph, NodeIndex, Connection.SourceNodeId);
+        UEdGraphNode* TargetNode = FindNodeByIdOrType(SearchGraph, NodeIndex, Connection.TargetNodeId);
 
         if (!SourceNode || !TargetNode)
         {
@@ -643,6 +649,36 @@ bool FBlueprintNodeConnectionService::CreateObjectCast(UEdGraph* Graph, UEdGraph
     return FBlueprintCastNodeService::Get().CreateObjectCast(Graph, SourcePin, TargetPin, OutNodeInfo);
 }
 
+void FBlueprintNodeConnectionService::BuildNodeIdIndex(UEdGraph* Graph, TMap<FString, UEdGraphNode*>& OutNodeIndex)
+{
+    OutNodeIndex.Reset();
+    if (!Graph)
+    {
+        return;
+    }
+
+    OutNodeIndex.Reserve(Graph->Nodes.Num() * 2);
+    for (UEdGraphNode* Node : Graph->Nodes)
+    {
+        if (Node)
+        {
+            // Keep the first match per ID, as the linear search in FindNodeByIdOrType does
+            FString NodeTitle = Node->GetNodeTitle(ENodeTitleType::ListView).ToString();
+            OutNodeIndex.FindOrAdd(FGraphUtils::GetReliableNodeId(Node), Node);
+            OutNodeIndex.FindOrAdd(GetSafeNodeId(Node, NodeTitle), Node);
+        }
+    }
+}
+
+UEdGraphNode* FBlueprintNodeConnectionService::FindNodeByIdOrType(UEdGraph* Graph, const TMap<FString, UEdGraphNode*>& NodeIndex, const FString& NodeIdOrType)
+{
+    if (UEdGraphNode* const* Found = NodeIndex.Find(NodeIdOrType))
+    {
+        return *Found;
+    }
+    return FindNodeByIdOrType(Graph, NodeIdOrType);
+}
+
 UEdGraphNode* FBlueprintNodeConnectionService::FindNodeByIdOrType(UEdGraph* Graph, const FString& NodeIdOrType)
 {
     if (!Graph)
@@ -0,0 +1,41 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Commands/IUnrealMCPCommand.h"
+#include "Services/IBlueprintActionService.h"
+
+/**
+ * Command that lists every function call node of every blueprint under a path
+ * in a single pass, so callers can build a function -> call sites index instead
+ * of running one find_in_blueprints search per function
+ */
+class UNREALMCP_API FBuildFunctionCallIndexCommand : public IUnrealMCPCommand
+{
+public:
+	/**
+	 * Constructor
+	 * @param InBlueprintActionService - Service for blueprint action operations
+	 */
+	explicit FBuildFunctionCallIndexCommand(TSharedPtr<IBlueprintActionService> InBlueprintActionService);
+
+	// IUnrealMCPCommand interface
+	virtual FString Execute(const FString& Parameters) override;
+	virtual FString GetCommandName() const override;
+	virtual bool ValidateParams(const FString& Parameters) const override;
+
+private:
+	/** Service for blueprint action operations */
+	TSharedPtr<IBlueprintActionService> BlueprintActionService;
+
+	/**
+	 * Append one JSON object per function call node of the blueprint
+	 */
+	void CollectFunctionCalls(class UBlueprint* Blueprint, TArray<TSharedPtr<FJsonValue>>& OutCalls) const;
+
+	/**
+	 * Create an error response JSON string
+	 * @param ErrorMessage - Error message
+	 * @return JSON string representing error response
+	 */
+	FString CreateErrorResponse(const FString& ErrorMessage) const;
+};
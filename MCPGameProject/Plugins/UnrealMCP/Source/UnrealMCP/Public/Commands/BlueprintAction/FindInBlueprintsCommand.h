@@ -60,6 +60,7 @@ private:
 	 * @param OutSearchType - Parsed search type
 	 * @param OutPath - Parsed search path
 	 * @param OutMaxResults - Parsed max results
+	 * @param OutOffset - Parsed number of matches to skip
 	 * @param OutCaseSensitive - Whether search is case sensitive
 	 * @param OutError - Error message if parsing fails
 	 * @return true if parsing succeeded
@@ -70,6 +71,7 @@ private:
 		EBlueprintSearchType& OutSearchType,
 		FString& OutPath,
 		int32& OutMaxResults,
+		int32& OutOffset,
 		bool& OutCaseSensitive,
 		FString& OutError
 	) const;
@@ -80,7 +82,8 @@ private:
 	EBlueprintSearchType ParseSearchType(const FString& TypeString) const;
 
 	/**
-	 * Search a single blueprint for matches
+	 * Search a single blueprint for matches, skipping the first InOutMatchesToSkip
+	 * of them (counted down as they are found)
 	 */
 	void SearchBlueprint(
 		class UBlueprint* Blueprint,
@@ -88,7 +91,8 @@ private:
 		EBlueprintSearchType SearchType,
 		bool bCaseSensitive,
 		TArray<FBlueprintSearchMatch>& OutMatches,
-		int32 MaxResults
+		int32 MaxResults,
+		int32& InOutMatchesToSkip
 	) const;
 
 	/**
@@ -115,12 +119,14 @@ private:
 	FString CreateErrorResponse(const FString& ErrorMessage) const;
 
 	/**
-	 * Create a success response with search results
+	 * Create a success response with one page of search results
 	 */
 	FString CreateSuccessResponse(
 		const TArray<FBlueprintSearchMatch>& Matches,
 		const FString& SearchQuery,
 		const FString& SearchType,
-		int32 BlueprintsSearched
+		int32 BlueprintsSearched,
+		int32 Offset,
+		bool bHasMore
 	) const;
 };
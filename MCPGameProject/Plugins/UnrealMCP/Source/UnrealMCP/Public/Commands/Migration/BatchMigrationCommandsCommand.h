@@ -0,0 +1,53 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Commands/IUnrealMCPCommand.h"
+
+/**
+ * Command for executing several registered commands in a single round-trip.
+ * Migration workflows usually issue a sequence of independent queries
+ * (get_blueprint_functions, get_blueprint_dependencies, find_blueprint_references);
+ * batching them avoids paying one TCP connection per query.
+ *
+ * Sub-commands run sequentially on the game thread, in the order given.
+ * Only commands registered with FUnrealMCPCommandRegistry can be batched,
+ * and batches cannot be nested.
+ *
+ * Parameters:
+ *   - commands (array, required): List of objects with:
+ *       - type (string): Name of the command to execute
+ *       - params (object, optional): Parameters for that command
+ *   - stop_on_error (bool, optional): Stop at the first failed sub-command (default: false)
+ *
+ * Returns:
+ *   - success (bool): Whether every executed sub-command succeeded
+ *   - command_count (int): Number of sub-commands executed
+ *   - results (array): Sub-command responses in the same order as 'commands',
+ *       each tagged with the executed 'command' name
+ */
+class UNREALMCP_API FBatchMigrationCommandsCommand : public IUnrealMCPCommand
+{
+public:
+    FBatchMigrationCommandsCommand() = default;
+
+    // IUnrealMCPCommand interface
+    virtual FString Execute(const FString& Parameters) override;
+    virtual FString GetCommandName() const override { return TEXT("batch_migration_commands"); }
+    virtual bool ValidateParams(const FString& Parameters) const override;
+
+private:
+    /**
+     * Execute a single sub-command and parse its response
+     */
+    TSharedPtr<FJsonObject> ExecuteSubCommand(const TSharedPtr<FJsonObject>& CommandJson) const;
+
+    /**
+     * Create error response JSON object
+     */
+    TSharedPtr<FJsonObject> CreateErrorObject(const FString& ErrorMessage) const;
+
+    /**
+     * Create error response JSON
+     */
+    FString CreateErrorResponse(const FString& ErrorMessage) const;
+};
@@ -12,12 +12,31 @@
  *   - graph_name (string, optional): Filter to specific graph name
  *   - include_components (bool, optional): Include component hierarchy (default: true)
  *   - include_defaults (bool, optional): Include default values (default: false)
+ *   - intern_strings (bool, optional): Replace repeated string fields (class names, pin
+ *     categories, GUIDs, ...) with indices into a root "strings" table (default: false)
+ *   - dedupe_connections (bool, optional): Record each link once, on its output pin, instead of
+ *     on both ends; input pin connections are then implied (default: false)
+ *   - chunked (bool, optional): Write a .jsonchunks file instead: a sequence of JSON documents,
+ *     each preceded by its UTF-8 byte length as a little-endian uint32. The first document
+ *     holds everything but the graphs, followed by one document per graph (default: false)
+ *   - layout (string, optional): "aos" for a list of node objects per graph, or "soa" for one
+ *     object of per-field columns (null where a node lacks the field); "soa" also sets a root
+ *     "node_layout" (default: "aos")
+ *   - inline (bool, optional): Return the export in the response instead of writing a file; meant
+ *     for clients that request framed responses. Ignores chunked (default: false)
+ *   - stream (bool, optional): Write a .ndjson file record by record without building the export
+ *     in memory: a "blueprint" record (everything but the graphs), then for each graph a "graph"
+ *     record followed by one "node" record per node. Each line's "record" field names its kind.
+ *     Ignores chunked, intern_strings and layout; inline takes precedence (default: false)
  *
  * Returns:
  *   - success (bool): Whether the export succeeded
- *   - file_path (string): Full path to the exported JSON file
+ *   - file_path (string): Full path to the exported JSON file (not inline)
+ *   - export (object): The export itself (inline only)
  *   - graph_count (int): Number of graphs exported
  *   - node_count (int): Total number of nodes exported
+ *   - edge_count (int): Number of pin links exported (stream only)
+ *   - bytes (int): Size of the written file (stream only)
  */
 class UNREALMCP_API FExportBlueprintGraphCommand : public IUnrealMCPCommand
 {
@@ -30,21 +49,43 @@ public:
     virtual bool ValidateParams(const FString& Parameters) const override;
 
 private:
+    /**
+     * Serialize everything but the graphs: name, parent class, components and variables.
+     */
+    TSharedPtr<FJsonObject> SerializeBlueprintHeader(class UBlueprint* Blueprint, bool bIncludeComponents);
+
+    /**
+     * Write the export as newline-delimited JSON records straight to a file and
+     * return the response (path and counts).
+     */
+    FString WriteStreamedExport(class UBlueprint* Blueprint, const FString& GraphName, bool bIncludeComponents, bool bIncludeDefaults, bool bDedupeConnections);
+
     /**
      * Serialize a Blueprint graph to JSON.
      */
-    TSharedPtr<FJsonObject> SerializeGraph(class UEdGraph* Graph, bool bIncludeDefaults);
+    TSharedPtr<FJsonObject> SerializeGraph(class UEdGraph* Graph, bool bIncludeDefaults, bool bDedupeConnections);
 
     /**
-     * Serialize a graph node to JSON.
+     * Serialize a graph node to JSON. With bDedupeConnections only output pins list their links.
      */
-    TSharedPtr<FJsonObject> SerializeNode(class UEdGraphNode* Node);
+    TSharedPtr<FJsonObject> SerializeNode(class UEdGraphNode* Node, bool bDedupeConnections);
 
     /**
      * Serialize a pin to JSON.
      */
     TSharedPtr<FJsonObject> SerializePin(class UEdGraphPin* Pin, bool bIncludeConnections);
 
+    /**
+     * Replace the values of the interned fields with indices into StringTable,
+     * recursing through nested objects and arrays.
+     */
+    void InternStringFields(const TSharedPtr<FJsonObject>& JsonObject, TMap<FString, int32>& StringIndices, TArray<TSharedPtr<FJsonValue>>& StringTable);
+
+    /**
+     * Replace a graph's list of node objects with one array per node field.
+     */
+    void ConvertNodesToColumns(const TSharedPtr<FJsonObject>& GraphJson) const;
+
     /**
      * Get the export directory path.
      */
@@ -60,6 +101,12 @@ private:
      */
     FString WriteJsonToTempFile(const FString& FileName, const TSharedPtr<FJsonObject>& JsonContent);
 
+    /**
+     * Write the export as length-prefixed JSON documents: the header object
+     * first, then one document per graph.
+     */
+    FString WriteChunkedJsonToTempFile(const FString& FileName, const TSharedPtr<FJsonObject>& HeaderContent, const TArray<TSharedPtr<FJsonValue>>& Graphs);
+
     /**
      * Create success response JSON
      */
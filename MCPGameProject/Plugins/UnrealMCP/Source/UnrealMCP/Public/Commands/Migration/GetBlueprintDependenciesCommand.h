@@ -11,6 +11,9 @@
  *   - blueprint_path (string, required): Path to the Blueprint
  *   - include_engine_classes (bool, optional): Include engine/native class dependencies (default: false)
  *   - recursive (bool, optional): Recursively gather dependencies (default: true)
+ *   - sort (string, optional): "topological" to return the Blueprint dependency order, or "none" (default: "topological")
+ *   - overflow_threshold (int, optional): Dependents after which a Blueprint is no longer walked or listed
+ *     individually; 0 disables the limit, 1 keeps the walk shallow (default: 256)
  *
  * Returns:
  *   - blueprint_path (string): The analyzed Blueprint's path
@@ -18,6 +21,13 @@
  *   - blueprints (array): List of Blueprint dependencies
  *   - native_classes (array): List of native C++ class dependencies
  *   - function_calls (array): List of function calls with counts
+ *   - order (array): Blueprint packages, dependencies before dependents, ending with the analyzed
+ *     Blueprint; covers the whole dependency chain when recursive (only with sort "topological")
+ *   - edges (array): [dependent, dependency] package pairs between those Blueprints, except edges into
+ *     overflowed Blueprints
+ *   - overflow (array): Blueprints over overflow_threshold, as {"path", "dependents": ["<overflow>"], "dependent_count"}
+ *   - has_cycles (bool): Whether circular dependencies were found; the packages involved are
+ *     appended to order in discovery order
  */
 class UNREALMCP_API FGetBlueprintDependenciesCommand : public IUnrealMCPCommand
 {
@@ -30,6 +40,20 @@ public:
     virtual bool ValidateParams(const FString& Parameters) const override;
 
 private:
+    /**
+     * Collect Blueprint-to-Blueprint package dependencies starting at RootPackage.
+     * Only the root's dependencies are walked unless bRecursive is set. Blueprints with more than
+     * OverflowThreshold dependents are not walked further; their dependent counts go to OutOverflow.
+     */
+    void CollectBlueprintDependencyGraph(class IAssetRegistry& AssetRegistry, FName RootPackage, bool bRecursive, int32 OverflowThreshold,
+        TMap<FName, TArray<FName>>& OutGraph, TMap<FName, int32>& OutOverflow) const;
+
+    /**
+     * Order the graph so every package comes after its dependencies (Kahn's algorithm).
+     * Returns false if the graph has cycles; those packages are appended in discovery order.
+     */
+    bool SortDependenciesTopologically(const TMap<FName, TArray<FName>>& Graph, TArray<FName>& OutOrder) const;
+
     /**
      * Create error response JSON
      */
@@ -39,6 +39,7 @@ private:
     static void RegisterDeleteBlueprintFunctionCommand();
     static void RegisterSetBlueprintParentClassCommand();
     static void RegisterGetBlueprintFunctionsCommand();
+    static void RegisterBatchMigrationCommandsCommand();
 
     /**
      * Helper to register a command and track it for cleanup
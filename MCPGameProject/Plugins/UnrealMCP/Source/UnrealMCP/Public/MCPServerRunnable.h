@@ -26,6 +26,14 @@ protected:
 	void HandleClientConnection(TSharedPtr<FSocket> ClientSocket);
 	void ProcessMessage(TSharedPtr<FSocket> Client, const FString& Message);
 
+	/**
+	 * Send a command response as UTF-8, prefixed with its byte length (uint32, little-endian)
+	 * when the client asked for a framed response. Large responses are gzip-compressed when
+	 * bCompress is set. Keeps sending until the whole buffer is out, since a non-blocking
+	 * send may accept only part of a large response.
+	 */
+	bool SendResponse(FSocket* Socket, const FString& Response, bool bFramed, bool bCompress, int32& OutBytesSent);
+
 private:
 	UUnrealMCPBridge* Bridge;
 	TSharedPtr<FSocket> ListenerSocket;
@@ -3,6 +3,7 @@
 #include "CoreMinimal.h"
 #include "Engine/Blueprint.h"
 #include "WidgetBlueprint.h"
+#include "Services/Blueprint/BlueprintCacheService.h"
 
 
 /**
@@ -26,6 +27,9 @@ public:
     UWidgetBlueprint* FindWidgetBlueprint(const FString& WidgetPath);
     UObject* FindAssetByPath(const FString& AssetPath);
     UObject* FindAssetByName(const FString& AssetName, const FString& AssetType = TEXT(""));
+    // Loads by object path, else the first Blueprint whose name contains BlueprintPath;
+    // the result is cached per requested path while the Blueprint stays loaded
+    UBlueprint* LoadBlueprint(const FString& BlueprintPath);
     UScriptStruct* FindStructType(const FString& StructPath);
     UEnum* FindEnumType(const FString& EnumPath);
 
@@ -52,4 +56,7 @@ private:
     FString BuildEnginePath(const FString& Path);
     FString BuildCorePath(const FString& Path);
     FString BuildUMGPath(const FString& Path);
+
+    // Blueprints resolved by LoadBlueprint, keyed by the requested path
+    FBlueprintCache ResolvedBlueprints;
 };
\ No newline at end of file
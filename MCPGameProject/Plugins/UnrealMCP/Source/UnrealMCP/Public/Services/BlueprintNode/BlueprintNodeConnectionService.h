@@ -143,6 +143,24 @@ public:
      */
     UEdGraphNode* FindNodeByIdOrType(UEdGraph* Graph, const FString& NodeIdOrType);
 
+    /**
+     * Find a node by ID using an index built by BuildNodeIdIndex, falling back to
+     * FindNodeByIdOrType for type identifiers and nodes added after the index was built
+     * @param Graph - The graph to search in
+     * @param NodeIndex - Node ID index of the graph
+     * @param NodeIdOrType - Node ID (GUID) or special type like "FunctionEntry", "FunctionResult"
+     * @return Found node or nullptr
+     */
+    UEdGraphNode* FindNodeByIdOrType(UEdGraph* Graph, const TMap<FString, UEdGraphNode*>& NodeIndex, const FString& NodeIdOrType);
+
+    /**
+     * Map every node of a graph by its reliable ID and its safe node ID, so that
+     * resolving many connections does not rescan the graph for each endpoint
+     * @param Graph - The graph to index
+     * @param OutNodeIndex - Receives the ID to node map
+     */
+    void BuildNodeIdIndex(UEdGraph* Graph, TMap<FString, UEdGraphNode*>& OutNodeIndex);
+
 private:
     /** Private constructor for singleton pattern */
     FBlueprintNodeConnectionService() = default;
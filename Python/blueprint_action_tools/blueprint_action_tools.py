@@ -522,7 +522,8 @@ def register_blueprint_action_tools(mcp: FastMCP):
         search_type: str = "all",
         path: str = "/Game",
         max_results: int = 50,
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        offset: int = 0
     ) -> Dict[str, Any]:
         """
         Search for function/variable/event usages across all blueprints.
@@ -544,6 +545,8 @@ def register_blueprint_action_tools(mcp: FastMCP):
             path: Content path to search in (default: "/Game")
             max_results: Maximum number of results to return (default: 50, max: 500)
             case_sensitive: Whether to perform case-sensitive search (default: False)
+            offset: Number of matches to skip; pass next_offset from a previous
+                    search to get its next page (default: 0)
 
         Returns:
             Dict containing:
@@ -552,6 +555,9 @@ def register_blueprint_action_tools(mcp: FastMCP):
                 - search_type: The type filter applied
                 - blueprints_searched: Number of blueprints searched
                 - match_count: Number of matches found
+                - offset: Number of matches skipped
+                - has_more: Whether more matches may follow this page
+                - next_offset: offset for the next page, when has_more is set
                 - matches: Array of match objects with:
                     - blueprint_path: Full path to the blueprint
                     - blueprint_name: Name of the blueprint
@@ -577,6 +583,9 @@ def register_blueprint_action_tools(mcp: FastMCP):
 
             # Case-sensitive search
             find_in_blueprints(search_query="DialogueNPC", case_sensitive=True)
+
+            # Next page of a search that returned has_more=True and next_offset=50
+            find_in_blueprints(search_query="Inventory", offset=50)
         """
-        return find_in_blueprints_impl(ctx, search_query, search_type, path, max_results, case_sensitive)
+        return find_in_blueprints_impl(ctx, search_query, search_type, path, max_results, case_sensitive, offset)
 
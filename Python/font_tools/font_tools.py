@@ -3,6 +3,7 @@
 import logging
 from typing import Dict, Any
 from mcp.server.fastmcp import FastMCP, Context
+from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
 
 logger = logging.getLogger("UnrealMCP")
 
@@ -44,8 +45,6 @@ def register_font_tools(mcp: FastMCP):
                 source_texture="/Game/Fonts/DarkFantasy_Regular_sdf"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -70,7 +69,7 @@ def register_font_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Create FontFace response: {response}")
+            logger.debug("Create FontFace response: %s", response)
             return response
 
         except Exception as e:
@@ -102,8 +101,6 @@ def register_font_tools(mcp: FastMCP):
                 properties={"Hinting": "None"}
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -122,7 +119,7 @@ def register_font_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Set FontFace properties response: {response}")
+            logger.debug("Set FontFace properties response: %s", response)
             return response
 
         except Exception as e:
@@ -148,8 +145,6 @@ def register_font_tools(mcp: FastMCP):
         Example:
             get_font_face_metadata(font_path="/Game/Fonts/FF_DarkFantasy_Regular")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -167,7 +162,7 @@ def register_font_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Get FontFace metadata response: {response}")
+            logger.debug("Get FontFace metadata response: %s", response)
             return response
 
         except Exception as e:
@@ -213,8 +208,6 @@ def register_font_tools(mcp: FastMCP):
                 metrics_file_path="E:/code/unreal-mcp/Docs/fonts/DarkFantasy_Regular_metrics.json"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -235,7 +228,7 @@ def register_font_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Create offline font response: {response}")
+            logger.debug("Create offline font response: %s", response)
             return response
 
         except Exception as e:
@@ -262,8 +255,6 @@ def register_font_tools(mcp: FastMCP):
         Example:
             get_font_metadata(font_path="/Game/Fonts/Font_DarkFantasy_Regular")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -281,7 +272,7 @@ def register_font_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Get font metadata response: {response}")
+            logger.debug("Get font metadata response: %s", response)
             return response
 
         except Exception as e:
@@ -338,8 +329,6 @@ def register_font_tools(mcp: FastMCP):
                 ttf_file_path="E:/code/unreal-mcp/Python/font_generation/Cinzel-Torn.ttf"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -391,7 +380,7 @@ def register_font_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Create font response: {response}")
+            logger.debug("Create font response: %s", response)
             return response
 
         except Exception as e:
@@ -5,320 +5,275 @@ This server provides tools for analyzing Blueprints, exporting graph data,
 finding dependencies and references, and managing the migration process.
 """
 
-import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastmcp import FastMCP
 
+from migration_tools import register_migration_tools
+from utils.migration import load_export_file
+from utils.unreal_connection_utils import send_tcp_command
+
 app = FastMCP("Migration MCP Server")
 
-TCP_HOST = "127.0.0.1"
-TCP_PORT = 55557
+# Pure reads that LLM clients tend to repeat for the same Blueprint
+_CACHEABLE_COMMANDS = frozenset({
+    "get_blueprint_functions",
+    "get_blueprint_dependencies",
+    "find_blueprint_references",
+})
 
+# Commands that modify a Blueprint and so invalidate cached reads of it
+_MUTATING_COMMANDS = frozenset({
+    "redirect_function_call",
+    "delete_blueprint_function",
+    "set_blueprint_parent_class",
+})
 
-async def send_tcp_command(command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Send a command to the Unreal Engine TCP server."""
-    try:
-        command_data = {"type": command_type, "params": params}
-        json_data = json.dumps(command_data)
-
-        reader, writer = await asyncio.open_connection(TCP_HOST, TCP_PORT)
-        writer.write(json_data.encode('utf-8'))
-        writer.write(b'\n')
-        await writer.drain()
-
-        response_data = await reader.read(49152)
-        response_str = response_data.decode('utf-8').strip()
-
-        writer.close()
-        await writer.wait_closed()
-
-        if response_str:
-            try:
-                return json.loads(response_str)
-            except json.JSONDecodeError as json_err:
-                return {"success": False, "error": f"JSON decode error: {str(json_err)}"}
-        else:
-            return {"success": False, "error": "Empty response from server"}
-    except Exception as e:
-        return {"success": False, "error": f"TCP communication error: {str(e)}"}
-
-
-@app.tool()
-async def export_blueprint_graph(
-    blueprint_path: str,
-    graph_name: str = "",
-    include_components: bool = True,
-    include_defaults: bool = False
-) -> Dict[str, Any]:
-    """
-    Export a complete Blueprint graph to a JSON file.
-
-    The JSON is written to Saved/UnrealMCP/Exports/ to avoid socket buffer
-    issues with complex Blueprints. Use this to analyze Blueprint structure
-    before migrating to C++.
-
-    Args:
-        blueprint_path: Path to the Blueprint (e.g., "/Game/Blueprints/MyBP" or just "MyBP")
-        graph_name: Optional graph name filter (exports all if omitted)
-        include_components: Include component hierarchy in export
-        include_defaults: Include default values for all properties
-
-    Returns:
-        Dict with:
-        - success: Whether the export succeeded
-        - file_path: Full path to the exported JSON file
-        - graph_count: Number of graphs exported
-        - node_count: Total number of nodes exported
-    """
-    params = {
-        "blueprint_path": blueprint_path,
-        "include_components": include_components,
-        "include_defaults": include_defaults
-    }
+# Parameter names that identify the Blueprint a command operates on
+_BLUEPRINT_PATH_KEYS = ("blueprint_path", "target_path", "source_blueprint")
 
-    if graph_name:
-        params["graph_name"] = graph_name
+QUERY_CACHE_TTL = 30.0
+QUERY_CACHE_SIZE = 256
 
-    return await send_tcp_command("export_blueprint_graph", params)
+# (command_type, canonical params, generation) -> (expiry, response), in LRU order
+_query_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
 
+# Modification generation per Blueprint, bumped by every mutating command sent
+# through this server. Cache keys include it, so edited Blueprints simply stop
+# matching their old entries, which then age out of the LRU.
+_blueprint_generations: Dict[Optional[str], int] = {}
 
-@app.tool()
-async def get_blueprint_dependencies(
-    blueprint_path: str,
-    include_engine_classes: bool = False,
-    recursive: bool = True
-) -> Dict[str, Any]:
-    """
-    Get all dependencies of a Blueprint.
-
-    Returns categorized lists of assets, blueprints, native classes,
-    and function calls with their counts. Essential for understanding
-    what a Blueprint relies on before migration.
-
-    Args:
-        blueprint_path: Path to the Blueprint (e.g., "/Game/Blueprints/MyBP" or just "MyBP")
-        include_engine_classes: Include engine/native class dependencies
-        recursive: Recursively gather dependencies
-
-    Returns:
-        Dict with:
-        - blueprint_path: The analyzed Blueprint's path
-        - assets: List of asset dependencies
-        - blueprints: List of Blueprint dependencies
-        - native_classes: List of native C++ class dependencies
-        - function_calls: List of function calls with counts
-    """
-    params = {
-        "blueprint_path": blueprint_path,
-        "include_engine_classes": include_engine_classes,
-        "recursive": recursive
-    }
+# Bumped by every mutation; editing any Blueprint can change who references
+# another, so reference queries are keyed on this instead
+_mutation_generation = 0
 
-    return await send_tcp_command("get_blueprint_dependencies", params)
+# Blueprint path -> (expiry, generation, export file) of its last full graph
+# export, see _dry_run_locally; load_export_file caches the parsed files
+_graph_exports: Dict[str, Tuple[float, int, str]] = {}
 
+# (target_class, target_function) of redirects Unreal accepted; it resolves
+# the target before anything else, so these are known to exist
+_verified_targets: Set[Tuple[str, str]] = set()
 
-@app.tool()
-async def find_blueprint_references(
-    target_path: str,
-    target_function: str = "",
-    search_scope: str = "project",
-    include_soft_references: bool = True
-) -> Dict[str, Any]:
-    """
-    Find all assets/Blueprints that reference a given Blueprint or function.
-
-    Useful for understanding impact before migrating Blueprint functionality
-    to C++. Helps identify which Blueprints will need updates after migration.
-
-    Args:
-        target_path: Path to the target Blueprint
-        target_function: Optional function name to find specific references to
-        search_scope: Search scope ("project" or "all")
-        include_soft_references: Include soft/lazy references
-
-    Returns:
-        Dict with:
-        - target_path: The target Blueprint path
-        - target_function: The function searched for (if specified)
-        - referencer_count: Number of referencers found
-        - referencers: List of referencer details including:
-          - referencer_path: Path to the referencing asset
-          - referencer_name: Name of the referencing Blueprint
-          - type: "Blueprint" or "Asset"
-          - reference_locations: (if searching for function) List of exact locations
+
+def _blueprint_path_of(params: Dict[str, Any]) -> Optional[str]:
+    """Return the Blueprint a command's params refer to, if any."""
+    for key in _BLUEPRINT_PATH_KEYS:
+        if params.get(key):
+            return params[key]
+    return None
+
+
+def _is_error_response(response: Any) -> bool:
+    """Check whether a response reports a failure at either envelope level."""
+    if not isinstance(response, dict):
+        return True
+    if response.get("status") == "error" or response.get("success") is False:
+        return True
+    result = response.get("result")
+    return isinstance(result, dict) and result.get("success") is False
+
+
+def _invalidate_cached_queries(blueprint_path: Optional[str]) -> None:
+    """Make cached reads of a Blueprint, and all reference queries, stale."""
+    global _mutation_generation
+    _blueprint_generations[blueprint_path] = _blueprint_generations.get(blueprint_path, 0) + 1
+    _mutation_generation += 1
+
+
+def _is_mutation(command_type: str, params: Dict[str, Any]) -> bool:
+    """Check whether a command modifies a Blueprint (redirect previews don't)."""
+    if command_type not in _MUTATING_COMMANDS:
+        return False
+    return not (command_type == "redirect_function_call" and params.get("dry_run", True))
+
+
+def _query_cache_key(command_type: str, params: Dict[str, Any]) -> Tuple[str, str, int]:
+    """Return the query cache key of a read-only command."""
+    if command_type == "find_blueprint_references":
+        generation = _mutation_generation
+    else:
+        generation = _blueprint_generations.get(_blueprint_path_of(params), 0)
+
+    # Sorted keys so that the same params in a different order share an entry
+    return (command_type, json.dumps(params, sort_keys=True, default=str), generation)
+
+
+def _cache_batched_queries(commands: List[Dict[str, Any]], response: Dict[str, Any]) -> None:
+    """Cache the successful read-only results of a batch as individual responses.
+
+    A batch (e.g. introspect_blueprint) then also answers later individual
+    calls for the same queries.
     """
-    params = {
-        "target_path": target_path,
-        "search_scope": search_scope,
-        "include_soft_references": include_soft_references
-    }
-
-    if target_function:
-        params["target_function"] = target_function
-
-    return await send_tcp_command("find_blueprint_references", params)
-
-
-@app.tool()
-async def redirect_function_call(
-    source_blueprint: str,
-    source_function: str,
-    target_class: str,
-    target_function: str,
-    dry_run: bool = True,
-    backup: bool = True
+    payload = response.get("result", response) if isinstance(response, dict) else None
+    results = payload.get("results") if isinstance(payload, dict) else None
+    if not isinstance(results, list):
+        return
+
+    expiry = time.monotonic() + QUERY_CACHE_TTL
+    for command, result in zip(commands, results):
+        command_type = command.get("type")
+        if command_type not in _CACHEABLE_COMMANDS or _is_error_response(result):
+            continue
+        result = {key: value for key, value in result.items() if key != "command"}
+        _query_cache[_query_cache_key(command_type, command.get("params") or {})] = (
+            expiry, {"status": "success", "result": result}
+        )
+        if len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+
+
+async def _cached_send(
+    command_type: str,
+    params: Dict[str, Any],
+    ttl: float = QUERY_CACHE_TTL
 ) -> Dict[str, Any]:
+    """Send a read-only command, reusing a successful response for ttl seconds.
+
+    Entries are only reused while the Blueprint they describe has not been
+    modified through this server; the TTL bounds staleness from edits made
+    elsewhere (e.g. by hand in the editor).
     """
-    Redirect function calls in a Blueprint from one function to another.
-
-    Use this to update Blueprints to call C++ functions instead of
-    Blueprint functions during migration. Always use dry_run=True first
-    to preview changes before applying them.
-
-    Args:
-        source_blueprint: Path to the Blueprint to modify
-        source_function: Name of the function currently being called
-        target_class: C++ class containing the new function (e.g., "UMyGameLibrary")
-        target_function: Name of the C++ function to redirect to
-        dry_run: If True, only preview changes without applying them
-        backup: If True, create a backup JSON before making changes
-
-    Returns:
-        Dict with:
-        - source_blueprint: The Blueprint being modified
-        - dry_run: Whether this was a preview only
-        - nodes_found: Number of matching function calls found
-        - changes: List of changes (or changes that would be made)
-        - message: Summary message
-        - backup_path: (if backup=True and dry_run=False) Path to backup file
-        - requires_compile: (if dry_run=False) Whether Blueprint needs recompile
-    """
-    params = {
-        "source_blueprint": source_blueprint,
-        "source_function": source_function,
-        "target_class": target_class,
-        "target_function": target_function,
-        "dry_run": dry_run,
-        "backup": backup
-    }
-
-    return await send_tcp_command("redirect_function_call", params)
-
-
-@app.tool()
-async def delete_blueprint_function(
-    blueprint_path: str,
-    function_name: str,
-    backup: bool = True
-) -> Dict[str, Any]:
+    key = _query_cache_key(command_type, params)
+    now = time.monotonic()
+
+    cached = _query_cache.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            _query_cache.move_to_end(key)
+            return cached[1]
+        del _query_cache[key]
+
+    response = await send_tcp_command(command_type, params)
+    if not _is_error_response(response):
+        _query_cache[key] = (now + ttl, response)
+        if len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return response
+
+
+def _record_graph_export(params: Dict[str, Any], response: Dict[str, Any]) -> None:
+    """Remember where a successful full export of a Blueprint was written."""
+    blueprint_path = params.get("blueprint_path")
+    result = response.get("result")
+    if params.get("graph_name") or not isinstance(result, dict) or not result.get("file_path"):
+        return
+
+    _graph_exports[blueprint_path] = (
+        time.monotonic() + QUERY_CACHE_TTL,
+        _blueprint_generations.get(blueprint_path, 0),
+        result["file_path"]
+    )
+
+
+def _dry_run_locally(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Preview a function call redirect from the Blueprint's last graph export.
+
+    Only used while that export is fresh (same rules as the query cache), and
+    for a target function Unreal already resolved in an earlier redirect.
+    Returns None otherwise, so the preview is sent to Unreal.
     """
-    Delete a function graph from a Blueprint.
-
-    Use this during Blueprint cleanup to remove function graphs that have
-    been migrated to C++. Always creates a backup by default for safety.
-
-    Args:
-        blueprint_path: Path to the Blueprint to modify
-        function_name: Name of the function graph to delete
-        backup: If True, create a backup JSON before making changes
-
-    Returns:
-        Dict with:
-        - success: Whether the deletion succeeded
-        - blueprint_path: The modified Blueprint's path
-        - function_name: The deleted function name
-        - nodes_removed: Number of nodes removed
-        - backup_path: (if backup=True) Path to backup file
-        - requires_compile: Whether Blueprint needs recompile
-        - message: Summary message
+    if (params.get("target_class"), params.get("target_function")) not in _verified_targets:
+        return None
+
+    source_blueprint = params.get("source_blueprint")
+    entry = _graph_exports.get(source_blueprint)
+    if entry is None:
+        return None
+    expiry, generation, file_path = entry
+    if expiry <= time.monotonic() or generation != _blueprint_generations.get(source_blueprint, 0):
+        del _graph_exports[source_blueprint]
+        return None
+
+    try:
+        export = load_export_file(file_path)
+    except (OSError, ValueError):
+        return None
+
+    source_function = params.get("source_function")
+    # Unreal reports the bare class name, e.g. "/Script/Module.MyClass" -> "MyClass"
+    target_class = params.get("target_class", "").rsplit('/', 1)[-1].rsplit('.', 1)[-1]
+    new_function = f"{target_class}::{params.get('target_function')}"
+
+    changes = []
+    for graph in export.get("graphs", []):
+        for node in graph.get("nodes", []):
+            if node.get("node_type") == "CallFunction" and node.get("function_name") == source_function:
+                changes.append({
+                    "graph": graph.get("name"),
+                    "node_guid": node.get("guid"),
+                    "original_function": f"{node.get('function_class', 'Unknown')}::{source_function}",
+                    "new_function": new_function,
+                    "pos_x": node.get("pos_x"),
+                    "pos_y": node.get("pos_y")
+                })
+
+    if changes:
+        message = f"Dry run: Found {len(changes)} function calls to redirect"
+    else:
+        message = "No matching function calls found to redirect"
+
+    return {"status": "success", "result": {
+        "success": True,
+        "source_blueprint": export.get("blueprint_path", source_blueprint),
+        "dry_run": True,
+        "nodes_found": len(changes),
+        "changes": changes,
+        "message": message
+    }}
+
+
+async def send_command(command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a command, serving read-only queries from the cache when possible.
+
+    Mutating commands (directly or inside a batch) invalidate the cached
+    reads of the Blueprints they touch. Redirect previews are answered from
+    the Blueprint's last graph export when there is a fresh one and Unreal
+    has already resolved the target function.
     """
-    params = {
-        "blueprint_path": blueprint_path,
-        "function_name": function_name,
-        "backup": backup
-    }
+    if command_type in _CACHEABLE_COMMANDS:
+        return await _cached_send(command_type, params)
 
-    return await send_tcp_command("delete_blueprint_function", params)
+    if command_type == "redirect_function_call" and params.get("dry_run", True):
+        preview = _dry_run_locally(params)
+        if preview is not None:
+            return preview
 
+    response = await send_tcp_command(command_type, params)
 
-@app.tool()
-async def set_blueprint_parent_class(
-    blueprint_path: str,
-    new_parent_class: str,
-    backup: bool = True
-) -> Dict[str, Any]:
-    """
-    Change the parent class of a Blueprint.
-
-    Use this during migration to reparent a Blueprint to a new C++ class
-    that contains the migrated functionality. This is the final step
-    after migrating Blueprint logic to C++.
-
-    Args:
-        blueprint_path: Path to the Blueprint to modify
-        new_parent_class: Full path or name of the new parent class
-        backup: If True, create a backup JSON before making changes
-
-    Returns:
-        Dict with:
-        - success: Whether the reparenting succeeded
-        - blueprint_path: The modified Blueprint's path
-        - old_parent_class: The previous parent class name
-        - new_parent_class: The new parent class name
-        - new_parent_class_path: Full path of new parent class
-        - backup_path: (if backup=True) Path to backup file
-        - requires_compile: Whether Blueprint needs recompile
-        - message: Summary message
-    """
-    params = {
-        "blueprint_path": blueprint_path,
-        "new_parent_class": new_parent_class,
-        "backup": backup
-    }
+    if command_type == "redirect_function_call" and not _is_error_response(response):
+        _verified_targets.add((params.get("target_class"), params.get("target_function")))
 
-    return await send_tcp_command("set_blueprint_parent_class", params)
+    if command_type == "export_blueprint_graph":
+        if not _is_error_response(response):
+            _record_graph_export(params, response)
+    elif _is_mutation(command_type, params):
+        _invalidate_cached_queries(_blueprint_path_of(params))
+    elif command_type == "batch_migration_commands":
+        _cache_batched_queries(params.get("commands", []), response)
+        for command in params.get("commands", []):
+            command_params = command.get("params") or {}
+            if _is_mutation(command.get("type"), command_params):
+                _invalidate_cached_queries(_blueprint_path_of(command_params))
 
+    return response
 
-@app.tool()
-async def get_blueprint_functions(
-    blueprint_path: str,
-    include_inherited: bool = False
-) -> Dict[str, Any]:
-    """
-    Get a list of all functions defined in a Blueprint.
-
-    Useful for verifying which functions exist before/after cleanup,
-    and for planning which functions to migrate. Lists functions,
-    events, event graphs, and macros.
-
-    Args:
-        blueprint_path: Path to the Blueprint to analyze
-        include_inherited: Include functions inherited from parent class
-
-    Returns:
-        Dict with:
-        - success: Whether the query succeeded
-        - blueprint_path: The Blueprint's path
-        - blueprint_name: The Blueprint's name
-        - parent_class: Parent class name
-        - function_count: Total number of functions
-        - functions: List of function details including:
-          - name: Function name
-          - graph_name: Name of the function's graph
-          - node_count: Number of nodes in the function
-          - is_event: Whether this is an event (BeginPlay, Tick, etc.)
-          - is_override: Whether this is an override
-          - type: "Function", "Event", "EventGraph", or "Macro"
-    """
-    params = {
-        "blueprint_path": blueprint_path,
-        "include_inherited": include_inherited
-    }
 
-    return await send_tcp_command("get_blueprint_functions", params)
+register_migration_tools(app, send_command)
 
 
 if __name__ == "__main__":
-    app.run()
+    try:
+        # libuv-backed event loop; not available on Windows
+        import uvloop
+    except ImportError:
+        app.run()
+    else:
+        # app.run() starts its loop through anyio, which takes a loop factory
+        # rather than the deprecated event loop policy uvloop.install() sets
+        import anyio
+
+        anyio.run(app.run_stdio_async, backend_options={"loop_factory": uvloop.new_event_loop})
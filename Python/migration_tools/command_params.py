@@ -0,0 +1,211 @@
+"""
+Parameter types for the Blueprint migration commands.
+
+Each command sent by the migration tools (and the matching tools of the
+unified server) has a slotted dataclass describing its parameters. Optional
+parameters left at None are omitted from the command, matching what the
+Unreal side expects, and Blueprint paths are canonicalized on construction.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Optional, Type
+
+# Parameters that name a Blueprint and are canonicalized on construction
+_BLUEPRINT_PATH_FIELDS = ("blueprint_path", "target_path", "source_blueprint")
+
+# Absolute object path whose object name repeats the package name, e.g.
+# "/Game/Blueprints/BP_Player.BP_Player" -> "/Game/Blueprints/BP_Player"
+_OBJECT_PATH_RE = re.compile(r'^(/.*/([^/.]+))\.\2$')
+
+
+@lru_cache(maxsize=1024)
+def canonical_blueprint_path(blueprint_path: str) -> str:
+    """
+    Normalize the spelling of a Blueprint path before it is sent to Unreal.
+
+    Surrounding whitespace, a ".uasset" extension and a redundant ".ObjectName"
+    suffix are removed, so different spellings of the same asset map to the
+    same request (and the same cache entry). Bare names are left alone: Unreal
+    searches the whole project for them.
+
+    Args:
+        blueprint_path: Blueprint path or name as given by the caller
+
+    Returns:
+        The canonical path or name
+    """
+    path = blueprint_path.strip()
+    if path[-7:].lower() == ".uasset":
+        path = path[:-7]
+    if path.startswith('/'):
+        match = _OBJECT_PATH_RE.match(path)
+        if match:
+            path = match.group(1)
+    return path
+
+
+class CommandParams:
+    """Base class for migration command parameters."""
+
+    __slots__ = ()
+
+    # Name of the Unreal command these parameters belong to
+    command: ClassVar[str]
+
+    def __post_init__(self) -> None:
+        for name in _BLUEPRINT_PATH_FIELDS:
+            if name in self.__slots__:
+                setattr(self, name, canonical_blueprint_path(getattr(self, name)))
+
+    def to_params(self) -> Dict[str, Any]:
+        """Return the parameters as the dict sent to Unreal, without unset optionals."""
+        params = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                params[name] = value
+        return params
+
+
+@dataclass(slots=True)
+class ExportBlueprintGraphParams(CommandParams):
+    command: ClassVar[str] = "export_blueprint_graph"
+
+    blueprint_path: str
+    include_components: bool = True
+    include_defaults: bool = False
+    graph_name: Optional[str] = None
+    intern_strings: bool = False
+    dedupe_connections: bool = False
+    chunked: bool = False
+    inline: bool = False
+    layout: str = "aos"
+    stream: bool = False
+
+
+@dataclass(slots=True)
+class GetBlueprintDependenciesParams(CommandParams):
+    command: ClassVar[str] = "get_blueprint_dependencies"
+
+    blueprint_path: str
+    include_engine_classes: bool = False
+    recursive: bool = True
+    sort: str = "topological"
+    overflow_threshold: int = 256
+
+
+@dataclass(slots=True)
+class FindBlueprintReferencesParams(CommandParams):
+    command: ClassVar[str] = "find_blueprint_references"
+
+    target_path: str
+    search_scope: str = "project"
+    include_soft_references: bool = True
+    target_function: Optional[str] = None
+
+
+@dataclass(slots=True)
+class RedirectFunctionCallParams(CommandParams):
+    command: ClassVar[str] = "redirect_function_call"
+
+    source_blueprint: str
+    source_function: str
+    target_class: str
+    target_function: str
+    dry_run: bool = True
+    backup: bool = True
+
+
+@dataclass(slots=True)
+class DeleteBlueprintFunctionParams(CommandParams):
+    command: ClassVar[str] = "delete_blueprint_function"
+
+    blueprint_path: str
+    function_name: str
+    backup: bool = True
+
+
+@dataclass(slots=True)
+class SetBlueprintParentClassParams(CommandParams):
+    command: ClassVar[str] = "set_blueprint_parent_class"
+
+    blueprint_path: str
+    new_parent_class: str
+    backup: bool = True
+
+
+@dataclass(slots=True)
+class GetBlueprintFunctionsParams(CommandParams):
+    command: ClassVar[str] = "get_blueprint_functions"
+
+    blueprint_path: str
+    include_inherited: bool = False
+
+
+@dataclass(slots=True)
+class CreateBlueprintParams(CommandParams):
+    command: ClassVar[str] = "create_blueprint"
+
+    name: str
+    parent_class: str
+    folder_path: Optional[str] = None
+
+
+@dataclass(slots=True)
+class GetBlueprintMetadataParams(CommandParams):
+    command: ClassVar[str] = "get_blueprint_metadata"
+
+    blueprint_name: str
+    fields: Optional[List[str]] = None
+    graph_name: Optional[str] = None
+    node_type: Optional[str] = None
+    event_type: Optional[str] = None
+    detail_level: Optional[str] = None
+    component_name: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SpawnActorParams(CommandParams):
+    command: ClassVar[str] = "spawn_actor"
+
+    name: str
+    type: str
+    location: Optional[List[float]] = None
+    rotation: Optional[List[float]] = None
+
+
+@dataclass(slots=True)
+class SpawnBlueprintActorParams(CommandParams):
+    command: ClassVar[str] = "spawn_blueprint_actor"
+
+    blueprint_name: str
+    actor_name: str
+    location: Optional[List[float]] = None
+    rotation: Optional[List[float]] = None
+
+
+@dataclass(slots=True)
+class SetActorTransformParams(CommandParams):
+    command: ClassVar[str] = "set_actor_transform"
+
+    name: str
+    location: Optional[List[float]] = None
+    rotation: Optional[List[float]] = None
+    scale: Optional[List[float]] = None
+
+
+# Migration command name -> parameter class
+COMMAND_PARAMS: Dict[str, Type[CommandParams]] = {
+    params_class.command: params_class
+    for params_class in (
+        ExportBlueprintGraphParams,
+        GetBlueprintDependenciesParams,
+        FindBlueprintReferencesParams,
+        RedirectFunctionCallParams,
+        DeleteBlueprintFunctionParams,
+        SetBlueprintParentClassParams,
+        GetBlueprintFunctionsParams,
+    )
+}
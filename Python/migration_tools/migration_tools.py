@@ -9,16 +9,152 @@ These tools can be registered with any FastMCP server that has
 access to the Unreal Engine TCP connection.
 """
 
+from __future__ import annotations
+
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional
-
-from fastmcp import FastMCP
+import os
+import shutil
+import sys
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .command_params import (
+    COMMAND_PARAMS,
+    CommandParams,
+    DeleteBlueprintFunctionParams,
+    ExportBlueprintGraphParams,
+    FindBlueprintReferencesParams,
+    GetBlueprintDependenciesParams,
+    GetBlueprintFunctionsParams,
+    RedirectFunctionCallParams,
+    SetBlueprintParentClassParams,
+)
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing fastmcp here would make merely
+    # importing this module pay the framework's start-up cost
+    from fastmcp import FastMCP
 
 # Get logger
 logger = logging.getLogger("UnrealMCP.Migration")
 
+# Servers the tools have already been registered with. FastMCP builds each
+# tool's schema from its signature and docstring at registration time, so a
+# repeated registration would redo that work for nothing.
+_registered_servers: "weakref.WeakSet[FastMCP]" = weakref.WeakSet()
+
+# Envelope keys that are always kept when a tool is asked for specific fields
+_ENVELOPE_KEYS = ("status", "success", "error", "message")
+
+# Commands the bulk tools keep in flight at once, pipelined over the shared connection
+BULK_QUERY_CONCURRENCY = 8
+
+
+def select_fields(response: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Reduce a command response to the requested fields.
+
+    Field paths are resolved against the command result (the "result" object
+    of the Unreal response envelope) and may be dotted, e.g. "class.name".
+    Status and error keys of the envelope are always kept so callers can
+    still tell whether the command succeeded.
+
+    Args:
+        response: Response returned by the Unreal TCP server
+        fields: Field paths to keep, or None to return the response unchanged
+
+    Returns:
+        The response, or a reduced copy containing only the requested fields
+    """
+    if not fields or not isinstance(response, dict):
+        return response
+
+    payload = response.get("result", response)
+    if not isinstance(payload, dict):
+        return response
+
+    selected = {}
+    for path in fields:
+        value = payload
+        for key in path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            selected[path] = value
+
+    reduced = {key: response[key] for key in _ENVELOPE_KEYS if key in response}
+    if payload is response:
+        reduced.update(selected)
+    else:
+        reduced["result"] = selected
+    return reduced
+
+
+def columnar_referencers(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert the referencers list of a find_blueprint_references response to columns.
+
+    Each referencer repeats the same keys and a handful of type values, so the
+    list of objects becomes parallel lists (type, path, name, reference_locations)
+    with the type and path strings interned. The response itself is not
+    modified since it may be shared with the query cache.
+
+    Args:
+        response: Response returned by the Unreal TCP server
+
+    Returns:
+        A copy of the response with "referencers" in columnar form
+    """
+    if not isinstance(response, dict):
+        return response
+
+    payload = response.get("result", response)
+    if not isinstance(payload, dict) or not isinstance(payload.get("referencers"), list):
+        return response
+
+    intern = sys.intern
+    types, paths, names, locations = [], [], [], []
+    for referencer in payload["referencers"]:
+        types.append(intern(referencer.get("type", "")))
+        paths.append(intern(referencer.get("referencer_path", "")))
+        names.append(referencer.get("referencer_name", ""))
+        locations.append(referencer.get("reference_locations"))
+
+    columns = {"type": types, "path": paths, "name": names}
+    if any(location is not None for location in locations):
+        columns["reference_locations"] = locations
+
+    converted = dict(payload, referencers=columns)
+    if payload is response:
+        return converted
+    return dict(response, result=converted)
+
+
+def _copy_export_file(source_path: str, destination_path: str) -> int:
+    """
+    Copy an exported graph file to a caller-supplied location.
+
+    shutil.copyfile hands the copy to the OS (sendfile, fcopyfile or CopyFile
+    depending on the platform), so the export never passes through Python
+    buffers no matter how large the Blueprint graph is.
+
+    Args:
+        source_path: Export file written by Unreal
+        destination_path: Where the caller wants the export
+
+    Returns:
+        Number of bytes written
+    """
+    directory = os.path.dirname(destination_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if not os.path.exists(destination_path) or not os.path.samefile(source_path, destination_path):
+        shutil.copyfile(source_path, destination_path)
+    return os.path.getsize(destination_path)
+
 
 def register_migration_tools(mcp: FastMCP, send_command_func):
     """
@@ -28,47 +164,136 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
         mcp: FastMCP server instance to register tools with
         send_command_func: Async function to send commands to Unreal Engine
                           Should have signature: async def send(cmd_type: str, params: dict) -> dict
+
+    Registering with the same server more than once is a no-op.
     """
+    if mcp in _registered_servers:
+        logger.debug("Blueprint migration tools already registered with this server")
+        return
+    _registered_servers.add(mcp)
+
+    async def _invoke(params: CommandParams, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Send one migration command built from its typed parameters, keeping only fields if given."""
+        return select_fields(await send_command_func(params.command, params.to_params()), fields)
+
+    async def _invoke_all(params_list: List[CommandParams], fields: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Send independent read-only commands concurrently.
+
+        Commands that fail are retried one at a time afterwards, in case the
+        failure came from the concurrency itself.
+        """
+        semaphore = asyncio.Semaphore(BULK_QUERY_CONCURRENCY)
+
+        async def invoke_limited(params: CommandParams) -> Dict[str, Any]:
+            async with semaphore:
+                return await _invoke(params, fields)
+
+        responses = list(await asyncio.gather(*(invoke_limited(params) for params in params_list)))
+        for index, response in enumerate(responses):
+            if response.get("status") == "error" or response.get("success") is False:
+                responses[index] = await _invoke(params_list[index], fields)
+
+        return {
+            "success": True,
+            "count": len(responses),
+            "results": responses
+        }
 
     @mcp.tool()
     async def export_blueprint_graph(
         blueprint_path: str,
         graph_name: str = "",
         include_components: bool = True,
-        include_defaults: bool = False
+        include_defaults: bool = False,
+        intern_strings: bool = False,
+        dedupe_connections: bool = False,
+        chunked: bool = False,
+        inline: bool = False,
+        layout: str = "aos",
+        stream: bool = False,
+        stream_to: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Export a complete Blueprint graph to a JSON file.
 
-        The JSON is written to Saved/UnrealMCP/Exports/ to avoid socket buffer
-        issues with complex Blueprints.
+        The JSON is written to Saved/UnrealMCP/Exports/, unless inline is set.
 
         Args:
             blueprint_path: Path to the Blueprint (e.g., "/Game/Blueprints/MyBP" or just "MyBP")
             graph_name: Optional graph name filter (exports all if omitted)
             include_components: Include component hierarchy in export
             include_defaults: Include default values for all properties
+            intern_strings: Store repeated strings (class names, pin types, GUIDs)
+                            once in a "strings" table and reference them by index;
+                            load_blueprint_export expands them again
+            dedupe_connections: List each pin link once (on its output pin) instead of on
+                                both ends; load_blueprint_export restores the input side
+            chunked: Write a .jsonchunks file of length-prefixed documents (metadata
+                     first, then one per graph) that can be read one graph at a time
+            inline: Return the export in the response ("export") instead of writing
+                    a file; responses are length-framed, so size is not a concern.
+                    Ignores chunked and stream_to
+            layout: "aos" writes each graph's nodes as an array of objects; "soa"
+                    writes them as an object of per-field columns, which is smaller
+                    and faster to scan one field at a time. load_blueprint_export
+                    rebuilds the node objects
+            stream: Have Unreal write a .ndjson file one record (Blueprint metadata,
+                    graph, node) per line as it goes, without building the export
+                    in memory; iter_ndjson_export reads it back record by record.
+                    Ignores chunked, intern_strings and layout
+            stream_to: Optional file path to copy the export to; the copy is done
+                       by the OS and the graph is never loaded into memory
+            fields: Optional result fields to return, e.g. ["file_path", "node_count"]
 
         Returns:
-            Dict with file_path, graph_count, node_count
+            Dict with file_path (or export when inline), graph_count, node_count
+            (plus edge_count and bytes when stream is set, and bytes_written and
+            source_file_path when stream_to is given)
         """
-        params = {
-            "blueprint_path": blueprint_path,
-            "include_components": include_components,
-            "include_defaults": include_defaults
-        }
-
-        if graph_name:
-            params["graph_name"] = graph_name
-
-        logger.info(f"Exporting Blueprint graph: {blueprint_path}")
-        return await send_command_func("export_blueprint_graph", params)
+        params = ExportBlueprintGraphParams(
+            blueprint_path=blueprint_path,
+            include_components=include_components,
+            include_defaults=include_defaults,
+            graph_name=graph_name or None,
+            intern_strings=intern_strings,
+            dedupe_connections=dedupe_connections,
+            chunked=chunked,
+            inline=inline,
+            layout=layout,
+            stream=stream
+        )
+
+        logger.info("Exporting Blueprint graph: %s", blueprint_path)
+        response = await _invoke(params)
+
+        result = response.get("result", response) if isinstance(response, dict) else None
+        if stream_to and isinstance(result, dict) and result.get("file_path"):
+            try:
+                bytes_written = await asyncio.to_thread(_copy_export_file, result["file_path"], stream_to)
+            except OSError as e:
+                return {"success": False, "error": f"Failed to copy export to '{stream_to}': {e}"}
+
+            response = {
+                "success": True,
+                "file_path": stream_to,
+                "source_file_path": result["file_path"],
+                "bytes_written": bytes_written,
+                "graph_count": result.get("graph_count", 0),
+                "node_count": result.get("node_count", 0)
+            }
+
+        return select_fields(response, fields)
 
     @mcp.tool()
     async def get_blueprint_dependencies(
         blueprint_path: str,
         include_engine_classes: bool = False,
-        recursive: bool = True
+        recursive: bool = True,
+        sort: str = "topological",
+        overflow_threshold: int = 256,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Get all dependencies of a Blueprint.
@@ -77,25 +302,36 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
             blueprint_path: Path to the Blueprint
             include_engine_classes: Include engine/native class dependencies
             recursive: Recursively gather dependencies
+            sort: "topological" to also return the Blueprint dependency order
+                  (dependencies first, each Blueprint once), or "none"
+            overflow_threshold: Dependents after which a Blueprint is reported only by
+                                its dependent_count instead of walked and listed; 0 for
+                                no limit, 1 for a shallow walk
+            fields: Optional result fields to return, e.g. ["blueprints", "native_classes"]
 
         Returns:
-            Dict with assets, blueprints, native_classes, function_calls
+            Dict with assets, blueprints, native_classes, function_calls, and
+            order, edges, overflow, has_cycles when sorted
         """
-        params = {
-            "blueprint_path": blueprint_path,
-            "include_engine_classes": include_engine_classes,
-            "recursive": recursive
-        }
+        params = GetBlueprintDependenciesParams(
+            blueprint_path=blueprint_path,
+            include_engine_classes=include_engine_classes,
+            recursive=recursive,
+            sort=sort,
+            overflow_threshold=overflow_threshold
+        )
 
-        logger.info(f"Getting dependencies for Blueprint: {blueprint_path}")
-        return await send_command_func("get_blueprint_dependencies", params)
+        logger.info("Getting dependencies for Blueprint: %s", blueprint_path)
+        return await _invoke(params, fields)
 
     @mcp.tool()
     async def find_blueprint_references(
         target_path: str,
         target_function: str = "",
         search_scope: str = "project",
-        include_soft_references: bool = True
+        include_soft_references: bool = True,
+        columnar: bool = False,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Find all assets/Blueprints that reference a given Blueprint or function.
@@ -105,22 +341,28 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
             target_function: Optional function name to find specific references to
             search_scope: Search scope ("project" or "all")
             include_soft_references: Include soft/lazy references
+            columnar: Return referencers as parallel lists (type, path, name)
+                      instead of one object per referencer; more compact for large results
+            fields: Optional result fields to return, e.g. ["referencer_count"]
 
         Returns:
             Dict with referencer_count and referencers list
         """
-        params = {
-            "target_path": target_path,
-            "search_scope": search_scope,
-            "include_soft_references": include_soft_references
-        }
+        params = FindBlueprintReferencesParams(
+            target_path=target_path,
+            search_scope=search_scope,
+            include_soft_references=include_soft_references,
+            target_function=target_function or None
+        )
 
         if target_function:
-            params["target_function"] = target_function
-
-        logger.info(f"Finding references to: {target_path}" +
-                   (f"::{target_function}" if target_function else ""))
-        return await send_command_func("find_blueprint_references", params)
+            logger.info("Finding references to: %s::%s", target_path, target_function)
+        else:
+            logger.info("Finding references to: %s", target_path)
+        response = await _invoke(params)
+        if columnar:
+            response = columnar_referencers(response)
+        return select_fields(response, fields)
 
     @mcp.tool()
     async def redirect_function_call(
@@ -129,7 +371,8 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
         target_class: str,
         target_function: str,
         dry_run: bool = True,
-        backup: bool = True
+        backup: bool = True,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Redirect function calls in a Blueprint from one function to another.
@@ -143,28 +386,30 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
             target_function: Name of the C++ function to redirect to
             dry_run: If True, only preview changes
             backup: If True, create backup before changes
+            fields: Optional result fields to return, e.g. ["nodes_redirected"]
 
         Returns:
             Dict with nodes_found, changes list, and status
         """
-        params = {
-            "source_blueprint": source_blueprint,
-            "source_function": source_function,
-            "target_class": target_class,
-            "target_function": target_function,
-            "dry_run": dry_run,
-            "backup": backup
-        }
-
-        action = "Preview redirect" if dry_run else "Redirect"
-        logger.info(f"{action}: {source_blueprint}::{source_function} -> {target_class}::{target_function}")
-        return await send_command_func("redirect_function_call", params)
+        params = RedirectFunctionCallParams(
+            source_blueprint=source_blueprint,
+            source_function=source_function,
+            target_class=target_class,
+            target_function=target_function,
+            dry_run=dry_run,
+            backup=backup
+        )
+
+        logger.info("%s: %s::%s -> %s::%s", "Preview redirect" if dry_run else "Redirect",
+                    source_blueprint, source_function, target_class, target_function)
+        return await _invoke(params, fields)
 
     @mcp.tool()
     async def delete_blueprint_function(
         blueprint_path: str,
         function_name: str,
-        backup: bool = True
+        backup: bool = True,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Delete a function graph from a Blueprint.
@@ -175,24 +420,26 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
             blueprint_path: Path to the Blueprint to modify
             function_name: Name of the function graph to delete
             backup: If True, create backup before changes
+            fields: Optional result fields to return, e.g. ["backup_path"]
 
         Returns:
             Dict with success status and backup_path
         """
-        params = {
-            "blueprint_path": blueprint_path,
-            "function_name": function_name,
-            "backup": backup
-        }
+        params = DeleteBlueprintFunctionParams(
+            blueprint_path=blueprint_path,
+            function_name=function_name,
+            backup=backup
+        )
 
-        logger.info(f"Deleting function '{function_name}' from Blueprint: {blueprint_path}")
-        return await send_command_func("delete_blueprint_function", params)
+        logger.info("Deleting function '%s' from Blueprint: %s", function_name, blueprint_path)
+        return await _invoke(params, fields)
 
     @mcp.tool()
     async def set_blueprint_parent_class(
         blueprint_path: str,
         new_parent_class: str,
-        backup: bool = True
+        backup: bool = True,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Change the parent class of a Blueprint.
@@ -203,23 +450,25 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
             blueprint_path: Path to the Blueprint to modify
             new_parent_class: Full path or name of the new parent class
             backup: If True, create backup before changes
+            fields: Optional result fields to return, e.g. ["new_parent_class"]
 
         Returns:
             Dict with old and new parent class info
         """
-        params = {
-            "blueprint_path": blueprint_path,
-            "new_parent_class": new_parent_class,
-            "backup": backup
-        }
+        params = SetBlueprintParentClassParams(
+            blueprint_path=blueprint_path,
+            new_parent_class=new_parent_class,
+            backup=backup
+        )
 
-        logger.info(f"Setting parent class of '{blueprint_path}' to '{new_parent_class}'")
-        return await send_command_func("set_blueprint_parent_class", params)
+        logger.info("Setting parent class of '%s' to '%s'", blueprint_path, new_parent_class)
+        return await _invoke(params, fields)
 
     @mcp.tool()
     async def get_blueprint_functions(
         blueprint_path: str,
-        include_inherited: bool = False
+        include_inherited: bool = False,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Get a list of all functions defined in a Blueprint.
@@ -227,16 +476,206 @@ def register_migration_tools(mcp: FastMCP, send_command_func):
         Args:
             blueprint_path: Path to the Blueprint to analyze
             include_inherited: Include inherited functions
+            fields: Optional result fields to return, e.g. ["functions"]
 
         Returns:
             Dict with functions list containing name, type, node_count
         """
+        params = GetBlueprintFunctionsParams(
+            blueprint_path=blueprint_path,
+            include_inherited=include_inherited
+        )
+
+        logger.info("Getting functions for Blueprint: %s", blueprint_path)
+        return await _invoke(params, fields)
+
+    @mcp.tool()
+    async def introspect_blueprint(
+        blueprint_path: str,
+        include_inherited: bool = False,
+        include_engine_classes: bool = False,
+        recursive: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the functions and the dependencies of a Blueprint in one round-trip.
+
+        Equivalent to calling get_blueprint_functions and get_blueprint_dependencies,
+        which migration plans almost always do together; the Blueprint is only
+        resolved once on the Unreal side.
+
+        Args:
+            blueprint_path: Path to the Blueprint to analyze
+            include_inherited: Include inherited functions
+            include_engine_classes: Include engine/native class dependencies
+            recursive: Recursively gather dependencies
+            fields: Optional result fields to return per section, e.g. ["functions", "blueprints"]
+
+        Returns:
+            Dict with the get_blueprint_functions result under "functions" and the
+            get_blueprint_dependencies result under "dependencies"
+        """
+        functions_params = GetBlueprintFunctionsParams(
+            blueprint_path=blueprint_path,
+            include_inherited=include_inherited
+        )
+        dependencies_params = GetBlueprintDependenciesParams(
+            blueprint_path=blueprint_path,
+            include_engine_classes=include_engine_classes,
+            recursive=recursive
+        )
+        params = {
+            "commands": [
+                {"type": functions_params.command, "params": functions_params.to_params()},
+                {"type": dependencies_params.command, "params": dependencies_params.to_params()},
+            ],
+            "stop_on_error": True
+        }
+
+        logger.info("Introspecting Blueprint: %s", blueprint_path)
+        response = await send_command_func("batch_migration_commands", params)
+
+        payload = response.get("result", response) if isinstance(response, dict) else None
+        results = payload.get("results") if isinstance(payload, dict) else None
+        if not isinstance(results, list) or len(results) != 2:
+            return response
+
+        functions, dependencies = (
+            {key: value for key, value in result.items() if key != "command"}
+            for result in results
+        )
+        return {
+            "success": functions.get("success", False) and dependencies.get("success", False),
+            "blueprint_path": functions_params.blueprint_path,
+            "functions": select_fields(functions, fields),
+            "dependencies": select_fields(dependencies, fields)
+        }
+
+    @mcp.tool()
+    async def get_blueprint_functions_bulk(
+        blueprint_paths: List[str],
+        include_inherited: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the functions of several Blueprints at once.
+
+        Args:
+            blueprint_paths: Paths to the Blueprints to analyze
+            include_inherited: Include inherited functions
+            fields: Optional result fields to return per Blueprint, e.g. ["functions"]
+
+        Returns:
+            Dict with count and results in the same order as blueprint_paths
+        """
+        params_list = [
+            GetBlueprintFunctionsParams(blueprint_path=path, include_inherited=include_inherited)
+            for path in blueprint_paths
+        ]
+
+        logger.info("Getting functions for %d Blueprints", len(params_list))
+        return await _invoke_all(params_list, fields)
+
+    @mcp.tool()
+    async def get_blueprint_dependencies_bulk(
+        blueprint_paths: List[str],
+        include_engine_classes: bool = False,
+        recursive: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the dependencies of several Blueprints at once.
+
+        Args:
+            blueprint_paths: Paths to the Blueprints
+            include_engine_classes: Include engine/native class dependencies
+            recursive: Recursively gather dependencies
+            fields: Optional result fields to return per Blueprint, e.g. ["blueprints"]
+
+        Returns:
+            Dict with count and results in the same order as blueprint_paths
+        """
+        params_list = [
+            GetBlueprintDependenciesParams(
+                blueprint_path=path,
+                include_engine_classes=include_engine_classes,
+                recursive=recursive
+            )
+            for path in blueprint_paths
+        ]
+
+        logger.info("Getting dependencies for %d Blueprints", len(params_list))
+        return await _invoke_all(params_list, fields)
+
+    @mcp.tool()
+    async def find_blueprint_references_bulk(
+        target_paths: List[str],
+        search_scope: str = "project",
+        include_soft_references: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Find the referencers of several Blueprints at once.
+
+        Args:
+            target_paths: Paths to the target Blueprints
+            search_scope: Search scope ("project" or "all")
+            include_soft_references: Include soft/lazy references
+            fields: Optional result fields to return per Blueprint, e.g. ["referencers"]
+
+        Returns:
+            Dict with count and results in the same order as target_paths
+        """
+        params_list = [
+            FindBlueprintReferencesParams(
+                target_path=path,
+                search_scope=search_scope,
+                include_soft_references=include_soft_references
+            )
+            for path in target_paths
+        ]
+
+        logger.info("Finding references to %d Blueprints", len(params_list))
+        return await _invoke_all(params_list, fields)
+
+    @mcp.tool()
+    async def batch_blueprint_queries(
+        commands: List[Dict[str, Any]],
+        stop_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run several migration commands in a single round-trip.
+
+        Migration commands are built exactly like their individual tools
+        (defaults filled in, Blueprint paths canonicalized) before sending.
+
+        Args:
+            commands: List of {"type": <command name>, "params": {...}} dicts
+            stop_on_error: If True, stop at the first failed sub-command
+
+        Returns:
+            Dict with command_count and results in the same order as commands
+        """
+        batched = []
+        for command in commands:
+            command_type = command.get("type", "")
+            command_params = command.get("params") or {}
+
+            params_class = COMMAND_PARAMS.get(command_type)
+            if params_class is not None:
+                try:
+                    command_params = params_class(**command_params).to_params()
+                except TypeError as e:
+                    return {"success": False, "error": f"Invalid params for '{command_type}': {e}"}
+
+            batched.append({"type": command_type, "params": command_params})
+
         params = {
-            "blueprint_path": blueprint_path,
-            "include_inherited": include_inherited
+            "commands": batched,
+            "stop_on_error": stop_on_error
         }
 
-        logger.info(f"Getting functions for Blueprint: {blueprint_path}")
-        return await send_command_func("get_blueprint_functions", params)
+        logger.info("Batching %d migration commands", len(commands))
+        return await send_command_func("batch_migration_commands", params)
 
     logger.info("Blueprint migration tools registered successfully")
@@ -6,6 +6,7 @@ from mcp.server.fastmcp import FastMCP, Context
 from utils.project.struct_operations import create_struct as create_struct_impl
 from utils.project.struct_operations import update_struct as update_struct_impl
 from utils.project.struct_operations import get_project_metadata as get_project_metadata_impl
+from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
 
 logger = logging.getLogger("UnrealMCP")
 
@@ -31,8 +32,6 @@ def register_project_tools(mcp: FastMCP):
         Example:
             create_input_mapping(action_name="Jump", key="SpaceBar")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -52,7 +51,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Input mapping creation response: {response}")
+            logger.debug("Input mapping creation response: %s", response)
             return response
 
         except Exception as e:
@@ -80,8 +79,6 @@ def register_project_tools(mcp: FastMCP):
         Example:
             create_enhanced_input_action(action_name="Jump", value_type="Digital")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -102,7 +99,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Enhanced Input Action creation response: {response}")
+            logger.debug("Enhanced Input Action creation response: %s", response)
             return response
 
         except Exception as e:
@@ -128,8 +125,6 @@ def register_project_tools(mcp: FastMCP):
         Example:
             create_input_mapping_context(context_name="Default")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -149,7 +144,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Input Mapping Context creation response: {response}")
+            logger.debug("Input Mapping Context creation response: %s", response)
             return response
 
         except Exception as e:
@@ -187,8 +182,6 @@ def register_project_tools(mcp: FastMCP):
                 key="SpaceBar"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -212,7 +205,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Add mapping to context response: {response}")
+            logger.debug("Add mapping to context response: %s", response)
             return response
 
         except Exception as e:
@@ -242,8 +235,6 @@ def register_project_tools(mcp: FastMCP):
             # Create a regular project folder
             create_folder(folder_path="Intermediate/MyTools")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -261,7 +252,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Folder creation response: {response}")
+            logger.debug("Folder creation response: %s", response)
             return response
 
         except Exception as e:
@@ -351,8 +342,6 @@ def register_project_tools(mcp: FastMCP):
                 description="Categories for inventory items"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -373,7 +362,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Enum creation response: {response}")
+            logger.debug("Enum creation response: %s", response)
             return response
 
         except Exception as e:
@@ -398,8 +387,6 @@ def register_project_tools(mcp: FastMCP):
             path: Path where the enum exists
             description: Optional new description
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -517,8 +504,6 @@ def register_project_tools(mcp: FastMCP):
         Example:
             get_struct_pin_names(struct_name="S_InventorySlot")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -536,7 +521,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Get struct pin names response: {response}")
+            logger.debug("Get struct pin names response: %s", response)
             return response
 
         except Exception as e:
@@ -569,8 +554,6 @@ def register_project_tools(mcp: FastMCP):
                 new_name="WBP_LootSlot"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -592,7 +575,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Duplicate asset response: {response}")
+            logger.debug("Duplicate asset response: %s", response)
             return response
 
         except Exception as e:
@@ -654,8 +637,6 @@ def register_project_tools(mcp: FastMCP):
                 }
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -680,7 +661,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Create FontFace response: {response}")
+            logger.debug("Create FontFace response: %s", response)
             return response
 
         except Exception as e:
@@ -731,8 +712,6 @@ def register_project_tools(mcp: FastMCP):
                 }
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -751,7 +730,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Set FontFace properties response: {response}")
+            logger.debug("Set FontFace properties response: %s", response)
             return response
 
         except Exception as e:
@@ -787,8 +766,6 @@ def register_project_tools(mcp: FastMCP):
             # Get FontFace metadata
             get_font_face_metadata(font_path="/Game/Fonts/FF_DarkFantasy_Regular")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -806,7 +783,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Get FontFace metadata response: {response}")
+            logger.debug("Get FontFace metadata response: %s", response)
             return response
 
         except Exception as e:
@@ -860,8 +837,6 @@ def register_project_tools(mcp: FastMCP):
                 metrics_file_path="E:/code/unreal-mcp/Docs/fonts/DarkFantasy_Regular_metrics.json"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -882,7 +857,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Create offline font response: {response}")
+            logger.debug("Create offline font response: %s", response)
             return response
 
         except Exception as e:
@@ -922,8 +897,6 @@ def register_project_tools(mcp: FastMCP):
             # Get font metadata
             get_font_metadata(font_path="/Game/Fonts/Font_DarkFantasy_Regular")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -941,7 +914,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Get font metadata response: {response}")
+            logger.debug("Get font metadata response: %s", response)
             return response
 
         except Exception as e:
@@ -1023,8 +996,6 @@ def register_project_tools(mcp: FastMCP):
                 metrics_file="E:/fonts/bitmap_metrics.json"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -1076,7 +1047,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Create font response: {response}")
+            logger.debug("Create font response: %s", response)
             return response
 
         except Exception as e:
@@ -1118,8 +1089,6 @@ def register_project_tools(mcp: FastMCP):
             - asset_class: The class used
             - asset_path: Full path to the created asset
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -1142,7 +1111,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Create DataAsset response: {response}")
+            logger.debug("Create DataAsset response: %s", response)
             return response
 
         except Exception as e:
@@ -1194,8 +1163,6 @@ def register_project_tools(mcp: FastMCP):
                 property_value=True
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -1215,7 +1182,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Set DataAsset property response: {response}")
+            logger.debug("Set DataAsset property response: %s", response)
             return response
 
         except Exception as e:
@@ -1247,8 +1214,6 @@ def register_project_tools(mcp: FastMCP):
             # Get metadata for an ability set
             get_data_asset_metadata(asset_path="/Game/Data/DA_AbilitySet_Warrior")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -1266,7 +1231,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Get DataAsset metadata response: {response}")
+            logger.debug("Get DataAsset metadata response: %s", response)
             return response
 
         except Exception as e:
@@ -1312,8 +1277,6 @@ def register_project_tools(mcp: FastMCP):
                 new_name="DT_InventoryItems"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -1332,7 +1295,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Rename asset response: {response}")
+            logger.debug("Rename asset response: %s", response)
             return response
 
         except Exception as e:
@@ -1374,8 +1337,6 @@ def register_project_tools(mcp: FastMCP):
                 destination_folder="/Game/Data/Abilities"
             )
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -1394,7 +1355,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
 
-            logger.info(f"Move asset response: {response}")
+            logger.debug("Move asset response: %s", response)
             return response
 
         except Exception as e:
@@ -1444,8 +1405,6 @@ def register_project_tools(mcp: FastMCP):
             # Find all assets of a specific custom class
             search_assets(asset_class="BossAttackPatternDataAsset")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             if not pattern and not asset_class and not folder:
                 return {"success": False, "message": "At least one of pattern, asset_class, or folder must be provided"}
@@ -1500,8 +1459,6 @@ def register_project_tools(mcp: FastMCP):
             capture_viewport_screenshot()
             capture_viewport_screenshot(output_path="C:/Screenshots/my_screenshot.png")
         """
-        from utils.unreal_connection_utils import get_unreal_engine_connection as get_unreal_connection
-
         try:
             unreal = get_unreal_connection()
             if not unreal:
@@ -29,13 +29,26 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("TestBasicBlueprint")
 
+def recv_exactly(sock: socket.socket, size: int) -> bytearray:
+    """Read exactly size bytes into a preallocated buffer."""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            raise ConnectionError("Connection closed before the full response arrived")
+        received += count
+    return buffer
+
 def send_command(sock: socket.socket, command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Send a command to the Unreal MCP server and get the response."""
     try:
         # Create command object
         command_obj = {
             "type": command,
-            "params": params
+            "params": params,
+            "framed": True
         }
         
         # Convert to JSON and send
@@ -43,27 +56,9 @@ def send_command(sock: socket.socket, command: str, params: Dict[str, Any]) -> O
         logger.info(f"Sending command: {command_json}")
         sock.sendall(command_json.encode('utf-8'))
         
-        # Receive response
-        chunks = []
-        while True:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            chunks.append(chunk)
-            
-            # Try parsing to see if we have a complete response
-            try:
-                data = b''.join(chunks)
-                json.loads(data.decode('utf-8'))
-                # If we can parse it, we have the complete response
-                break
-            except json.JSONDecodeError:
-                # Not a complete JSON object yet, continue receiving
-                continue
-        
-        # Parse response
-        data = b''.join(chunks)
-        response = json.loads(data.decode('utf-8'))
+        # Receive the framed response: a uint32 little-endian byte length, then the body
+        size = int.from_bytes(recv_exactly(sock, 4), 'little')
+        response = json.loads(recv_exactly(sock, size))
         logger.info(f"Received response: {response}")
         return response
         
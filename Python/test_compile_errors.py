@@ -15,7 +15,8 @@ async def send_tcp_command(command_type: str, params: dict):
     try:
         command_data = {
             "type": command_type,
-            "params": params
+            "params": params,
+            "framed": True
         }
         
         json_data = json.dumps(command_data)
@@ -26,8 +27,9 @@ async def send_tcp_command(command_type: str, params: dict):
         writer.write(b'\n')
         await writer.drain()
         
-        response_data = await reader.read(49152)  # Read up to 48KB for detailed errors
-        response_str = response_data.decode('utf-8').strip()
+        # Framed response: a uint32 little-endian byte length, then the body
+        size = int.from_bytes(await reader.readexactly(4), 'little')
+        response_str = (await reader.readexactly(size)).decode('utf-8').strip()
         
         writer.close()
         await writer.wait_closed()
@@ -0,0 +1,92 @@
+"""Tests for finding function call sites in redirect_operations."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.migration import redirect_operations
+
+
+def _bridge_success(result):
+    """A successful response as UnrealMCPBridge sends it."""
+    return {"status": "success", "result": {"success": True, **result}}
+
+
+class BuildFunctionCallIndexTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        (self.root / "Content").mkdir()
+        self.package_file = self.root / "Content" / "BP_Drone.uasset"
+        self.package_file.write_bytes(b"")
+
+        indexes_dir = self.root / "Indexes"
+        indexes_dir.mkdir()
+        patcher = mock.patch("utils.migration.migration_utils.get_indexes_dir", return_value=indexes_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _build(self, response):
+        with mock.patch.object(redirect_operations, "send_unreal_command", return_value=response) as send:
+            result = redirect_operations.build_function_call_index("/Game", force=True)
+        send.assert_called_once_with("build_function_call_index", {"path": "/Game"})
+        return result
+
+    def test_bridge_envelope_is_unwrapped(self):
+        result = self._build(_bridge_success({
+            "root_dir": str(self.root / "Content"),
+            "blueprints": [{
+                "blueprint_path": "/Game/BP_Drone.BP_Drone",
+                "blueprint_name": "BP_Drone",
+                "package_file": str(self.package_file)
+            }],
+            "calls": [{
+                "blueprint_path": "/Game/BP_Drone.BP_Drone",
+                "blueprint_name": "BP_Drone",
+                "graph_name": "EventGraph",
+                "node_id": "NODE1",
+                "node_title": "Pickup Item",
+                "function_name": "PickupItem"
+            }]
+        }))
+
+        self.assertTrue(result["success"])
+        self.assertTrue(result["rebuilt"])
+        self.assertEqual(result["blueprints_indexed"], 1)
+        self.assertEqual(result["call_count"], 1)
+
+        index = redirect_operations.load_function_call_index("/Game")
+        self.assertIsNotNone(index)
+        self.assertEqual([call["node_id"] for call in index["Pickup Item"]], ["NODE1"])
+
+    def test_bridge_error_is_returned(self):
+        response = {"status": "error", "error": "Path not found"}
+        self.assertEqual(self._build(response), response)
+        self.assertIsNone(redirect_operations.load_function_call_index("/Game"))
+
+
+class SearchFunctionCallsTest(unittest.TestCase):
+    def test_pages_until_no_more(self):
+        calls = [{"blueprint_name": f"BP_{i % 3}", "node_id": f"NODE{i}", "graph_name": "EventGraph"}
+                 for i in range(250)]
+
+        def find_in_blueprints(command, params):
+            offset, size = params["offset"], params["max_results"]
+            page = calls[offset:offset + size]
+            has_more = len(page) == size
+            return _bridge_success({"matches": page, "has_more": has_more, "offset": offset,
+                                    **({"next_offset": offset + len(page)} if has_more else {})})
+
+        with mock.patch.object(redirect_operations, "send_unreal_command", side_effect=find_in_blueprints) as send:
+            result = redirect_operations.find_function_call_sites("Pickup Item", "/Game", max_results=None)
+
+        self.assertTrue(result["success"])
+        self.assertEqual([match["node_id"] for match in result["matches"]], [call["node_id"] for call in calls])
+        self.assertEqual(sum(len(matches) for matches in result["by_blueprint"].values()), 250)
+        self.assertEqual([c.args[1]["offset"] for c in send.call_args_list], [0, 100, 200])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,30 +5,34 @@ Unified Unreal MCP Server - Main Entry Point
 This server consolidates all Unreal Engine MCP tools into a single server.
 It registers tools from all specialized modules:
 - Blueprint tools (creation, variables, components)
-- Node tools (graph manipulation, connections)
-- Blueprint action tools (dynamic node discovery, creation)
+- Node tools (graph manipulation, connections), loaded on demand
+- Blueprint action tools (dynamic node discovery, creation), loaded on demand
 - Migration tools (Blueprint-to-C++ migration)
 - Editor tools (actor manipulation)
+
+The on-demand groups are listed by list_tool_groups and registered by
+load_tool_group, so startup does not import them or build their schemas.
 """
 
 # Force unbuffered stdout/stderr for proper MCP stdio transport
 # This MUST be done before any other imports that might write to stdout
 import sys
-import os
-os.environ['PYTHONUNBUFFERED'] = '1'
-# Reopen stdout/stderr in unbuffered mode
-if hasattr(sys.stdout, 'reconfigure'):
-    sys.stdout.reconfigure(line_buffering=False, write_through=True)
-if hasattr(sys.stderr, 'reconfigure'):
-    sys.stderr.reconfigure(line_buffering=False, write_through=True)
+# Switch stdout/stderr to write-through, unless they already are
+for _stream in (sys.stdout, sys.stderr):
+    if getattr(_stream, 'write_through', True) is False:
+        _stream.reconfigure(line_buffering=False, write_through=True)
 
+import asyncio
+import importlib
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import time
+from typing import Dict, List, Any, Optional, Tuple, Union
 from mcp.server.fastmcp import FastMCP, Context
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("UnrealMCP")
+# Logging is off unless UNREAL_MCP_LOG is set, see __main__ below
+logger.addHandler(logging.NullHandler())
 
 # Create the unified MCP server
 mcp = FastMCP(
@@ -37,26 +41,201 @@ mcp = FastMCP(
 )
 
 # Import utilities
-from utils.unreal_connection_utils import send_unreal_command
+from utils.unreal_connection_utils import send_unreal_command_async
+from utils.migration import disk_cache
+from migration_tools.command_params import (
+    CreateBlueprintParams,
+    ExportBlueprintGraphParams,
+    FindBlueprintReferencesParams,
+    GetBlueprintMetadataParams,
+    SetActorTransformParams,
+    SpawnActorParams,
+    SpawnBlueprintActorParams,
+)
 
-# Import and register tool modules (sync pattern)
-from node_tools.node_tools import register_blueprint_node_tools
-from blueprint_action_tools.blueprint_action_tools import register_blueprint_action_tools
 
-# Register core tool modules
-register_blueprint_node_tools(mcp)
-register_blueprint_action_tools(mcp)
+# ============================================================================
+# TOOL GROUPS - Larger tool modules, registered on first use
+# ============================================================================
+
+# Group name -> (module, register function, description)
+TOOL_GROUPS = {
+    "node": (
+        "node_tools.node_tools",
+        "register_blueprint_node_tools",
+        "Blueprint graph node tools: add, connect and inspect nodes"
+    ),
+    "blueprint_action": (
+        "blueprint_action_tools.blueprint_action_tools",
+        "register_blueprint_action_tools",
+        "Blueprint action tools: discover actions and create nodes by action name"
+    ),
+}
+
+_loaded_tool_groups = set()
+
+
+def register_tool_group(group: str) -> bool:
+    """Import a tool group's module and register its tools; returns False if it was already loaded."""
+    if group in _loaded_tool_groups:
+        return False
+    module_name, register_name, _ = TOOL_GROUPS[group]
+    register = getattr(importlib.import_module(module_name), register_name)
+    register(mcp)
+    _loaded_tool_groups.add(group)
+    logger.info("Registered tool group: %s", group)
+    return True
+
+
+@mcp.tool()
+def list_tool_groups(ctx: Context) -> dict:
+    """
+    List the tool groups that can be loaded with load_tool_group.
+
+    Returns:
+        Dict with groups: a list of {name, description, loaded}
+    """
+    return {
+        "success": True,
+        "groups": [
+            {"name": name, "description": description, "loaded": name in _loaded_tool_groups}
+            for name, (_, _, description) in TOOL_GROUPS.items()
+        ]
+    }
+
+
+@mcp.tool()
+async def load_tool_group(ctx: Context, group: str) -> dict:
+    """
+    Load a tool group so its tools become available.
+
+    Clients are notified that the tool list changed; see list_tool_groups
+    for the available groups.
+
+    Args:
+        group: Name of the group, e.g. "node" or "blueprint_action"
+    """
+    if group not in TOOL_GROUPS:
+        return {"success": False, "error": f"Unknown tool group '{group}'. Available: {', '.join(TOOL_GROUPS)}"}
+
+    if register_tool_group(group):
+        await ctx.session.send_tool_list_changed()
+    return {"success": True, "group": group}
+
+
+# ============================================================================
+# REFERENCE CACHE - Reference and dependency queries scan the whole project in
+# Unreal and are repeated throughout a migration, so their results are kept
+# briefly; any Blueprint change made through this server drops them
+# ============================================================================
+
+REFERENCE_CACHE_TTL = 30.0
+
+# (tool, *arguments, generation) -> (expiry, response)
+_ref_cache: Dict[tuple, Tuple[float, dict]] = {}
+
+# Part of every key, so a query that was in flight during a change is not cached
+_mutation_generation = 0
+
+# Queries whose results are also kept on disk across restarts, see disk_cache
+PERSISTED_COMMANDS = frozenset({"find_blueprint_references"})
+
+
+def _is_error(response: dict) -> bool:
+    return response.get("status") == "error" or response.get("success") is False
+
+
+def _cache_get(key: tuple) -> Optional[dict]:
+    entry = _ref_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _ref_cache[key]
+        return None
+    return entry[1]
+
+
+def _cache_put(key: tuple, response: dict) -> None:
+    if _is_error(response):
+        return
+    if key[-1] == _mutation_generation:
+        _ref_cache[key] = (time.monotonic() + REFERENCE_CACHE_TTL, response)
+
+
+async def _cached_command(key: tuple, command_name: str, params: dict) -> dict:
+    response = _cache_get(key)
+    if response is not None:
+        return response
+
+    disk_key = None
+    if command_name in PERSISTED_COMMANDS:
+        # Fingerprinting the Content directory walks it, so keep it off the event loop
+        disk_key = await asyncio.to_thread(disk_cache.cache_key, command_name, params)
+        response = await asyncio.to_thread(disk_cache.get, disk_key)
+
+    if response is None:
+        response = await send_unreal_command_async(command_name, params)
+        if disk_key and not _is_error(response) and key[-1] == _mutation_generation:
+            await asyncio.to_thread(disk_cache.put, disk_key, response)
+    _cache_put(key, response)
+    return response
+
+
+def _dependencies_request(
+    blueprint_path: str,
+    include_engine_classes: bool = False,
+    recursive: bool = True
+) -> Tuple[tuple, str, dict]:
+    """Cache key, command and params of a get_blueprint_dependencies query."""
+    key = ("get_blueprint_dependencies", blueprint_path, include_engine_classes, recursive, _mutation_generation)
+    return key, "get_blueprint_dependencies", {
+        "blueprint_path": blueprint_path,
+        "include_engine_classes": include_engine_classes,
+        "recursive": recursive
+    }
+
+
+def _references_request(
+    target_path: str,
+    target_function: str = "",
+    search_scope: str = "project",
+    include_soft_references: bool = True
+) -> Tuple[tuple, str, dict]:
+    """Cache key, command and params of a find_blueprint_references query."""
+    params = FindBlueprintReferencesParams(
+        target_path=target_path,
+        search_scope=search_scope,
+        include_soft_references=include_soft_references,
+        target_function=target_function or None
+    )
+    key = ("find_blueprint_references", params.target_path, target_function, search_scope,
+           include_soft_references, _mutation_generation)
+    return key, params.command, params.to_params()
+
+
+def _forget_cached_references() -> None:
+    """Forget the queries cached in memory; the redirect operations clear the disk cache themselves."""
+    global _mutation_generation
+    _mutation_generation += 1
+    _ref_cache.clear()
+
+
+async def _invalidate_reference_cache() -> None:
+    """Forget cached queries and function call indexes after a change that can affect them."""
+    from utils.migration.redirect_operations import invalidate_function_call_index
+
+    _forget_cached_references()
+    # Deleting the cache files is disk work; keep it off the event loop
+    await asyncio.to_thread(disk_cache.invalidate)
+    await asyncio.to_thread(invalidate_function_call_index)
 
 
 # ============================================================================
 # MIGRATION REDIRECT TOOLS - Blueprint-to-C++ function redirection
 # ============================================================================
 
-from utils.migration.redirect_operations import (
-    redirect_blueprint_function_calls,
-    verify_no_external_references,
-    get_node_connections as get_node_connections_impl
-)
+# utils.migration.redirect_operations is imported by the tools themselves, so
+# sessions that never redirect do not load it
 
 
 @mcp.tool()
@@ -68,7 +247,8 @@ def redirect_blueprint_function_call(
     pin_mapping: dict = None,
     blueprint_filter: str = "/Game",
     specific_blueprints: list = None,
-    dry_run: bool = True
+    dry_run: Union[bool, str] = True,
+    use_index: bool = False
 ) -> dict:
     """
     Redirect Blueprint function calls to C++ function calls across multiple Blueprints.
@@ -77,7 +257,9 @@ def redirect_blueprint_function_call(
     function (by display title, e.g., "Pickup Item") and replaces them with calls to a
     C++ function, preserving pin connections.
 
-    IMPORTANT: Always run with dry_run=True first to preview changes!
+    IMPORTANT: Always preview changes first! dry_run="preview_then_prompt" previews
+    like dry_run=True and also returns a plan_digest; commit_redirect_plan(plan_digest)
+    then applies exactly the previewed redirects without searching the project again.
 
     Args:
         source_function_title: Display title of the BP function to replace (e.g., "Pickup Item")
@@ -91,12 +273,17 @@ def redirect_blueprint_function_call(
         specific_blueprints: Optional list of specific Blueprint names to process.
                            If provided, only these Blueprints will be modified.
         dry_run: If True (default), only preview changes without applying them.
+                "preview_then_prompt" previews and keeps the plan for commit_redirect_plan.
                 Set to False to actually perform the redirect.
+        use_index: Find call sites in the index of build_function_call_index instead of
+                  searching every Blueprint in Unreal. Only use it when every Blueprint
+                  is saved: the index misses calls added in the editor since.
 
     Returns:
         Dict with:
         - success: Overall success
         - dry_run: Whether this was a preview
+        - plan_digest: Plan to commit (only with dry_run="preview_then_prompt")
         - source_function: The function being redirected
         - target_function: The C++ replacement (class::function)
         - blueprints_affected: Number of Blueprints with changes
@@ -122,16 +309,150 @@ def redirect_blueprint_function_call(
             pin_mapping={"Item Pickup": "ItemPickup"},
             dry_run=False
         )
+
+        # Preview once, then apply the same plan
+        preview = redirect_blueprint_function_call(
+            source_function_title="Pickup Item",
+            target_class="ConstructionDroneBase",
+            target_function="PickupItem",
+            dry_run="preview_then_prompt"
+        )
+        commit_redirect_plan(digest=preview["plan_digest"])
     """
-    return redirect_blueprint_function_calls(
+    from utils.migration.redirect_operations import redirect_blueprint_function_calls
+
+    result = redirect_blueprint_function_calls(
         source_function_title=source_function_title,
         target_class=target_class,
         target_function=target_function,
         pin_mapping=pin_mapping or {},
         blueprint_filter=blueprint_filter,
         specific_blueprints=specific_blueprints,
-        dry_run=dry_run
+        dry_run=dry_run,
+        use_index=use_index
     )
+    if not dry_run:
+        _forget_cached_references()
+    return result
+
+
+@mcp.tool()
+def commit_redirect_plan(ctx: Context, digest: str) -> dict:
+    """
+    Apply a redirect previewed with redirect_blueprint_function_call(dry_run="preview_then_prompt").
+
+    Redirects exactly the call sites listed in the preview, without searching the
+    project again. A plan can be committed once, within 60 seconds of the preview.
+
+    Args:
+        digest: The plan_digest returned by the preview
+
+    Returns:
+        Dict with success, blueprints_affected, nodes_redirected,
+        results_by_blueprint and errors, as for a redirect with dry_run=False
+    """
+    from utils.migration.redirect_operations import commit_redirect_plan as commit_redirect_plan_impl
+
+    result = commit_redirect_plan_impl(digest)
+    _forget_cached_references()
+    return result
+
+
+@mcp.tool()
+def redirect_blueprint_function_calls_batch(
+    ctx: Context,
+    redirects: list,
+    blueprint_filter: str = "/Game",
+    specific_blueprints: list = None,
+    dry_run: bool = True,
+    use_index: bool = False
+) -> dict:
+    """
+    Redirect calls to several Blueprint functions to C++ in a single pass.
+
+    Use instead of repeated redirect_blueprint_function_call calls when migrating
+    many functions of one class: each affected Blueprint is visited and compiled
+    once for the whole batch.
+
+    IMPORTANT: Always run with dry_run=True first to preview changes!
+
+    Args:
+        redirects: List of redirects, each a dict with:
+                  - source_function_title: Display title of the BP function
+                  - target_class: C++ class containing the replacement function
+                  - target_function: Name of the C++ function
+                  - pin_mapping: Optional dict mapping old pin names to new names
+        blueprint_filter: Content path to search (default: "/Game")
+        specific_blueprints: Optional list of specific Blueprint names to process.
+        dry_run: If True (default), only preview changes without applying them.
+        use_index: Find call sites in the index of build_function_call_index, as for
+                  redirect_blueprint_function_call.
+
+    Returns:
+        Dict with:
+        - success: Overall success
+        - dry_run: Whether this was a preview
+        - blueprints_affected: Number of Blueprints with changes
+        - nodes_redirected: Total nodes redirected (or would be)
+        - results_by_redirect: Target and node count per source function
+        - results_by_blueprint: Detailed results per Blueprint
+        - errors: Any errors encountered
+
+    Example:
+        redirect_blueprint_function_calls_batch(
+            redirects=[
+                {"source_function_title": "Pickup Item", "target_class": "ConstructionDroneBase",
+                 "target_function": "PickupItem", "pin_mapping": {"Item Pickup": "ItemPickup"}},
+                {"source_function_title": "Drop Item", "target_class": "ConstructionDroneBase",
+                 "target_function": "DropItem"}
+            ],
+            dry_run=True
+        )
+    """
+    from utils.migration.redirect_operations import redirect_many
+
+    result = redirect_many(
+        redirects=redirects,
+        blueprint_filter=blueprint_filter,
+        specific_blueprints=specific_blueprints,
+        dry_run=dry_run,
+        use_index=use_index
+    )
+    if not dry_run:
+        _forget_cached_references()
+    return result
+
+
+@mcp.tool()
+def build_function_call_index(
+    ctx: Context,
+    blueprint_filter: str = "/Game",
+    force: bool = False
+) -> dict:
+    """
+    Build a persistent index of every Blueprint function call site under a content path.
+
+    With use_index=True, redirect_blueprint_function_call and redirect_blueprint_function_calls_batch
+    look call sites up in the index instead of searching every Blueprint in Unreal.
+    The index is built from saved packages: it is ignored once a Blueprint under the
+    path is saved or assets are added or removed, and discarded by every change made
+    through this server, but it cannot see unsaved edits made in the editor.
+
+    Args:
+        blueprint_filter: Content path to index (default: "/Game")
+        force: Rebuild even if the existing index is still up to date
+
+    Returns:
+        Dict with:
+        - success: Whether the index is available
+        - rebuilt: False if an up to date index was reused
+        - functions_indexed: Number of distinct function node titles
+        - call_count: Number of call sites indexed
+        - index_path: Where the index is stored
+    """
+    from utils.migration.redirect_operations import build_function_call_index as build_function_call_index_impl
+
+    return build_function_call_index_impl(blueprint_filter, force)
 
 
 @mcp.tool()
@@ -159,7 +480,14 @@ def verify_function_references(
         - remaining_refs_count: Number of external references found
         - remaining_refs: List of Blueprints still referencing the function
     """
-    return verify_no_external_references(blueprint_path, function_name)
+    from utils.migration.redirect_operations import verify_no_external_references
+
+    key = ("verify_function_references", blueprint_path, function_name, _mutation_generation)
+    result = _cache_get(key)
+    if result is None:
+        result = verify_no_external_references(blueprint_path, function_name)
+        _cache_put(key, result)
+    return result
 
 
 @mcp.tool()
@@ -189,6 +517,8 @@ def inspect_node_connections(
         - input_connections: List of input connections
         - output_connections: List of output connections
     """
+    from utils.migration.redirect_operations import get_node_connections as get_node_connections_impl
+
     return get_node_connections_impl(blueprint_name, node_id, graph_name)
 
 
@@ -197,45 +527,44 @@ def inspect_node_connections(
 # ============================================================================
 
 @mcp.tool()
-def export_blueprint_graph(
+async def export_blueprint_graph(
     ctx: Context,
     blueprint_path: str,
     graph_name: str = "",
     include_components: bool = True,
-    include_defaults: bool = False
+    include_defaults: bool = False,
+    stream: bool = True
 ) -> dict:
     """
     Export a complete Blueprint graph to a JSON file.
 
-    The JSON is written to Saved/UnrealMCP/Exports/.
+    The JSON is written to Saved/UnrealMCP/Exports/. With stream (the default)
+    Unreal writes it as newline-delimited records while walking the graph and
+    only the file path and counts (graphs, nodes, edges, bytes) are returned.
     """
-    params = {
-        "blueprint_path": blueprint_path,
-        "include_components": include_components,
-        "include_defaults": include_defaults
-    }
-    if graph_name:
-        params["graph_name"] = graph_name
-    return send_unreal_command("export_blueprint_graph", params)
+    params = ExportBlueprintGraphParams(
+        blueprint_path=blueprint_path,
+        include_components=include_components,
+        include_defaults=include_defaults,
+        graph_name=graph_name or None,
+        stream=stream
+    )
+    return await send_unreal_command_async(params.command, params.to_params())
 
 
 @mcp.tool()
-def get_blueprint_dependencies(
+async def get_blueprint_dependencies(
     ctx: Context,
     blueprint_path: str,
     include_engine_classes: bool = False,
     recursive: bool = True
 ) -> dict:
     """Get all dependencies of a Blueprint."""
-    return send_unreal_command("get_blueprint_dependencies", {
-        "blueprint_path": blueprint_path,
-        "include_engine_classes": include_engine_classes,
-        "recursive": recursive
-    })
+    return await _cached_command(*_dependencies_request(blueprint_path, include_engine_classes, recursive))
 
 
 @mcp.tool()
-def find_blueprint_references(
+async def find_blueprint_references(
     ctx: Context,
     target_path: str,
     target_function: str = "",
@@ -243,18 +572,12 @@ def find_blueprint_references(
     include_soft_references: bool = True
 ) -> dict:
     """Find all assets/Blueprints that reference a given Blueprint or function."""
-    params = {
-        "target_path": target_path,
-        "search_scope": search_scope,
-        "include_soft_references": include_soft_references
-    }
-    if target_function:
-        params["target_function"] = target_function
-    return send_unreal_command("find_blueprint_references", params)
+    return await _cached_command(*_references_request(
+        target_path, target_function, search_scope, include_soft_references))
 
 
 @mcp.tool()
-def delete_blueprint_function(
+async def delete_blueprint_function(
     ctx: Context,
     blueprint_path: str,
     function_name: str,
@@ -266,15 +589,17 @@ def delete_blueprint_function(
     Use during Blueprint cleanup to remove functions migrated to C++.
     Always verify no external references remain first using verify_function_references.
     """
-    return send_unreal_command("delete_blueprint_function", {
+    response = await send_unreal_command_async("delete_blueprint_function", {
         "blueprint_path": blueprint_path,
         "function_name": function_name,
         "backup": backup
     })
+    await _invalidate_reference_cache()
+    return response
 
 
 @mcp.tool()
-def set_blueprint_parent_class(
+async def set_blueprint_parent_class(
     ctx: Context,
     blueprint_path: str,
     new_parent_class: str,
@@ -285,57 +610,138 @@ def set_blueprint_parent_class(
 
     Use during migration to reparent a Blueprint to a new C++ class.
     """
-    return send_unreal_command("set_blueprint_parent_class", {
+    response = await send_unreal_command_async("set_blueprint_parent_class", {
         "blueprint_path": blueprint_path,
         "new_parent_class": new_parent_class,
         "backup": backup
     })
+    await _invalidate_reference_cache()
+    return response
 
 
 @mcp.tool()
-def get_blueprint_functions(
+async def get_blueprint_functions(
     ctx: Context,
     blueprint_path: str,
     include_inherited: bool = False
 ) -> dict:
     """Get a list of all functions defined in a Blueprint."""
-    return send_unreal_command("get_blueprint_functions", {
+    return await send_unreal_command_async("get_blueprint_functions", {
         "blueprint_path": blueprint_path,
         "include_inherited": include_inherited
     })
 
 
+BUNDLE_SECTIONS = ("metadata", "functions", "dependencies", "references")
+
+
+@mcp.tool()
+async def get_blueprint_bundle(
+    ctx: Context,
+    blueprint_path: str,
+    include: list = None
+) -> dict:
+    """
+    Get a Blueprint's metadata, functions, dependencies and references in one round trip.
+
+    Use instead of calling get_blueprint_metadata, get_blueprint_functions,
+    get_blueprint_dependencies and find_blueprint_references one after another.
+    The queries run back to back in Unreal as one batched command; dependencies and
+    references already cached by this server are not asked for again.
+
+    Args:
+        blueprint_path: Path to the Blueprint
+        include: Sections to return, any of "metadata", "functions",
+                 "dependencies" and "references" (default: all)
+
+    Returns:
+        Dict with one key per requested section holding that query's response,
+        plus success and an errors dict of the sections that failed
+    """
+    sections = list(include or BUNDLE_SECTIONS)
+    unknown = [section for section in sections if section not in BUNDLE_SECTIONS]
+    if unknown:
+        return {"status": "error", "error": f"Unknown sections {unknown}; expected any of {list(BUNDLE_SECTIONS)}"}
+
+    results = {}
+    commands = []
+    pending = []
+    for section in sections:
+        if section == "metadata":
+            params = GetBlueprintMetadataParams(blueprint_name=blueprint_path)
+            key, command_name, command_params = None, params.command, params.to_params()
+        elif section == "functions":
+            key, command_name, command_params = None, "get_blueprint_functions", {"blueprint_path": blueprint_path}
+        elif section == "dependencies":
+            key, command_name, command_params = _dependencies_request(blueprint_path)
+        else:
+            key, command_name, command_params = _references_request(blueprint_path)
+
+        cached = _cache_get(key) if key else None
+        if cached is not None:
+            # Cached as the bridge answers a single query, in its "result" envelope
+            results[section] = cached.get("result", cached)
+        else:
+            commands.append({"type": command_name, "params": command_params})
+            pending.append((section, key))
+
+    if commands:
+        response = await send_unreal_command_async("batch_migration_commands", {"commands": commands})
+        # Nested under "result" when every query succeeded, flattened otherwise
+        payload = response.get("result", response)
+        if "results" not in payload:
+            return response
+        for (section, key), result in zip(pending, payload["results"]):
+            result.pop("command", None)
+            results[section] = result
+            if key and not _is_error(result):
+                # Wrapped like a direct response, as the individual tools return these
+                _cache_put(key, {"status": "success", "result": result})
+
+    errors = {
+        section: result.get("error", "Unknown error")
+        for section, result in results.items()
+        if result.get("success") is False or result.get("status") == "error"
+    }
+    return {
+        "success": not errors,
+        "blueprint_path": blueprint_path,
+        **{section: results[section] for section in sections if section in results},
+        "errors": errors
+    }
+
+
 # ============================================================================
 # BLUEPRINT TOOLS - Blueprint class and variable management
 # ============================================================================
 
 @mcp.tool()
-def create_blueprint(
+async def create_blueprint(
     ctx: Context,
     name: str,
     parent_class: str,
     folder_path: str = ""
 ) -> dict:
     """Create a new Blueprint class."""
-    params = {"name": name, "parent_class": parent_class}
-    if folder_path:
-        params["folder_path"] = folder_path
-    return send_unreal_command("create_blueprint", params)
+    params = CreateBlueprintParams(name=name, parent_class=parent_class, folder_path=folder_path or None)
+    response = await send_unreal_command_async(params.command, params.to_params())
+    await _invalidate_reference_cache()
+    return response
 
 
 @mcp.tool()
-def compile_blueprint(ctx: Context, blueprint_name: str) -> dict:
+async def compile_blueprint(ctx: Context, blueprint_name: str) -> dict:
     """
     Compile a Blueprint with enhanced error reporting.
 
     Returns detailed compilation error information including node-level,
     graph-level, and Blueprint-level errors.
     """
-    return send_unreal_command("compile_blueprint", {"blueprint_name": blueprint_name})
+    return await send_unreal_command_async("compile_blueprint", {"blueprint_name": blueprint_name})
 
 
 @mcp.tool()
-def get_blueprint_metadata(
+async def get_blueprint_metadata(
     ctx: Context,
     blueprint_name: str,
     fields: list = None,
@@ -360,24 +766,20 @@ def get_blueprint_metadata(
         detail_level: Detail level for "graph_nodes": "summary", "flow", or "full"
         component_name: Required when using "component_properties" field
     """
-    params = {"blueprint_name": blueprint_name}
-    if fields:
-        params["fields"] = fields
-    if graph_name:
-        params["graph_name"] = graph_name
-    if node_type:
-        params["node_type"] = node_type
-    if event_type:
-        params["event_type"] = event_type
-    if detail_level:
-        params["detail_level"] = detail_level
-    if component_name:
-        params["component_name"] = component_name
-    return send_unreal_command("get_blueprint_metadata", params)
+    params = GetBlueprintMetadataParams(
+        blueprint_name=blueprint_name,
+        fields=fields or None,
+        graph_name=graph_name or None,
+        node_type=node_type or None,
+        event_type=event_type or None,
+        detail_level=detail_level or None,
+        component_name=component_name or None
+    )
+    return await send_unreal_command_async(params.command, params.to_params())
 
 
 @mcp.tool()
-def add_blueprint_variable(
+async def add_blueprint_variable(
     ctx: Context,
     blueprint_name: str,
     variable_name: str,
@@ -385,25 +787,29 @@ def add_blueprint_variable(
     is_exposed: bool = False
 ) -> dict:
     """Add a variable to a Blueprint."""
-    return send_unreal_command("add_blueprint_variable", {
+    response = await send_unreal_command_async("add_blueprint_variable", {
         "blueprint_name": blueprint_name,
         "variable_name": variable_name,
         "variable_type": variable_type,
         "is_exposed": is_exposed
     })
+    await _invalidate_reference_cache()
+    return response
 
 
 @mcp.tool()
-def delete_blueprint_variable(
+async def delete_blueprint_variable(
     ctx: Context,
     blueprint_name: str,
     variable_name: str
 ) -> dict:
     """Delete a variable from a Blueprint."""
-    return send_unreal_command("delete_blueprint_variable", {
+    response = await send_unreal_command_async("delete_blueprint_variable", {
         "blueprint_name": blueprint_name,
         "variable_name": variable_name
     })
+    await _invalidate_reference_cache()
+    return response
 
 
 # ============================================================================
@@ -411,19 +817,19 @@ def delete_blueprint_variable(
 # ============================================================================
 
 @mcp.tool()
-def get_actors_in_level(ctx: Context) -> dict:
+async def get_actors_in_level(ctx: Context) -> dict:
     """Get a list of all actors in the current level."""
-    return send_unreal_command("get_actors_in_level", {})
+    return await send_unreal_command_async("get_actors_in_level", {})
 
 
 @mcp.tool()
-def find_actors_by_name(ctx: Context, pattern: str) -> dict:
+async def find_actors_by_name(ctx: Context, pattern: str) -> dict:
     """Find actors by name pattern."""
-    return send_unreal_command("find_actors_by_name", {"pattern": pattern})
+    return await send_unreal_command_async("find_actors_by_name", {"pattern": pattern})
 
 
 @mcp.tool()
-def spawn_actor(
+async def spawn_actor(
     ctx: Context,
     name: str,
     actor_type: str,
@@ -431,16 +837,12 @@ def spawn_actor(
     rotation: list = None
 ) -> dict:
     """Spawn a new actor in the level."""
-    params = {"name": name, "type": actor_type}
-    if location:
-        params["location"] = location
-    if rotation:
-        params["rotation"] = rotation
-    return send_unreal_command("spawn_actor", params)
+    params = SpawnActorParams(name=name, type=actor_type, location=location or None, rotation=rotation or None)
+    return await send_unreal_command_async(params.command, params.to_params())
 
 
 @mcp.tool()
-def spawn_blueprint_actor(
+async def spawn_blueprint_actor(
     ctx: Context,
     blueprint_name: str,
     actor_name: str,
@@ -448,22 +850,23 @@ def spawn_blueprint_actor(
     rotation: list = None
 ) -> dict:
     """Spawn an actor from a Blueprint."""
-    params = {"blueprint_name": blueprint_name, "actor_name": actor_name}
-    if location:
-        params["location"] = location
-    if rotation:
-        params["rotation"] = rotation
-    return send_unreal_command("spawn_blueprint_actor", params)
+    params = SpawnBlueprintActorParams(
+        blueprint_name=blueprint_name,
+        actor_name=actor_name,
+        location=location or None,
+        rotation=rotation or None
+    )
+    return await send_unreal_command_async(params.command, params.to_params())
 
 
 @mcp.tool()
-def delete_actor(ctx: Context, name: str) -> dict:
+async def delete_actor(ctx: Context, name: str) -> dict:
     """Delete an actor by name."""
-    return send_unreal_command("delete_actor", {"name": name})
+    return await send_unreal_command_async("delete_actor", {"name": name})
 
 
 @mcp.tool()
-def set_actor_transform(
+async def set_actor_transform(
     ctx: Context,
     name: str,
     location: list = None,
@@ -471,15 +874,19 @@ def set_actor_transform(
     scale: list = None
 ) -> dict:
     """Set the transform of an actor."""
-    params = {"name": name}
-    if location:
-        params["location"] = location
-    if rotation:
-        params["rotation"] = rotation
-    if scale:
-        params["scale"] = scale
-    return send_unreal_command("set_actor_transform", params)
+    params = SetActorTransformParams(
+        name=name,
+        location=location or None,
+        rotation=rotation or None,
+        scale=scale or None
+    )
+    return await send_unreal_command_async(params.command, params.to_params())
 
 
 if __name__ == "__main__":
+    # Configure logging (to stderr, stdout carries the MCP stdio transport)
+    if os.environ.get("UNREAL_MCP_LOG"):
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("{asctime} {name} {levelname}: {message}", style='{'))
+        logging.basicConfig(level=logging.INFO, handlers=[handler])
     mcp.run(transport='stdio')
@@ -422,7 +422,8 @@ def find_in_blueprints(
     search_type: str = "all",
     path: str = "/Game",
     max_results: int = 50,
-    case_sensitive: bool = False
+    case_sensitive: bool = False,
+    offset: int = 0
 ) -> Dict[str, Any]:
     """
     Search for function/variable/event usages across all blueprints.
@@ -437,6 +438,7 @@ def find_in_blueprints(
         path: Content path to search in (default: "/Game")
         max_results: Maximum number of results to return (default: 50, max: 500)
         case_sensitive: Whether to perform case-sensitive search (default: False)
+        offset: Number of matches to skip, to fetch the page after a previous search (default: 0)
 
     Returns:
         Dict containing:
@@ -445,6 +447,9 @@ def find_in_blueprints(
             - search_type: The type filter applied
             - blueprints_searched: Number of blueprints searched
             - match_count: Number of matches found
+            - offset: Number of matches skipped
+            - has_more: Whether more matches may follow this page
+            - next_offset: offset for the next page, when has_more is set
             - matches: Array of match objects with:
                 - blueprint_path: Full path to the blueprint
                 - blueprint_name: Name of the blueprint
@@ -460,7 +465,8 @@ def find_in_blueprints(
         "search_type": search_type,
         "path": path,
         "max_results": max_results,
-        "case_sensitive": case_sensitive
+        "case_sensitive": case_sensitive,
+        "offset": offset
     }
 
     command_result = send_unreal_command("find_in_blueprints", params)
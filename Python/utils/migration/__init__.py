@@ -5,31 +5,50 @@ This module provides helper functions for parsing Blueprint exports,
 generating codemaps, creating C++ code, and redirecting function calls.
 """
 
-from .migration_utils import (
-    CodemapBuilder,
-    CppGenerator,
-    find_latest_export,
-    load_blueprint_export,
-    map_blueprint_type_to_cpp,
-    create_migration_status,
-    save_migration_status,
-    load_migration_status,
-    update_migration_step,
-    get_exports_dir,
-    get_analysis_dir,
-    get_codemaps_dir,
-    get_generated_dir,
-    get_migrations_dir,
-)
-
-from .redirect_operations import (
-    redirect_blueprint_function_calls,
-    redirect_single_node,
-    verify_no_external_references,
-    get_node_connections,
-    find_blueprint_function_calls,
-    apply_pin_mapping,
-)
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so servers that
+# never run a migration do not pay for loading them
+_LAZY = {
+    # Migration utilities
+    'CodemapBuilder': 'migration_utils',
+    'CppGenerator': 'migration_utils',
+    'find_latest_export': 'migration_utils',
+    'load_blueprint_export': 'migration_utils',
+    'load_export_file': 'migration_utils',
+    'expand_interned_strings': 'migration_utils',
+    'expand_node_columns': 'migration_utils',
+    'iter_chunked_export': 'migration_utils',
+    'iter_ndjson_export': 'migration_utils',
+    'restore_input_connections': 'migration_utils',
+    'map_blueprint_type_to_cpp': 'migration_utils',
+    'create_migration_status': 'migration_utils',
+    'save_migration_status': 'migration_utils',
+    'load_migration_status': 'migration_utils',
+    'update_migration_step': 'migration_utils',
+    'get_exports_dir': 'migration_utils',
+    'get_analysis_dir': 'migration_utils',
+    'get_codemaps_dir': 'migration_utils',
+    'get_generated_dir': 'migration_utils',
+    'get_migrations_dir': 'migration_utils',
+    'get_indexes_dir': 'migration_utils',
+    'get_cache_dir': 'migration_utils',
+    # Redirect operations
+    'redirect_blueprint_function_calls': 'redirect_operations',
+    'redirect_many': 'redirect_operations',
+    'commit_redirect_plan': 'redirect_operations',
+    'redirect_single_node': 'redirect_operations',
+    'get_graph_nodes': 'redirect_operations',
+    'verify_no_external_references': 'redirect_operations',
+    'get_node_connections': 'redirect_operations',
+    'find_blueprint_function_calls': 'redirect_operations',
+    'apply_pin_mapping': 'redirect_operations',
+    'build_function_call_index': 'redirect_operations',
+    'load_function_call_index': 'redirect_operations',
+    'search_function_call_index': 'redirect_operations',
+    'find_function_call_sites': 'redirect_operations',
+    'invalidate_function_call_index': 'redirect_operations',
+}
 
 __all__ = [
     # Migration utilities
@@ -37,6 +56,12 @@ __all__ = [
     'CppGenerator',
     'find_latest_export',
     'load_blueprint_export',
+    'load_export_file',
+    'expand_interned_strings',
+    'expand_node_columns',
+    'iter_chunked_export',
+    'iter_ndjson_export',
+    'restore_input_connections',
     'map_blueprint_type_to_cpp',
     'create_migration_status',
     'save_migration_status',
@@ -47,11 +72,34 @@ __all__ = [
     'get_codemaps_dir',
     'get_generated_dir',
     'get_migrations_dir',
+    'get_indexes_dir',
+    'get_cache_dir',
     # Redirect operations
     'redirect_blueprint_function_calls',
+    'redirect_many',
+    'commit_redirect_plan',
     'redirect_single_node',
+    'get_graph_nodes',
     'verify_no_external_references',
     'get_node_connections',
     'find_blueprint_function_calls',
     'apply_pin_mapping',
+    'build_function_call_index',
+    'load_function_call_index',
+    'search_function_call_index',
+    'find_function_call_sites',
+    'invalidate_function_call_index',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
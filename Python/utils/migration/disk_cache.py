@@ -0,0 +1,134 @@
+"""
+Persistent cache for reference scan results.
+
+Scans like verify_no_external_references and find_blueprint_references only
+change when Blueprints change, so their results are kept across server
+restarts under Saved/UnrealMCP/Cache, one gzipped JSON file per query.
+
+Every key includes a fingerprint of the project's Content directory (path,
+size and modification time of each file), taken again at most every
+FINGERPRINT_TTL seconds. So entries written before an asset was saved, added
+or removed in the editor become unreachable within that time. Changes made
+through the MCP tools may not be saved yet; those call invalidate(), which
+clears the cache at once.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("UnrealMCP.Migration")
+
+CACHE_VERSION = 1
+
+# Seconds a Content directory fingerprint is trusted before the directory is walked again
+FINGERPRINT_TTL = 30.0
+
+_lock = threading.Lock()
+_content_dir: Optional[str] = None
+_fingerprint: Optional[str] = None
+_fingerprint_expiry = 0.0
+
+
+def _get_content_dir() -> Optional[str]:
+    """The project's Content directory, asked of Unreal once per process."""
+    global _content_dir
+    if _content_dir is None:
+        from utils.unreal_connection_utils import send_unreal_command
+
+        response = send_unreal_command("get_project_dir", {})
+        # The bridge nests a successful command's fields under "result"
+        result = response.get("result", response)
+        project_dir = result.get("project_dir") if result.get("success") else None
+        if not project_dir:
+            return None
+        _content_dir = os.path.join(project_dir, "Content")
+    return _content_dir
+
+
+def _get_fingerprint() -> Optional[str]:
+    """Hash of the Content directory listing, recomputed after FINGERPRINT_TTL or invalidate()."""
+    global _fingerprint, _fingerprint_expiry
+    with _lock:
+        if _fingerprint is None or time.monotonic() >= _fingerprint_expiry:
+            content_dir = _get_content_dir()
+            if not content_dir or not os.path.isdir(content_dir):
+                return None
+
+            digest = hashlib.sha1()
+            for dirpath, dirnames, filenames in os.walk(content_dir):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    digest.update(f"{os.path.relpath(path, content_dir)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+            _fingerprint = digest.hexdigest()
+            _fingerprint_expiry = time.monotonic() + FINGERPRINT_TTL
+        return _fingerprint
+
+
+def _cache_path(key: str) -> str:
+    from .migration_utils import get_cache_dir
+
+    return os.path.join(get_cache_dir(), f"{key}.json.gz")
+
+
+def cache_key(command: str, params: Dict[str, Any]) -> Optional[str]:
+    """
+    Key of a query for get and put, or None if the Content directory cannot be
+    located, in which case nothing should be cached.
+    """
+    fingerprint = _get_fingerprint()
+    if fingerprint is None:
+        return None
+    payload = json.dumps([CACHE_VERSION, command, params, fingerprint], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get(key: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Cached result for key, if any."""
+    if key is None:
+        return None
+    try:
+        with gzip.open(_cache_path(key), "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def put(key: Optional[str], value: Dict[str, Any]) -> None:
+    """Store a result; failed queries should not be cached."""
+    if key is None:
+        return
+    path = _cache_path(key)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(value, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write reference cache entry: {e}")
+
+
+def invalidate() -> None:
+    """Drop every cached result and fingerprint the Content directory again on next use."""
+    global _fingerprint
+    from .migration_utils import get_cache_dir
+
+    with _lock:
+        _fingerprint = None
+        cache_dir = get_cache_dir()
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(".json.gz"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
@@ -13,11 +13,36 @@ IMPORTANT: The goal is to replace Blueprint LOGIC with C++, NOT delete the Bluep
 See BlueprintExports/BLUEPRINT_TO_CPP_WORKFLOW.md for detailed patterns.
 """
 
+import io
 import json
 import os
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
+from string import Template
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    # Shared instances, rather than a new decoder/encoder on every call.
+    # Non-ASCII text is written as UTF-8, as orjson does
+    _json_decoder = json.JSONDecoder()
+    _json_encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+    def _json_loads(data: bytes) -> Any:
+        return _json_decoder.decode(data.decode('utf-8'))
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return _json_encoder.encode(obj).encode('utf-8')
 
 
 # Type mapping from Blueprint to C++
@@ -53,55 +78,105 @@ BLUEPRINT_TO_CPP_TYPES = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_project_saved_dir() -> Path:
     """Get the project's Saved directory."""
     # This assumes we're running from UnrealMCP-Server
     return Path(__file__).parent.parent.parent.parent / "Saved" / "UnrealMCP"
 
 
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, to the second; formatted once per second."""
+    return _iso_for_second(int(time.time()))
+
+
+def _write_json_atomic(path: Path, obj: Any) -> None:
+    """
+    Write obj as indented JSON with a single write to a temporary file that
+    then replaces path, so readers never see a partially written file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(_json_dumps_indented(obj))
+    os.replace(tmp_path, path)
+
+
 def ensure_directory(path: Path) -> Path:
     """Ensure a directory exists."""
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
+# The directory getters are cached, so each directory is created once per process
+@lru_cache(maxsize=None)
 def get_exports_dir() -> Path:
     """Get the exports directory."""
     return ensure_directory(get_project_saved_dir() / "Exports")
 
 
+@lru_cache(maxsize=None)
 def get_analysis_dir() -> Path:
     """Get the analysis directory."""
     return ensure_directory(get_project_saved_dir() / "Analysis")
 
 
+@lru_cache(maxsize=None)
 def get_codemaps_dir() -> Path:
     """Get the codemaps directory."""
     return ensure_directory(get_project_saved_dir() / "Codemaps")
 
 
+@lru_cache(maxsize=None)
 def get_generated_dir() -> Path:
     """Get the generated code directory."""
     return ensure_directory(get_project_saved_dir() / "Generated")
 
 
+@lru_cache(maxsize=None)
 def get_migrations_dir() -> Path:
     """Get the migrations status directory."""
     return ensure_directory(get_project_saved_dir() / "Migrations")
 
 
+@lru_cache(maxsize=None)
+def get_indexes_dir() -> Path:
+    """Get the directory for persisted lookup indexes."""
+    return ensure_directory(get_project_saved_dir() / "Indexes")
+
+
+@lru_cache(maxsize=None)
+def get_cache_dir() -> Path:
+    """Get the directory for persisted query results."""
+    return ensure_directory(get_project_saved_dir() / "Cache")
+
+
+@lru_cache(maxsize=256)
+def _export_name_matcher(blueprint_name: str) -> Callable[[str], Optional[re.Match]]:
+    """Compiled match function for the export file names of a blueprint."""
+    # Matches plain (.json), chunked (.jsonchunks) and streamed (.ndjson) exports
+    return re.compile(rf"export_{re.escape(blueprint_name)}_.*\.(?:nd)?json").match
+
+
 def find_latest_export(blueprint_name: str) -> Optional[Path]:
     """Find the most recent export file for a blueprint."""
-    exports_dir = get_exports_dir()
-    pattern = f"export_{blueprint_name}_*.json"
+    is_export = _export_name_matcher(blueprint_name)
+    latest_path = None
+    latest_mtime = -1.0
 
-    matching_files = list(exports_dir.glob(pattern))
-    if not matching_files:
-        return None
+    # One pass over the directory, keeping the newest match
+    with os.scandir(get_exports_dir()) as entries:
+        for entry in entries:
+            if is_export(entry.name):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest_path = entry.path
 
-    # Sort by modification time, newest first
-    matching_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return matching_files[0]
+    return Path(latest_path) if latest_path else None
 
 
 def load_blueprint_export(blueprint_name: str) -> Optional[Dict[str, Any]]:
@@ -110,12 +185,160 @@ def load_blueprint_export(blueprint_name: str) -> Optional[Dict[str, Any]]:
     if not export_path:
         return None
 
-    with open(export_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_export_file(export_path)
+
+
+def load_export_file(export_path: Path) -> Dict[str, Any]:
+    """
+    Load an export file in any of the formats written by export_blueprint_graph.
+
+    Parsed exports are cached by path, modification time and size, so an
+    unchanged file is only parsed once. The returned dict is shared between
+    callers and must not be modified.
+    """
+    export_path = Path(export_path)
+    stat = export_path.stat()
+    return _load_export_cached(str(export_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _load_export_cached(export_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    if export_path.endswith('.jsonchunks'):
+        documents = iter_chunked_export(Path(export_path))
+        export = next(documents, {})
+        export["graphs"] = list(documents)
+    elif export_path.endswith('.ndjson'):
+        export = {"graphs": []}
+        for record in iter_ndjson_export(Path(export_path)):
+            kind = record.pop("record", None)
+            if kind == "node":
+                export["graphs"][-1]["nodes"].append(record)
+            elif kind == "graph":
+                record["nodes"] = []
+                export["graphs"].append(record)
+            else:
+                export.update(record)
+    else:
+        export = _json_loads(Path(export_path).read_bytes())
+
+    return restore_input_connections(expand_interned_strings(expand_node_columns(export)))
+
+
+def restore_input_connections(export: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild input pin connections of an export written with dedupe_connections.
+
+    Such exports list each link only on its output pin; the matching entry is
+    added back to the input pin at the other end. Other exports are returned
+    unchanged.
+    """
+    if not export.pop("output_connections_only", False):
+        return export
+
+    for graph in export.get("graphs", []):
+        input_pins = {}
+        for node in graph.get("nodes", []):
+            for pin in node.get("input_pins", []):
+                input_pins[(node.get("guid"), pin.get("name"))] = pin
+
+        for node in graph.get("nodes", []):
+            for pin in node.get("output_pins", []):
+                for connection in pin.get("connections", []):
+                    target_pin = input_pins.get((connection.get("node_guid"), connection.get("pin_name")))
+                    if target_pin is not None:
+                        target_pin.setdefault("connections", []).append(
+                            {"node_guid": node.get("guid"), "pin_name": pin.get("name")}
+                        )
+    return export
+
+
+def iter_chunked_export(export_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the documents of a chunked (.jsonchunks) export one at a time.
+
+    Each document is preceded by its UTF-8 byte length as a little-endian
+    uint32. The first document holds the Blueprint metadata, components and
+    variables; every following one is a single graph. Only one document is
+    held in memory at a time.
+    """
+    with open(export_path, 'rb') as f:
+        while True:
+            prefix = f.read(4)
+            if len(prefix) < 4:
+                return
+            yield _json_loads(f.read(int.from_bytes(prefix, 'little')))
+
+
+def iter_ndjson_export(export_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a streamed (.ndjson) export one at a time.
+
+    Every line is one JSON object whose "record" field is "blueprint" (the
+    first line: metadata, components and variables), "graph", or "node"; node
+    records belong to the graph record before them. Only one record is held
+    in memory at a time.
+    """
+    with open(export_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
+
+
+def expand_node_columns(export: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild the node objects of an export written with layout="soa".
+
+    Such exports store each graph's "nodes" as an object of parallel columns,
+    one array per node field, padded with null where a node lacks the field.
+    Exports in the default layout are returned unchanged.
+    """
+    if export.pop("node_layout", "aos") != "soa":
+        return export
+
+    for graph in export.get("graphs", ()):
+        columns = graph.get("nodes")
+        if not isinstance(columns, dict):
+            continue
+        count = max((len(values) for values in columns.values()), default=0)
+        nodes = [{} for _ in range(count)]
+        for key, values in columns.items():
+            for node, value in zip(nodes, values):
+                if value is not None:
+                    node[key] = value
+        graph["nodes"] = nodes
+    return export
+
+
+def expand_interned_strings(export: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Restore the string values of an export written with intern_strings.
+
+    Such exports store each repeated value of the fields listed in
+    "interned_fields" once in a root "strings" table and reference it by
+    index. Exports without a table are returned unchanged.
+    """
+    strings = export.pop("strings", None)
+    interned_fields = frozenset(export.pop("interned_fields", ()))
+    if strings is None or not interned_fields:
+        return export
+
+    pending = [export]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, dict):
+            for key, value in item.items():
+                if key in interned_fields and isinstance(value, int):
+                    item[key] = strings[value]
+                elif isinstance(value, (dict, list)):
+                    pending.append(value)
+        else:
+            pending.extend(value for value in item if isinstance(value, (dict, list)))
+    return export
 
 
+@lru_cache(maxsize=4096)
 def map_blueprint_type_to_cpp(bp_type: str, subtype: str = None) -> str:
-    """Convert a Blueprint type to C++ type."""
+    """Convert a Blueprint type to C++ type. Results are cached, as every pin is mapped."""
     bp_type_lower = bp_type.lower()
 
     # Check direct mapping
@@ -125,23 +348,23 @@ def map_blueprint_type_to_cpp(bp_type: str, subtype: str = None) -> str:
     # Handle object references
     if bp_type_lower == "object" and subtype:
         # Clean up the subtype name
-        class_name = subtype.split("'")[-1].rstrip("'") if "'" in subtype else subtype
+        class_name = subtype.rpartition("'")[2]
         if class_name.startswith("U") or class_name.startswith("A"):
             return f"TObjectPtr<{class_name}>"
         return f"TObjectPtr<U{class_name}>"
 
     # Handle class references
     if bp_type_lower == "class" and subtype:
-        class_name = subtype.split("'")[-1].rstrip("'") if "'" in subtype else subtype
+        class_name = subtype.rpartition("'")[2]
         return f"TSubclassOf<{class_name}>"
 
     # Handle soft references
     if bp_type_lower == "softobject" and subtype:
-        class_name = subtype.split("'")[-1].rstrip("'") if "'" in subtype else subtype
+        class_name = subtype.rpartition("'")[2]
         return f"TSoftObjectPtr<{class_name}>"
 
     if bp_type_lower == "softclass" and subtype:
-        class_name = subtype.split("'")[-1].rstrip("'") if "'" in subtype else subtype
+        class_name = subtype.rpartition("'")[2]
         return f"TSoftClassPtr<{class_name}>"
 
     # Default - assume it's a struct or enum
@@ -153,6 +376,11 @@ def map_blueprint_type_to_cpp(bp_type: str, subtype: str = None) -> str:
     return f"/* UNKNOWN: {bp_type} */ void*"
 
 
+# Pins of a CallFunction node that are not function parameters
+_SKIP_INPUT_PIN_NAMES = frozenset({"execute", "self", "Target", "WorldContextObject"})
+_SKIP_OUTPUT_PIN_NAMES = frozenset({"then", "execute"})
+
+
 def extract_function_signature(node: Dict[str, Any]) -> Dict[str, Any]:
     """Extract function signature from a CallFunction node."""
     signature = {
@@ -164,18 +392,21 @@ def extract_function_signature(node: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     # Parse input pins for parameters
+    parameters = signature["parameters"]
     for pin in node.get("input_pins", []):
-        if pin["name"] not in ["execute", "self", "Target", "WorldContextObject"]:
-            signature["parameters"].append({
-                "name": pin["name"],
+        pin_name = pin["name"]
+        if pin_name not in _SKIP_INPUT_PIN_NAMES:
+            parameters.append({
+                "name": pin_name,
                 "type": map_blueprint_type_to_cpp(pin.get("category", ""), pin.get("subcategory")),
                 "default_value": pin.get("default_value")
             })
 
     # Parse output pins for return type
     for pin in node.get("output_pins", []):
-        if pin["name"] not in ["then", "execute"]:
-            if pin["name"] == "ReturnValue":
+        pin_name = pin["name"]
+        if pin_name not in _SKIP_OUTPUT_PIN_NAMES:
+            if pin_name == "ReturnValue":
                 signature["return_type"] = map_blueprint_type_to_cpp(
                     pin.get("category", ""), pin.get("subcategory")
                 )
@@ -224,11 +455,11 @@ def generate_ufunction_specifiers(func_info: Dict[str, Any]) -> str:
 
 def create_migration_status(blueprint_path: str) -> Dict[str, Any]:
     """Create initial migration status tracking object."""
-    name = blueprint_path.split("/")[-1]
+    name = blueprint_path.rpartition("/")[2]
     return {
         "blueprint": blueprint_path,
         "blueprint_name": name,
-        "started": datetime.now().isoformat(),
+        "started": _now_iso(),
         "status": "in_progress",
         "steps": {
             "analysis": {"status": "pending"},
@@ -249,9 +480,7 @@ def save_migration_status(status: Dict[str, Any]) -> Path:
     name = status["blueprint_name"]
     path = get_migrations_dir() / f"{name}_status.json"
 
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(status, f, indent=2)
-
+    _write_json_atomic(path, status)
     return path
 
 
@@ -262,8 +491,7 @@ def load_migration_status(blueprint_name: str) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
 
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _json_loads(path.read_bytes())
 
 
 def update_migration_step(status: Dict[str, Any], step: str, step_status: str,
@@ -271,7 +499,7 @@ def update_migration_step(status: Dict[str, Any], step: str, step_status: str,
     """Update a migration step status."""
     status["steps"][step] = {
         "status": step_status,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
     if output_path:
@@ -286,7 +514,7 @@ def update_migration_step(status: Dict[str, Any], step: str, step_status: str,
 
     if all_completed:
         status["status"] = "completed"
-        status["completed"] = datetime.now().isoformat()
+        status["completed"] = _now_iso()
     elif any_failed:
         status["status"] = "failed"
 
@@ -297,7 +525,7 @@ class CodemapBuilder:
     def __init__(self, blueprint_name: str, parent_class: str, module: str):
         self.codemap = {
             "version": "1.0",
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": _now_iso(),
             "class": {
                 "name": blueprint_name.replace("BP_", ""),
                 "blueprint_name": blueprint_name,
@@ -307,7 +535,7 @@ class CodemapBuilder:
             },
             "includes": [
                 "CoreMinimal.h",
-                f"{parent_class.lstrip('A').lstrip('U')}.h"
+                f"{parent_class[1:] if parent_class[:1] in ('A', 'U') else parent_class}.h"
             ],
             "forward_declarations": [],
             "components": [],
@@ -319,14 +547,21 @@ class CodemapBuilder:
             "migration_notes": []
         }
 
+        # Membership indexes for the lists that must stay free of duplicates
+        self._includes = set(self.codemap["includes"])
+        self._forward_declarations = set()
+        self._implementation_order = set(self.codemap["implementation_order"])
+
     def add_include(self, include: str):
         """Add an include file."""
-        if include not in self.codemap["includes"]:
+        if include not in self._includes:
+            self._includes.add(include)
             self.codemap["includes"].append(include)
 
     def add_forward_declaration(self, class_name: str):
         """Add a forward declaration."""
-        if class_name not in self.codemap["forward_declarations"]:
+        if class_name not in self._forward_declarations:
+            self._forward_declarations.add(class_name)
             self.codemap["forward_declarations"].append(class_name)
 
     def add_component(self, name: str, component_type: str,
@@ -386,7 +621,8 @@ class CodemapBuilder:
             "blueprint_nodes": node_guids or []
         })
 
-        if name not in self.codemap["implementation_order"]:
+        if name not in self._implementation_order:
+            self._implementation_order.add(name)
             self.codemap["implementation_order"].append(name)
 
     def add_delegate(self, name: str, delegate_type: str = "multicast",
@@ -422,12 +658,82 @@ class CodemapBuilder:
         """Save the codemap to file."""
         path = get_codemaps_dir() / f"{blueprint_name}_codemap.json"
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.codemap, f, indent=2)
-
+        _write_json_atomic(path, self.codemap)
         return path
 
 
+# Fixed parts of the generated files; only the class-specific names vary
+_HEADER_PRELUDE = (
+    "// Copyright (c) 2024. All Rights Reserved.\n"
+    "\n"
+    "#pragma once\n"
+    "\n"
+    '#include "CoreMinimal.h"\n'
+)
+
+_CLASS_DECLARATION = Template(
+    "/**\n"
+    " * C++ base class for Blueprint: $blueprint_name\n"
+    " * \n"
+    " * The Blueprint should reparent to this class after migration.\n"
+    " * Asset references are configured in Blueprint defaults (EditDefaultsOnly).\n"
+    " */\n"
+    "UCLASS()\n"
+    "class $api_macro $class_name : public $parent_class\n"
+    "{\n"
+    "\tGENERATED_BODY()\n"
+    "\n"
+    "public:\n"
+    "\t$class_name();\n"
+    "\n"
+)
+
+_SOURCE_PRELUDE = Template(
+    "// Copyright (c) 2024. All Rights Reserved.\n"
+    "\n"
+    '#include "$class_name.h"\n'
+    "\n"
+    "$class_name::$class_name()\n"
+    "{\n"
+)
+
+_BEGIN_PLAY_DEFINITION = Template(
+    "void $class_name::BeginPlay()\n"
+    "{\n"
+    "\tSuper::BeginPlay();\n"
+    "\n"
+    "\t// TODO: Implement BeginPlay logic from Blueprint\n"
+    "}\n"
+    "\n"
+)
+
+# $timeline_updates is empty, or the timeline update block including its trailing blank line
+_TICK_DEFINITION = Template(
+    "void $class_name::Tick(float DeltaTime)\n"
+    "{\n"
+    "\tSuper::Tick(DeltaTime);\n"
+    "\n"
+    "$timeline_updates"
+    "\t// TODO: Implement Tick logic from Blueprint\n"
+    "}\n"
+    "\n"
+)
+
+
+@lru_cache(maxsize=64)
+def _class_declaration(blueprint_name: str, api_macro: str, class_name: str, parent_class: str) -> str:
+    """Class declaration opening of a generated header, formatted once per class."""
+    return _CLASS_DECLARATION.substitute(
+        blueprint_name=blueprint_name,
+        api_macro=api_macro,
+        class_name=class_name,
+        parent_class=parent_class)
+
+
+def _parameter_list(func: Dict[str, Any]) -> str:
+    return ", ".join([f'{p["type"]} {p["name"]}' for p in func["parameters"]])
+
+
 class CppGenerator:
     """Helper class to generate C++ code from a codemap."""
 
@@ -439,219 +745,202 @@ class CppGenerator:
         self.module = self.class_info["module"]
         self.api_macro = self.class_info["api_macro"]
 
+        # Shared by generate_header and generate_source
+        self._has_tick = (any(f["name"] == "Tick" for f in codemap["functions"])
+                          or bool(codemap["timelines"]))
+        self._asset_props = []
+        self._state_props = []
+        for prop in codemap["properties"]:
+            (self._asset_props if prop.get("is_asset_reference") else self._state_props).append(prop)
+
+    @staticmethod
+    def _property_declarations(props: List[Dict[str, Any]]) -> str:
+        return "".join(f'\tUPROPERTY({", ".join(prop["specifiers"])}, Category = "{prop["category"]}")\n'
+                       f'\t{prop["type"]} {prop["name"]};\n\n'
+                       for prop in props)
+
     def generate_header(self) -> str:
         """Generate the .h file content."""
-        lines = []
+        out = io.StringIO()
+        w = out.write
 
-        # Header guard
-        lines.append("// Copyright (c) 2024. All Rights Reserved.")
-        lines.append("")
-        lines.append("#pragma once")
-        lines.append("")
-
-        # Includes
-        lines.append('#include "CoreMinimal.h"')
+        # Header guard and includes
+        w(_HEADER_PRELUDE)
         for inc in self.codemap["includes"][1:]:  # Skip CoreMinimal
-            lines.append(f'#include "{inc}"')
-        lines.append(f'#include "{self.class_name}.generated.h"')
-        lines.append("")
+            w(f'#include "{inc}"\n')
+        w(f'#include "{self.class_name}.generated.h"\n\n')
 
         # Forward declarations
         if self.codemap["forward_declarations"]:
-            for fwd in self.codemap["forward_declarations"]:
-                lines.append(f"class {fwd};")
-            lines.append("")
+            w("".join(f"class {fwd};\n" for fwd in self.codemap["forward_declarations"]))
+            w("\n")
 
         # Delegate declarations
-        for delegate in self.codemap["delegates"]:
-            sig = delegate.get("signature", "")
-            lines.append(f'DECLARE_DYNAMIC_MULTICAST_DELEGATE{sig}({delegate["name"]});')
         if self.codemap["delegates"]:
-            lines.append("")
+            w("".join(f'DECLARE_DYNAMIC_MULTICAST_DELEGATE{d.get("signature", "")}({d["name"]});\n'
+                      for d in self.codemap["delegates"]))
+            w("\n")
 
         # Class declaration
-        lines.append("/**")
-        lines.append(f' * C++ base class for Blueprint: {self.class_info.get("blueprint_name", "")}')
-        lines.append(" * ")
-        lines.append(" * The Blueprint should reparent to this class after migration.")
-        lines.append(" * Asset references are configured in Blueprint defaults (EditDefaultsOnly).")
-        lines.append(" */")
-        lines.append("UCLASS()")
-        lines.append(f"class {self.api_macro} {self.class_name} : public {self.parent_class}")
-        lines.append("{")
-        lines.append("\tGENERATED_BODY()")
-        lines.append("")
-        lines.append("public:")
-        lines.append(f"\t{self.class_name}();")
-        lines.append("")
+        w(_class_declaration(self.class_info.get("blueprint_name", ""), self.api_macro,
+                             self.class_name, self.parent_class))
 
         # Components
         if self.codemap["components"]:
-            lines.append("\t// Components")
-            for comp in self.codemap["components"]:
-                lines.append(f'\tUPROPERTY(VisibleAnywhere, BlueprintReadOnly, Category = "Components")')
-                lines.append(f'\tTObjectPtr<{comp["type"]}> {comp["name"]};')
-                lines.append("")
+            w("\t// Components\n")
+            w("".join(f'\tUPROPERTY(VisibleAnywhere, BlueprintReadOnly, Category = "Components")\n'
+                      f'\tTObjectPtr<{comp["type"]}> {comp["name"]};\n\n'
+                      for comp in self.codemap["components"]))
 
         # Properties - separate asset refs from runtime state
-        asset_props = [p for p in self.codemap["properties"] if p.get("is_asset_reference")]
-        state_props = [p for p in self.codemap["properties"] if not p.get("is_asset_reference")]
-
-        if asset_props:
-            lines.append("\t// Asset References (configure in Blueprint defaults)")
-            for prop in asset_props:
-                specs = ", ".join(prop["specifiers"])
-                lines.append(f'\tUPROPERTY({specs}, Category = "{prop["category"]}")')
-                lines.append(f'\t{prop["type"]} {prop["name"]};')
-                lines.append("")
+        if self._asset_props:
+            w("\t// Asset References (configure in Blueprint defaults)\n")
+            w(self._property_declarations(self._asset_props))
 
-        if state_props:
-            lines.append("\t// Runtime State")
-            for prop in state_props:
-                specs = ", ".join(prop["specifiers"])
-                lines.append(f'\tUPROPERTY({specs}, Category = "{prop["category"]}")')
-                lines.append(f'\t{prop["type"]} {prop["name"]};')
-                lines.append("")
+        if self._state_props:
+            w("\t// Runtime State\n")
+            w(self._property_declarations(self._state_props))
 
         # Delegates
         if self.codemap["delegates"]:
-            lines.append("\t// Delegates")
-            for delegate in self.codemap["delegates"]:
-                lines.append(f'\tUPROPERTY(BlueprintAssignable, Category = "Events")')
-                lines.append(f'\t{delegate["name"]} {delegate["name"].replace("F", "On", 1)};')
-                lines.append("")
+            w("\t// Delegates\n")
+            w("".join(f'\tUPROPERTY(BlueprintAssignable, Category = "Events")\n'
+                      f'\t{delegate["name"]} {delegate["name"].replace("F", "On", 1)};\n\n'
+                      for delegate in self.codemap["delegates"]))
 
         # Functions
         if self.codemap["functions"]:
-            lines.append("\t// Functions")
-            for func in self.codemap["functions"]:
-                specs = ", ".join(func["specifiers"])
-                lines.append(f'\tUFUNCTION({specs}, Category = "{func["category"]}")')
-                params = ", ".join([f'{p["type"]} {p["name"]}' for p in func["parameters"]])
-                lines.append(f'\t{func["return_type"]} {func["name"]}({params});')
-                lines.append("")
+            w("\t// Functions\n")
+            w("".join(f'\tUFUNCTION({", ".join(func["specifiers"])}, Category = "{func["category"]}")\n'
+                      f'\t{func["return_type"]} {func["name"]}({_parameter_list(func)});\n\n'
+                      for func in self.codemap["functions"]))
 
         # Protected section
-        lines.append("protected:")
-        lines.append("\tvirtual void BeginPlay() override;")
+        w("protected:\n"
+          "\tvirtual void BeginPlay() override;\n")
 
         # Check if Tick is needed
-        has_tick = any(f["name"] == "Tick" for f in self.codemap["functions"])
-        if has_tick or self.codemap["timelines"]:
-            lines.append("\tvirtual void Tick(float DeltaTime) override;")
+        if self._has_tick:
+            w("\tvirtual void Tick(float DeltaTime) override;\n")
 
-        lines.append("")
+        w("\n")
 
         # Private section
-        lines.append("private:")
+        w("private:\n")
 
         # Timelines
         if self.codemap["timelines"]:
-            lines.append("\t// Timelines")
+            w("\t// Timelines\n")
             for tl in self.codemap["timelines"]:
-                lines.append(f'\tFTimeline {tl["name"]};')
+                w(f'\tFTimeline {tl["name"]};\n')
                 for curve in tl["curves"]:
-                    lines.append(f'\tUPROPERTY()')
-                    lines.append(f'\tUCurveFloat* {curve["name"]}Curve;')
-            lines.append("")
+                    w(f'\tUPROPERTY()\n'
+                      f'\tUCurveFloat* {curve["name"]}Curve;\n')
+            w("\n")
 
-        lines.append("};")
+        w("};")
 
-        return "\n".join(lines)
+        return out.getvalue()
 
     def generate_source(self) -> str:
         """Generate the .cpp file content."""
-        lines = []
+        out = io.StringIO()
+        w = out.write
 
-        # Includes
-        lines.append("// Copyright (c) 2024. All Rights Reserved.")
-        lines.append("")
-        lines.append(f'#include "{self.class_name}.h"')
-        lines.append("")
-
-        # Constructor
-        lines.append(f"{self.class_name}::{self.class_name}()")
-        lines.append("{")
+        # Includes and constructor
+        w(_SOURCE_PRELUDE.substitute(class_name=self.class_name))
 
         # Tick setup
-        has_tick = any(f["name"] == "Tick" for f in self.codemap["functions"]) or self.codemap["timelines"]
-        lines.append(f"\tPrimaryActorTick.bCanEverTick = {'true' if has_tick else 'false'};")
-        lines.append("")
+        w(f"\tPrimaryActorTick.bCanEverTick = {'true' if self._has_tick else 'false'};\n\n")
 
         # Create components
         if self.codemap["components"]:
-            lines.append("\t// Create components")
+            w("\t// Create components\n")
             for i, comp in enumerate(self.codemap["components"]):
-                lines.append(f'\t{comp["name"]} = CreateDefaultSubobject<{comp["type"]}>(TEXT("{comp["name"]}"));')
+                w(f'\t{comp["name"]} = CreateDefaultSubobject<{comp["type"]}>(TEXT("{comp["name"]}"));\n')
                 if i == 0:
-                    lines.append(f"\tRootComponent = {comp['name']};")
+                    w(f"\tRootComponent = {comp['name']};\n")
                 elif comp.get("attachment"):
-                    lines.append(f'\t{comp["name"]}->SetupAttachment({comp["attachment"]});')
-            lines.append("")
+                    w(f'\t{comp["name"]}->SetupAttachment({comp["attachment"]});\n')
+            w("\n")
 
         # Set default values (NOT for asset references - those stay in BP defaults)
-        state_props = [p for p in self.codemap["properties"]
-                       if not p.get("is_asset_reference") and p.get("default_value") is not None]
+        state_props = [p for p in self._state_props if p.get("default_value") is not None]
         if state_props:
-            lines.append("\t// Set defaults (asset refs configured in Blueprint)")
-            for prop in state_props:
-                lines.append(f'\t{prop["name"]} = {prop["default_value"]};')
-            lines.append("")
+            w("\t// Set defaults (asset refs configured in Blueprint)\n")
+            w("".join(f'\t{prop["name"]} = {prop["default_value"]};\n' for prop in state_props))
+            w("\n")
 
-        lines.append("}")
-        lines.append("")
+        w("}\n\n")
 
         # BeginPlay
-        lines.append(f"void {self.class_name}::BeginPlay()")
-        lines.append("{")
-        lines.append("\tSuper::BeginPlay();")
-        lines.append("")
-        lines.append("\t// TODO: Implement BeginPlay logic from Blueprint")
-        lines.append("}")
-        lines.append("")
+        w(_BEGIN_PLAY_DEFINITION.substitute(class_name=self.class_name))
 
         # Tick
-        if has_tick:
-            lines.append(f"void {self.class_name}::Tick(float DeltaTime)")
-            lines.append("{")
-            lines.append("\tSuper::Tick(DeltaTime);")
-            lines.append("")
-            if self.codemap["timelines"]:
-                lines.append("\t// Update timelines")
-                for tl in self.codemap["timelines"]:
-                    lines.append(f"\t{tl['name']}.TickTimeline(DeltaTime);")
-                lines.append("")
-            lines.append("\t// TODO: Implement Tick logic from Blueprint")
-            lines.append("}")
-            lines.append("")
+        if self._has_tick:
+            timelines = self.codemap["timelines"]
+            timeline_updates = ""
+            if timelines:
+                timeline_updates = "".join(["\t// Update timelines\n",
+                                            *(f"\t{tl['name']}.TickTimeline(DeltaTime);\n" for tl in timelines),
+                                            "\n"])
+            w(_TICK_DEFINITION.substitute(class_name=self.class_name, timeline_updates=timeline_updates))
 
         # Other functions
         for func in self.codemap["functions"]:
             if func["name"] in ["BeginPlay", "Tick"]:
                 continue
 
-            params = ", ".join([f'{p["type"]} {p["name"]}' for p in func["parameters"]])
-            lines.append(f'{func["return_type"]} {self.class_name}::{func["name"]}({params})')
-            lines.append("{")
+            w(f'{func["return_type"]} {self.class_name}::{func["name"]}({_parameter_list(func)})\n'
+              f"{{\n")
 
             if func.get("implementation_notes"):
-                lines.append(f"\t// {func['implementation_notes']}")
+                w(f"\t// {func['implementation_notes']}\n")
 
             if func.get("blueprint_nodes"):
-                lines.append(f"\t// Source nodes: {', '.join(func['blueprint_nodes'][:3])}")
+                w(f"\t// Source nodes: {', '.join(func['blueprint_nodes'][:3])}\n")
 
-            lines.append("\t// TODO: Implement function logic from Blueprint")
+            w("\t// TODO: Implement function logic from Blueprint\n")
 
             if func["return_type"] != "void":
-                lines.append(f"\treturn {{}};  // Default return")
+                w("\treturn {};  // Default return\n")
 
-            lines.append("}")
-            lines.append("")
+            w("}\n\n")
 
-        return "\n".join(lines)
+        # The last block ends with a blank line; the file ends with a single newline
+        return out.getvalue()[:-1]
 
     def save(self, blueprint_name: str, dry_run: bool = True) -> Dict[str, Path]:
-        """Save generated files."""
+        """Save generated files. The header is written while the source is generated."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            paths, writes = self._submit_save(executor, blueprint_name, dry_run)
+            for write in writes:
+                write.result()
+        return paths
+
+    @classmethod
+    def save_many(cls, codemaps: List[Dict[str, Any]], dry_run: bool = True) -> List[Dict[str, Path]]:
+        """
+        Generate and save the code of several codemaps.
+
+        Files are written on worker threads while the next files are
+        generated. Returns the paths of each codemap's files, in order.
+        """
+        results = []
+        writes = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for codemap in codemaps:
+                generator = cls(codemap)
+                blueprint_name = generator.class_info.get("blueprint_name") or generator.class_name
+                paths, codemap_writes = generator._submit_save(executor, blueprint_name, dry_run)
+                results.append(paths)
+                writes.extend(codemap_writes)
+            for write in writes:
+                write.result()
+        return results
+
+    def _submit_save(self, executor: ThreadPoolExecutor, blueprint_name: str,
+                     dry_run: bool) -> Tuple[Dict[str, Path], List[Future]]:
         if dry_run:
             output_dir = get_generated_dir() / blueprint_name
         else:
@@ -663,13 +952,12 @@ class CppGenerator:
         header_path = output_dir / f"{self.class_name}.h"
         source_path = output_dir / f"{self.class_name}.cpp"
 
-        with open(header_path, 'w', encoding='utf-8') as f:
-            f.write(self.generate_header())
-
-        with open(source_path, 'w', encoding='utf-8') as f:
-            f.write(self.generate_source())
+        writes = [
+            executor.submit(header_path.write_text, self.generate_header(), encoding='utf-8'),
+            executor.submit(source_path.write_text, self.generate_source(), encoding='utf-8'),
+        ]
 
         return {
             "header": header_path,
             "source": source_path
-        }
+        }, writes
@@ -6,67 +6,468 @@ This handles the key migration gap: Blueprint function nodes use 'title' field
 while C++ function nodes use 'function_name' field.
 """
 
+import gzip
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple, Union
 from utils.unreal_connection_utils import send_unreal_command
+from . import disk_cache
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; titles are then matched with one regex
+    ahocorasick = None
 
 logger = logging.getLogger("UnrealMCP.Migration")
 
+FUNCTION_CALL_INDEX_VERSION = 1
+
+# Blueprints redirected concurrently; their commands share the pipelined
+# connection. Unreal serves one connection at a time, so a pool of them would
+# only queue behind the first. MCP_MAX_PARALLEL=1 redirects one Blueprint at
+# a time.
+REDIRECT_WORKERS = max(1, int(os.environ.get("MCP_MAX_PARALLEL", "8")))
+
+# dry_run value that previews a redirect and keeps its plan for commit_redirect_plan
+PREVIEW_THEN_PROMPT = "preview_then_prompt"
+PLAN_TTL = 60.0
+
+# digest -> (expiry, plan) of previews waiting to be committed
+_pending_plans: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Source titles from which redirect_many matches all of them in one pass over
+# the function call index instead of searching it once per title
+MULTI_TITLE_MATCH_THRESHOLD = 4
+
+# Matches per find_in_blueprints page when searching Unreal for call sites
+SEARCH_PAGE_SIZE = 100
+
 
 def find_blueprint_function_calls(
     function_title: str,
     search_path: str = "/Game",
-    max_results: int = 100
+    max_results: int = 100,
+    offset: int = 0
 ) -> Dict[str, Any]:
     """
-    Find all Blueprint function calls by their display title.
+    Find Blueprint function calls by their display title, one page at a time.
 
     Args:
         function_title: The display title of the function (e.g., "Pickup Item")
         search_path: Content path to search in
         max_results: Maximum number of results
+        offset: Number of matches to skip, the next_offset of the previous page
 
     Returns:
-        Dict with matches grouped by blueprint
+        Dict with matches grouped by blueprint, and has_more and next_offset
+        when more matches follow
     """
-    result = send_unreal_command("find_in_blueprints", {
+    response = send_unreal_command("find_in_blueprints", {
         "search_query": function_title,
         "search_type": "function",
         "path": search_path,
         "max_results": max_results,
+        "offset": offset,
         "case_sensitive": False
     })
 
-    return result
+    # A successful response comes wrapped in the bridge's "result" envelope
+    return response.get("result", response)
 
 
-def get_node_connections(
-    blueprint_name: str,
-    node_id: str,
-    graph_name: str = "EventGraph"
+def _search_function_calls(
+    function_title: str,
+    search_path: str,
+    max_results: Optional[int]
 ) -> Dict[str, Any]:
     """
-    Get all connections for a node without deleting it.
+    Search Unreal for calls to a function page by page, up to max_results (None for all).
 
-    Uses get_blueprint_metadata with graph_nodes field to find connections.
+    The next page is requested as soon as a page says where it ends, and is
+    searched while that page is collected. Every page is in before anything
+    is redirected: replacing nodes would shift the offsets of later pages.
+    """
+    matches = []
+    by_blueprint = {}
+
+    def page_size(found: int) -> int:
+        return SEARCH_PAGE_SIZE if max_results is None else min(SEARCH_PAGE_SIZE, max_results - found)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = find_blueprint_function_calls(function_title, search_path, page_size(0))
+        while True:
+            if not page.get("success"):
+                return page
+
+            page_matches = page.get("matches", [])
+            found = len(matches) + len(page_matches)
+            next_page = None
+            if page.get("has_more") and (max_results is None or found < max_results):
+                next_page = executor.submit(find_blueprint_function_calls, function_title, search_path,
+                                            page_size(found), page["next_offset"])
+
+            for match in page_matches:
+                matches.append(match)
+                by_blueprint.setdefault(match.get("blueprint_name"), []).append(match)
+
+            if next_page is None:
+                break
+            page = next_page.result()
+
+    return {"success": True, "source": "search", "matches": matches, "by_blueprint": by_blueprint}
+
+
+def _function_call_index_paths(blueprint_filter: str) -> Tuple[Path, Path]:
+    """Index and manifest file for a content path."""
+    from .migration_utils import get_indexes_dir
+
+    slug = blueprint_filter.strip("/").replace("/", "_") or "root"
+    indexes_dir = get_indexes_dir()
+    return (indexes_dir / f"function_calls_{slug}.json.gz",
+            indexes_dir / f"function_calls_{slug}.manifest.json")
+
+
+def _snapshot_dirs(root_dir: str) -> Dict[str, int]:
+    """Modification times of every directory under root_dir; they change when assets are added or removed."""
+    if not root_dir or not os.path.isdir(root_dir):
+        return {}
+    return {dirpath: os.stat(dirpath).st_mtime_ns for dirpath, _, _ in os.walk(root_dir)}
+
+
+def _file_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _read_function_call_index(index_path: str, mtime_ns: int) -> Dict[str, List[Dict[str, Any]]]:
+    with gzip.open(index_path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_function_call_index(index_path: Path, index: Dict[str, List[Dict[str, Any]]]) -> None:
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(tmp_path, index_path)
+
+
+def build_function_call_index(blueprint_filter: str = "/Game", force: bool = False) -> Dict[str, Any]:
+    """
+    Build and persist a function title -> call sites index for a content path.
+
+    Unreal lists every function call node under blueprint_filter in one pass.
+    The result is stored as gzipped JSON under Saved/UnrealMCP/Indexes, next to
+    a manifest of the Blueprint package files and content directories it was
+    built from, so later loads can tell when it is out of date.
+
+    Args:
+        blueprint_filter: Content path to index (default: "/Game")
+        force: Rebuild even if an up to date index exists
+
+    Returns:
+        Dict with the index location and counts
+    """
+    index_path, manifest_path = _function_call_index_paths(blueprint_filter)
+
+    if not force:
+        index = load_function_call_index(blueprint_filter)
+        if index is not None:
+            return {
+                "success": True,
+                "rebuilt": False,
+                "blueprint_filter": blueprint_filter,
+                "functions_indexed": len(index),
+                "call_count": sum(len(calls) for calls in index.values()),
+                "index_path": str(index_path)
+            }
+
+    response = send_unreal_command("build_function_call_index", {"path": blueprint_filter})
+    # A successful response comes wrapped in the bridge's "result" envelope
+    result = response.get("result", response)
+    if not result.get("success"):
+        return response
+
+    index = {}
+    for call in result.get("calls", []):
+        index.setdefault(call.get("node_title", ""), []).append({
+            "blueprint_path": call.get("blueprint_path"),
+            "blueprint_name": call.get("blueprint_name"),
+            "graph_name": call.get("graph_name", "EventGraph"),
+            "node_id": call.get("node_id"),
+            "function_name": call.get("function_name", "")
+        })
+
+    root_dir = result.get("root_dir", "")
+    manifest = {
+        "version": FUNCTION_CALL_INDEX_VERSION,
+        "blueprint_filter": blueprint_filter,
+        "built_at": time.time(),
+        "root_dir": root_dir,
+        "blueprints": {
+            bp["blueprint_path"]: [bp.get("package_file", ""), _file_mtime(bp.get("package_file", ""))]
+            for bp in result.get("blueprints", [])
+        },
+        "dirs": _snapshot_dirs(root_dir)
+    }
+
+    # The manifest goes last: an index without one is never used
+    _write_function_call_index(index_path, index)
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+
+    return {
+        "success": True,
+        "rebuilt": True,
+        "blueprint_filter": blueprint_filter,
+        "blueprints_indexed": len(manifest["blueprints"]),
+        "functions_indexed": len(index),
+        "call_count": len(result.get("calls", [])),
+        "index_path": str(index_path)
+    }
+
+
+def load_function_call_index(blueprint_filter: str = "/Game") -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Load the persisted function call index for a content path.
+
+    Returns None when there is no index, or when any indexed Blueprint was
+    saved since it was built or assets were added to or removed from the path.
+    """
+    index_path, manifest_path = _function_call_index_paths(blueprint_filter)
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        index_mtime = os.stat(index_path).st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != FUNCTION_CALL_INDEX_VERSION:
+        return None
+
+    for bp_path, (package_file, mtime_ns) in manifest.get("blueprints", {}).items():
+        if _file_mtime(package_file) != mtime_ns:
+            logger.info(f"Function call index for '{blueprint_filter}' is out of date: {bp_path} changed")
+            return None
+
+    if _snapshot_dirs(manifest.get("root_dir", "")) != manifest.get("dirs", {}):
+        logger.info(f"Function call index for '{blueprint_filter}' is out of date: assets were added or removed")
+        return None
+
+    return _read_function_call_index(str(index_path), index_mtime)
+
+
+# Lowercased titles and function names of the last index searched
+_lowercased_index: Tuple[Optional[dict], List[Tuple[str, str, List[Dict[str, Any]], List[str]]]] = (None, [])
+
+
+def _lowercase_index_keys(
+    index: Dict[str, List[Dict[str, Any]]]
+) -> List[Tuple[str, str, List[Dict[str, Any]], List[str]]]:
+    """
+    (title_lower, title, calls, function_names_lower) for every title of the index.
+
+    Loaded indexes are shared through the read cache, so the strings are
+    lowered once per index instead of once per search.
+    """
+    global _lowercased_index
+    cached_index, keys = _lowercased_index
+    if cached_index is not index:
+        keys = [(title.lower(), title, calls, [call["function_name"].lower() for call in calls])
+                for title, calls in index.items()]
+        _lowercased_index = (index, keys)
+    return keys
+
+
+def search_function_call_index(
+    index: Dict[str, List[Dict[str, Any]]],
+    function_title: str,
+    max_results: Optional[int] = 100
+) -> Dict[str, Any]:
+    """
+    Find call sites in a loaded index, shaped like find_blueprint_function_calls.
+
+    Like find_in_blueprints, matches are case-insensitive substrings of the
+    node title or the called function's name. max_results=None finds them all.
+    """
+    query = function_title.lower()
+    matches = []
+    by_blueprint = {}
+
+    for title_lower, title, calls, function_names_lower in _lowercase_index_keys(index):
+        title_matches = query in title_lower
+        for call, function_name_lower in zip(calls, function_names_lower):
+            if max_results is not None and len(matches) >= max_results:
+                break
+            if title_matches or query in function_name_lower:
+                match = dict(call, node_title=title)
+                matches.append(match)
+                by_blueprint.setdefault(call["blueprint_name"], []).append(match)
+
+    return {"success": True, "source": "index", "matches": matches, "by_blueprint": by_blueprint}
+
+
+@lru_cache(maxsize=16)
+def _title_matcher(titles: Tuple[str, ...]) -> Callable[[str], Optional[int]]:
+    """
+    Build a matcher for several titles at once.
+
+    The matcher takes a lowercased string and returns the position in titles of
+    the first title it contains (case-insensitively), or None. With titles
+    sorted longest first, that is the longest one.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for rank, title in reversed(list(enumerate(titles))):
+            automaton.add_word(title.lower(), rank)
+        automaton.make_automaton()
+
+        def match(text: str) -> Optional[int]:
+            return min((rank for _, rank in automaton.iter(text)), default=None)
+    else:
+        # The lookahead finds a title starting at every position, trying them in order
+        pattern = re.compile("(?=(" + "|".join(re.escape(title.lower()) for title in titles) + "))")
+        ranks = {}
+        for rank, title in enumerate(titles):
+            ranks.setdefault(title.lower(), rank)
+
+        def match(text: str) -> Optional[int]:
+            return min((ranks[found] for found in pattern.findall(text)), default=None)
+
+    return match
+
+
+def _claim_indexed_calls(
+    index: Dict[str, List[Dict[str, Any]]],
+    titles: List[str],
+    specific_blueprints: Optional[List[str]],
+    max_results: Optional[int] = None
+) -> Dict[str, List[Tuple[str, str, str]]]:
+    """
+    Assign every indexed call site to the longest title it matches, in one pass.
+
+    Equivalent to searching the index once per title, longest first, and
+    letting each title claim the nodes no earlier title took.
+    """
+    match = _title_matcher(tuple(titles))
+    counts = [0] * len(titles)
+    work = {}
+
+    for title_lower, _, calls, function_names_lower in _lowercase_index_keys(index):
+        title_rank = match(title_lower)
+        for call, function_name_lower in zip(calls, function_names_lower):
+            ranks = [rank for rank in (title_rank, match(function_name_lower)) if rank is not None]
+            if not ranks:
+                continue
+            rank = min(ranks)
+            bp_name = call["blueprint_name"]
+            if max_results is not None and counts[rank] >= max_results:
+                continue
+            if specific_blueprints and bp_name not in specific_blueprints:
+                continue
+            counts[rank] += 1
+            work.setdefault(bp_name, []).append(
+                (call["node_id"], call.get("graph_name", "EventGraph"), titles[rank])
+            )
+
+    return work
+
+
+def _current_function_call_index(blueprint_filter: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """The persisted index for a content path, rebuilt first if missing or out of date."""
+    index = load_function_call_index(blueprint_filter)
+    if index is None and build_function_call_index(blueprint_filter, force=True).get("success"):
+        index = load_function_call_index(blueprint_filter)
+    return index
+
+
+def find_function_call_sites(
+    function_title: str,
+    search_path: str = "/Game",
+    max_results: Optional[int] = 100,
+    use_index: bool = False
+) -> Dict[str, Any]:
+    """
+    Find calls to a function, searching Unreal directly unless use_index is set.
+
+    The persisted index only knows saved packages, so it misses call nodes
+    added in the editor since, e.g. by an earlier redirect. With use_index, a
+    missing or out of date index is rebuilt first, and Unreal is searched
+    directly only if it cannot be built. max_results=None finds every call.
+
+    Returns:
+        Dict with the matches, and the same matches by Blueprint name
     """
-    result = send_unreal_command("get_blueprint_metadata", {
+    if use_index:
+        index = _current_function_call_index(search_path)
+        if index is not None:
+            return search_function_call_index(index, function_title, max_results)
+    return _search_function_calls(function_title, search_path, max_results)
+
+
+def invalidate_function_call_index() -> None:
+    """
+    Discard every persisted function call index.
+
+    A change adds call nodes the index cannot know about until it is rebuilt,
+    so it is dropped rather than patched; removing the manifest is enough, as
+    an index without one is never used.
+    """
+    from .migration_utils import get_indexes_dir
+
+    for manifest_path in get_indexes_dir().glob("function_calls_*.manifest.json"):
+        try:
+            manifest_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def get_graph_nodes(blueprint_name: str, graph_name: str = "EventGraph") -> Dict[str, Any]:
+    """Fetch the full node listing of one graph via get_blueprint_metadata."""
+    return send_unreal_command("get_blueprint_metadata", {
         "blueprint_name": blueprint_name,
         "fields": ["graph_nodes"],
         "graph_name": graph_name,
         "detail_level": "full"
     })
 
-    if not result.get("success"):
-        return result
 
-    # Find the specific node
-    nodes = result.get("graph_nodes", [])
-    target_node = None
-    for node in nodes:
-        if node.get("node_id") == node_id:
-            target_node = node
-            break
+def index_graph_nodes(graph_nodes: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Key a get_graph_nodes listing by node_id."""
+    return {node.get("node_id"): node for node in graph_nodes}
+
+
+def get_node_connections(
+    blueprint_name: str,
+    node_id: str,
+    graph_name: str = "EventGraph",
+    nodes_by_id: Optional[Dict[str, Dict[str, Any]]] = None,
+    include_connections: bool = True
+) -> Dict[str, Any]:
+    """
+    Get all connections for a node without deleting it.
+
+    Uses get_blueprint_metadata with graph_nodes field to find connections.
+    Pass nodes_by_id from index_graph_nodes to skip the fetch, and
+    include_connections=False when only the node's title and position are
+    needed, as when replace_node reports the connections anyway.
+    """
+    if nodes_by_id is None:
+        result = get_graph_nodes(blueprint_name, graph_name)
+        if not result.get("success"):
+            return result
+        nodes_by_id = index_graph_nodes(result.get("graph_nodes", []))
+
+    target_node = nodes_by_id.get(node_id)
 
     if not target_node:
         return {
@@ -74,34 +475,23 @@ def get_node_connections(
             "error": f"Node {node_id} not found in graph {graph_name}"
         }
 
-    # Extract connections from pins
-    input_connections = []
-    output_connections = []
-
-    for pin in target_node.get("input_pins", []):
-        for conn in pin.get("connections", []):
-            input_connections.append({
-                "pin_name": pin.get("name"),
-                "connected_node_id": conn.get("node_id"),
-                "connected_pin": conn.get("pin_name")
-            })
-
-    for pin in target_node.get("output_pins", []):
-        for conn in pin.get("connections", []):
-            output_connections.append({
-                "pin_name": pin.get("name"),
-                "connected_node_id": conn.get("node_id"),
-                "connected_pin": conn.get("pin_name")
-            })
-
-    return {
+    result = {
         "success": True,
         "node_id": node_id,
         "node_title": target_node.get("title", ""),
-        "node_position": [target_node.get("pos_x", 0), target_node.get("pos_y", 0)],
-        "input_connections": input_connections,
-        "output_connections": output_connections
+        "node_position": [target_node.get("pos_x", 0), target_node.get("pos_y", 0)]
     }
+    if not include_connections:
+        return result
+
+    # Extract connections from pins
+    for direction in ("input", "output"):
+        result[f"{direction}_connections"] = [
+            {"pin_name": pin.get("name"), "connected_node_id": conn.get("node_id"), "connected_pin": conn.get("pin_name")}
+            for pin in target_node.get(f"{direction}_pins", ())
+            for conn in pin.get("connections", ())
+        ]
+    return result
 
 
 def apply_pin_mapping(connections: List[Dict], pin_mapping: Dict[str, str], is_input: bool) -> List[Dict]:
@@ -116,20 +506,51 @@ def apply_pin_mapping(connections: List[Dict], pin_mapping: Dict[str, str], is_i
     Returns:
         Updated connections with mapped pin names
     """
-    mapped = []
-    for conn in connections:
-        new_conn = conn.copy()
-        old_pin = conn.get("pin_name", "")
+    # Most redirects keep their pin names; the connections are then returned as is
+    if not pin_mapping:
+        return connections
 
-        # Apply mapping if exists
-        if old_pin in pin_mapping:
-            new_conn["pin_name"] = pin_mapping[old_pin]
+    old_pins = tuple(conn.get("pin_name", "") for conn in connections)
+    new_pins = _map_pin_names(old_pins, frozenset(pin_mapping.items()))
 
-        mapped.append(new_conn)
+    mapped = []
+    for conn, old_pin, new_pin in zip(connections, old_pins, new_pins):
+        # Only renamed pins need a new dict
+        if new_pin != old_pin:
+            conn = {**conn, "pin_name": new_pin}
+        mapped.append(conn)
 
     return mapped
 
 
+@lru_cache(maxsize=2048)
+def _map_pin_names(pin_names: Tuple[str, ...], pin_mapping: FrozenSet[Tuple[str, str]]) -> Tuple[str, ...]:
+    """Pin names after mapping; call sites of one function share their pin layout, so this is mostly cache hits."""
+    mapping = dict(pin_mapping)
+    return tuple(mapping.get(name, name) for name in pin_names)
+
+
+def _connections_to_restore(
+    stored_connections: List[Dict[str, Any]],
+    new_node_id: str,
+    pin_mapping: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    """connect_blueprint_nodes entries restoring a replaced node's stored connections on its replacement."""
+    pin_names = tuple(stored.get("pin_name", "") for stored in stored_connections)
+    new_pin_names = _map_pin_names(pin_names, frozenset(pin_mapping.items())) if pin_mapping else pin_names
+
+    # An input's source is the connected node and its target the new node; an
+    # output's the other way around
+    return [
+        {"source_node_id": stored.get("connected_node_id"), "source_pin": stored.get("connected_pin_name"),
+         "target_node_id": new_node_id, "target_pin": new_pin_name}
+        if stored.get("direction") == "input" else
+        {"source_node_id": new_node_id, "source_pin": new_pin_name,
+         "target_node_id": stored.get("connected_node_id"), "target_pin": stored.get("connected_pin_name")}
+        for stored, new_pin_name in zip(stored_connections, new_pin_names)
+    ]
+
+
 def redirect_single_node(
     blueprint_name: str,
     node_id: str,
@@ -137,7 +558,8 @@ def redirect_single_node(
     target_class: str,
     target_function: str,
     pin_mapping: Optional[Dict[str, str]] = None,
-    dry_run: bool = True
+    dry_run: bool = True,
+    nodes_by_id: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Redirect a single Blueprint function node to a C++ function call.
@@ -150,6 +572,7 @@ def redirect_single_node(
         target_function: Name of the C++ function
         pin_mapping: Optional dict mapping old pin names to new pin names
         dry_run: If True, only preview changes
+        nodes_by_id: Optional index_graph_nodes of the graph, shared between redirects
 
     Returns:
         Dict with operation results
@@ -157,7 +580,8 @@ def redirect_single_node(
     pin_mapping = pin_mapping or {}
 
     # Step 1: Get current node connections
-    conn_result = get_node_connections(blueprint_name, node_id, graph_name)
+    conn_result = get_node_connections(blueprint_name, node_id, graph_name, nodes_by_id,
+                                       include_connections=dry_run)
     if not conn_result.get("success"):
         return conn_result
 
@@ -226,30 +650,7 @@ def redirect_single_node(
     reconnect_errors = []
     reconnect_successes = []
 
-    # Build connection list from stored connections
-    connections_to_make = []
-
-    for stored in stored_connections:
-        old_pin_name = stored.get("pin_name", "")
-        new_pin_name = pin_mapping.get(old_pin_name, old_pin_name)
-
-        if stored.get("direction") == "input":
-            # This was an input - source is the connected node, target is new node
-            connections_to_make.append({
-                "source_node_id": stored.get("connected_node_id"),
-                "source_pin": stored.get("connected_pin_name"),
-                "target_node_id": new_node_id,
-                "target_pin": new_pin_name
-            })
-        else:
-            # This was an output - source is new node, target is connected node
-            connections_to_make.append({
-                "source_node_id": new_node_id,
-                "source_pin": new_pin_name,
-                "target_node_id": stored.get("connected_node_id"),
-                "target_pin": stored.get("connected_pin_name")
-            })
-
+    connections_to_make = _connections_to_restore(stored_connections, new_node_id, pin_mapping)
     if connections_to_make:
         connect_result = send_unreal_command("connect_blueprint_nodes", {
             "blueprint_name": blueprint_name,
@@ -276,6 +677,245 @@ def redirect_single_node(
     }
 
 
+def _batch_error(result: Dict[str, Any]) -> str:
+    """Error message of a batched sub-command, which is not flattened like a direct response."""
+    error = result.get("error", "Unknown error")
+    if isinstance(error, dict):
+        error = error.get("errorMessage") or error.get("errorDetails") or error.get("message") or "Unknown error"
+    return error
+
+
+def _run_batch(commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run commands in one batch_migration_commands round trip; one response per command."""
+    if not commands:
+        return []
+    response = send_unreal_command("batch_migration_commands", {"commands": commands})
+    # A fully successful batch comes wrapped in the bridge's "result" envelope;
+    # a failed one is flattened with its results at the top level
+    payload = response.get("result", response)
+    results = payload.get("results")
+    if results is None:
+        return [{"success": False, "error": response.get("error", "Unknown error")} for _ in commands]
+    return results
+
+
+def _apply_redirects(
+    bp_name: str,
+    redirects: List[Tuple[str, str, Dict[str, Any], Dict[str, Any]]]
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Replace, recreate and reconnect the (node_id, graph_name, spec, connections)
+    nodes of one Blueprint, then compile it.
+
+    Each step is sent for all nodes at once with batch_migration_commands, so a
+    Blueprint takes three round trips however many nodes it has, instead of
+    three per node.
+
+    Returns:
+        One result per redirect, shaped like redirect_single_node's, and the
+        compile response, or None if no node was replaced
+    """
+    outcomes: List[Dict[str, Any]] = [{} for _ in redirects]
+
+    replace_results = _run_batch([
+        {"type": "replace_node", "params": {
+            "blueprint_name": bp_name,
+            "old_node_id": node_id,
+            "new_node_type": spec["target_function"],
+            "target_graph": graph_name
+        }}
+        for node_id, graph_name, spec, _ in redirects
+    ])
+
+    replaced = []
+    create_commands = []
+    for i, ((node_id, graph_name, spec, conn_result), replace_result) in enumerate(zip(redirects, replace_results)):
+        if not replace_result.get("success"):
+            outcomes[i] = {
+                "success": False,
+                "error": f"Failed to replace node: {_batch_error(replace_result)}",
+                "step": "replace_node"
+            }
+            continue
+        node_position = conn_result.get("node_position", [0, 0])
+        replaced.append((i, replace_result))
+        create_commands.append({"type": "create_node_by_action_name", "params": {
+            "blueprint_name": bp_name,
+            "function_name": spec["target_function"],
+            "class_name": spec["target_class"],
+            "node_position": [replace_result.get("old_node_pos_x", node_position[0]),
+                              replace_result.get("old_node_pos_y", node_position[1])],
+            "target_graph": graph_name
+        }})
+
+    created = []
+    replacements = {}
+    for (i, replace_result), create_result in zip(replaced, _run_batch(create_commands)):
+        node_id, _, spec, _ = redirects[i]
+        if not create_result.get("success"):
+            outcomes[i] = {
+                "success": False,
+                "error": f"Failed to create new node: {_batch_error(create_result)}",
+                "step": "create_node",
+                "stored_connections": replace_result.get("stored_connections", [])
+            }
+            continue
+        created.append((i, replace_result, create_result.get("node_id")))
+        replacements[node_id] = (create_result.get("node_id"), spec.get("pin_mapping") or {})
+
+    connected = []
+    final_commands = []
+    for i, replace_result, new_node_id in created:
+        node_id, graph_name, spec, _ = redirects[i]
+        outcomes[i] = {
+            "success": True,
+            "dry_run": False,
+            "blueprint_name": bp_name,
+            "graph_name": graph_name,
+            "old_node_id": node_id,
+            "new_node_id": new_node_id,
+            "new_function": f"{spec['target_class']}::{spec['target_function']}",
+            "connections_restored": 0,
+            "connection_errors": [],
+            "requires_compile": True
+        }
+        connections = _connections_to_restore(
+            replace_result.get("stored_connections", []), new_node_id, spec.get("pin_mapping") or {}
+        )
+        # A link between two redirected nodes is stored by whichever was replaced
+        # first, pointing at the other's old node; point it at its replacement
+        for connection in connections:
+            for side in ("source", "target"):
+                replacement = replacements.get(connection[f"{side}_node_id"])
+                if replacement is not None:
+                    other_node_id, other_mapping = replacement
+                    connection[f"{side}_node_id"] = other_node_id
+                    connection[f"{side}_pin"] = other_mapping.get(connection[f"{side}_pin"], connection[f"{side}_pin"])
+        if connections:
+            connected.append(i)
+            final_commands.append({"type": "connect_blueprint_nodes", "params": {
+                "blueprint_name": bp_name,
+                "connections": connections,
+                "target_graph": graph_name
+            }})
+
+    # The compile rides along with the reconnects; a Blueprint none of whose
+    # nodes could be replaced is unchanged and needs none
+    if replaced:
+        final_commands.append({"type": "compile_blueprint", "params": {"blueprint_name": bp_name}})
+    final_results = _run_batch(final_commands)
+    for i, connect_result in zip(connected, final_results):
+        if connect_result.get("success"):
+            outcomes[i]["connections_restored"] = len(connect_result.get("results", []))
+        else:
+            outcomes[i]["connection_errors"].append(_batch_error(connect_result))
+
+    return outcomes, final_results[-1] if replaced else None
+
+
+def _redirect_blueprint(
+    bp_name: str,
+    bp_work: List[Tuple[str, str, str]],
+    specs: Dict[str, Dict[str, Any]],
+    dry_run: bool
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Redirect the given (node_id, graph_name, source title) call sites of one
+    Blueprint, then compile it once. Each graph is listed once and shared by
+    its redirects, and the changes are batched, see _apply_redirects.
+
+    Returns:
+        The per-node results and the errors
+    """
+    bp_results = []
+    errors = []
+    graphs = {}
+    to_apply = []
+
+    for node_id, graph_name, title in bp_work:
+        if graph_name not in graphs:
+            graph_result = get_graph_nodes(bp_name, graph_name)
+            graphs[graph_name] = (index_graph_nodes(graph_result.get("graph_nodes", []))
+                                  if graph_result.get("success") else None)
+        spec = specs[title]
+
+        if dry_run:
+            result = redirect_single_node(
+                blueprint_name=bp_name,
+                node_id=node_id,
+                graph_name=graph_name,
+                target_class=spec["target_class"],
+                target_function=spec["target_function"],
+                pin_mapping=spec.get("pin_mapping") or {},
+                dry_run=True,
+                nodes_by_id=graphs[graph_name]
+            )
+        else:
+            # replace_node reports the connections to restore
+            result = get_node_connections(bp_name, node_id, graph_name, graphs[graph_name],
+                                          include_connections=False)
+            if result.get("success"):
+                to_apply.append((len(bp_results), (node_id, graph_name, spec, result)))
+        bp_results.append(result)
+
+    compile_result = None
+    if to_apply:
+        outcomes, compile_result = _apply_redirects(bp_name, [redirect for _, redirect in to_apply])
+        for (slot, _), outcome in zip(to_apply, outcomes):
+            bp_results[slot] = outcome
+
+    for (node_id, _, title), result in zip(bp_work, bp_results):
+        result["source_function"] = title
+        result.setdefault("old_node_id", node_id)
+        if not result.get("success"):
+            errors.append({
+                "blueprint": bp_name,
+                "node_id": node_id,
+                "source_function": title,
+                "error": result.get("error")
+            })
+
+    if compile_result is not None and not compile_result.get("success"):
+        errors.append({
+            "blueprint": bp_name,
+            "error": f"Compile failed: {_batch_error(compile_result)}"
+        })
+
+    return bp_results, errors
+
+
+def _redirect_blueprints(
+    work: Dict[str, List[Tuple[str, str, str]]],
+    specs: Dict[str, Dict[str, Any]],
+    dry_run: bool
+) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Run _redirect_blueprint for every Blueprint in work on a small thread pool,
+    so the round trips of different Blueprints overlap.
+
+    Returns:
+        Results by Blueprint, in the order of work, and all errors
+    """
+    results_by_blueprint = {}
+    errors = []
+    if not work:
+        return results_by_blueprint, errors
+
+    with ThreadPoolExecutor(max_workers=min(REDIRECT_WORKERS, len(work))) as executor:
+        outcomes = executor.map(
+            lambda item: _redirect_blueprint(item[0], item[1], specs, dry_run),
+            work.items()
+        )
+        for bp_name, (bp_results, bp_errors) in zip(work, outcomes):
+            results_by_blueprint[bp_name] = bp_results
+            errors.extend(bp_errors)
+
+    if not dry_run:
+        disk_cache.invalidate()
+        invalidate_function_call_index()
+    return results_by_blueprint, errors
+
+
 def redirect_blueprint_function_calls(
     source_function_title: str,
     target_class: str,
@@ -283,8 +923,9 @@ def redirect_blueprint_function_calls(
     pin_mapping: Optional[Dict[str, str]] = None,
     blueprint_filter: str = "/Game",
     specific_blueprints: Optional[List[str]] = None,
-    dry_run: bool = True,
-    backup: bool = True
+    dry_run: Union[bool, str] = True,
+    backup: bool = True,
+    use_index: bool = False
 ) -> Dict[str, Any]:
     """
     Redirect all calls to a Blueprint function across multiple Blueprints.
@@ -298,12 +939,17 @@ def redirect_blueprint_function_calls(
         pin_mapping: Dict mapping old pin names to new names (e.g., {"Item Pickup": "ItemPickup"})
         blueprint_filter: Content path to search (default: "/Game")
         specific_blueprints: Optional list of specific Blueprint names to process
-        dry_run: If True, only preview changes
+        dry_run: If True, only preview changes. PREVIEW_THEN_PROMPT previews them
+                 and keeps the plan, so commit_redirect_plan can apply it without
+                 searching again
         backup: If True, create backups before changes (only when dry_run=False)
+        use_index: Find call sites in the persisted function call index, see
+                   find_function_call_sites
 
     Returns:
         Dict with:
         - success: Overall success
+        - plan_digest: Digest to pass to commit_redirect_plan (PREVIEW_THEN_PROMPT only)
         - source_function: The function being redirected
         - target_function: The C++ replacement
         - blueprints_affected: Number of Blueprints with changes
@@ -315,10 +961,11 @@ def redirect_blueprint_function_calls(
 
     # Step 1: Find all calls to the source function
     logger.info(f"Searching for calls to '{source_function_title}'...")
-    search_result = find_blueprint_function_calls(
+    search_result = find_function_call_sites(
         source_function_title,
         blueprint_filter,
-        max_results=500
+        max_results=None,
+        use_index=use_index
     )
 
     if not search_result.get("success"):
@@ -345,58 +992,42 @@ def redirect_blueprint_function_calls(
     if specific_blueprints:
         by_blueprint = {k: v for k, v in by_blueprint.items() if k in specific_blueprints}
 
-    # Step 2: Process each Blueprint
-    results_by_blueprint = {}
-    total_nodes = 0
-    total_errors = []
-
+    # Step 2: Process the Blueprints concurrently
+    specs = {source_function_title: {
+        "target_class": target_class,
+        "target_function": target_function,
+        "pin_mapping": pin_mapping
+    }}
+    work = {}
     for bp_name, bp_matches in by_blueprint.items():
-        bp_results = []
-
+        # A node found by more than one query is redirected once; a second
+        # attempt would fail on the node the first one replaced
+        seen = set()
         for match in bp_matches:
             node_id = match.get("node_id")
-            graph_name = match.get("graph_name", "EventGraph")
-
-            if not node_id:
+            if not node_id or node_id in seen:
                 continue
-
-            result = redirect_single_node(
-                blueprint_name=bp_name,
-                node_id=node_id,
-                graph_name=graph_name,
-                target_class=target_class,
-                target_function=target_function,
-                pin_mapping=pin_mapping,
-                dry_run=dry_run
+            seen.add(node_id)
+            work.setdefault(bp_name, []).append(
+                (node_id, match.get("graph_name", "EventGraph"), source_function_title)
             )
+    keep_plan = dry_run == PREVIEW_THEN_PROMPT
+    dry_run = bool(dry_run)
+    results_by_blueprint, total_errors = _redirect_blueprints(work, specs, dry_run)
 
-            bp_results.append(result)
+    redirected = {(bp_name, result["old_node_id"])
+                  for bp_name, bp_results in results_by_blueprint.items()
+                  for result in bp_results if result.get("success")}
+    total_nodes = len(redirected)
 
-            if result.get("success"):
-                total_nodes += 1
-            else:
-                total_errors.append({
-                    "blueprint": bp_name,
-                    "node_id": node_id,
-                    "error": result.get("error")
-                })
-
-        results_by_blueprint[bp_name] = bp_results
-
-        # Compile the Blueprint if we made changes
-        if not dry_run and bp_results:
-            compile_result = send_unreal_command("compile_blueprint", {
-                "blueprint_name": bp_name
-            })
-            if not compile_result.get("success"):
-                total_errors.append({
-                    "blueprint": bp_name,
-                    "error": f"Compile failed: {compile_result.get('error')}"
-                })
+    plan = {}
+    if keep_plan:
+        plan = _store_plan(work, specs, blueprint_filter)
 
     return {
         "success": len(total_errors) == 0,
         "dry_run": dry_run,
+        **plan,
         "source_function": source_function_title,
         "target_function": f"{target_class}::{target_function}",
         "pin_mapping": pin_mapping,
@@ -408,6 +1039,178 @@ def redirect_blueprint_function_calls(
     }
 
 
+def _store_plan(
+    work: Dict[str, List[Tuple[str, str, str]]],
+    specs: Dict[str, Dict[str, Any]],
+    blueprint_filter: str
+) -> Dict[str, Any]:
+    """Keep a previewed redirect plan for commit_redirect_plan; returns its digest fields."""
+    now = time.monotonic()
+    for digest in [d for d, (expiry, _) in _pending_plans.items() if expiry <= now]:
+        _pending_plans.pop(digest, None)
+
+    fingerprint = json.dumps([
+        sorted(f"{bp_name}:{node_id}:{title}" for bp_name, bp_work in work.items() for node_id, _, title in bp_work),
+        {title: [spec["target_class"], spec["target_function"], spec.get("pin_mapping") or {}]
+         for title, spec in specs.items()}
+    ], sort_keys=True)
+    digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+    _pending_plans[digest] = (now + PLAN_TTL, {
+        "work": work,
+        "specs": specs,
+        "blueprint_filter": blueprint_filter
+    })
+    return {"plan_digest": digest, "plan_expires_in": PLAN_TTL}
+
+
+def commit_redirect_plan(digest: str) -> Dict[str, Any]:
+    """
+    Apply a redirect previewed with dry_run=PREVIEW_THEN_PROMPT.
+
+    The call sites found by the preview are redirected without searching the
+    project again. Plans can be committed once, within PLAN_TTL seconds.
+
+    Args:
+        digest: plan_digest returned by the preview
+
+    Returns:
+        Dict with the same counts and per-Blueprint results as a redirect
+    """
+    expiry, plan = _pending_plans.pop(digest, (0.0, None))
+    if plan is None or expiry <= time.monotonic():
+        return {
+            "success": False,
+            "error": f"No pending redirect plan '{digest}'; it was committed already or expired. Preview it again."
+        }
+
+    results_by_blueprint, total_errors = _redirect_blueprints(plan["work"], plan["specs"], dry_run=False)
+
+    redirected = {(bp_name, result["old_node_id"])
+                  for bp_name, bp_results in results_by_blueprint.items()
+                  for result in bp_results if result.get("success")}
+
+    return {
+        "success": len(total_errors) == 0,
+        "dry_run": False,
+        "plan_digest": digest,
+        "target_functions": {
+            title: f"{spec['target_class']}::{spec['target_function']}"
+            for title, spec in plan["specs"].items()
+        },
+        "blueprints_affected": len(results_by_blueprint),
+        "nodes_redirected": len(redirected),
+        "results_by_blueprint": results_by_blueprint,
+        "errors": total_errors,
+        "message": f"Redirected {len(redirected)} nodes in {len(results_by_blueprint)} Blueprints"
+    }
+
+
+def redirect_many(
+    redirects: List[Dict[str, Any]],
+    blueprint_filter: str = "/Game",
+    specific_blueprints: Optional[List[str]] = None,
+    dry_run: bool = True,
+    use_index: bool = False
+) -> Dict[str, Any]:
+    """
+    Apply several function redirects in one pass over the affected Blueprints.
+
+    Call sites for every source title are collected first, then each Blueprint
+    is visited once: its graphs are listed once, all of its redirects are
+    applied, and it is compiled once.
+
+    Args:
+        redirects: List of dicts with source_function_title, target_class,
+                   target_function and optional pin_mapping
+        blueprint_filter: Content path to search (default: "/Game")
+        specific_blueprints: Optional list of specific Blueprint names to process
+        dry_run: If True, only preview changes
+        use_index: Find call sites in the persisted function call index, see
+                   find_function_call_sites
+
+    Returns:
+        Dict with:
+        - success: Overall success
+        - blueprints_affected: Number of Blueprints with changes
+        - nodes_redirected: Total nodes redirected (or would be)
+        - results_by_redirect: Node counts per source function
+        - results_by_blueprint: Detailed results per Blueprint
+        - errors: Any errors encountered
+    """
+    specs = {}
+    for redirect in redirects:
+        title = redirect.get("source_function_title")
+        if not title or not redirect.get("target_class") or not redirect.get("target_function"):
+            return {
+                "success": False,
+                "error": "Each redirect needs source_function_title, target_class and target_function"
+            }
+        specs[title] = redirect
+
+    # Step 1: Find call sites. The search matches substrings, so longer titles
+    # claim their nodes first and a node is only ever redirected once.
+    titles = sorted(specs, key=len, reverse=True)
+    index = None
+    if use_index and len(titles) >= MULTI_TITLE_MATCH_THRESHOLD:
+        index = _current_function_call_index(blueprint_filter)
+
+    if index is not None:
+        work = _claim_indexed_calls(index, titles, specific_blueprints)
+    else:
+        work = {}
+        claimed = set()
+        for title in titles:
+            logger.info(f"Searching for calls to '{title}'...")
+            search_result = find_function_call_sites(title, blueprint_filter, max_results=None, use_index=use_index)
+            if not search_result.get("success"):
+                return {
+                    "success": False,
+                    "error": f"Search for '{title}' failed: {search_result.get('error', 'Unknown error')}"
+                }
+
+            for bp_name, bp_matches in search_result.get("by_blueprint", {}).items():
+                if specific_blueprints and bp_name not in specific_blueprints:
+                    continue
+                for match in bp_matches:
+                    node_id = match.get("node_id")
+                    if not node_id or (bp_name, node_id) in claimed:
+                        continue
+                    claimed.add((bp_name, node_id))
+                    work.setdefault(bp_name, []).append(
+                        (node_id, match.get("graph_name", "EventGraph"), title)
+                    )
+
+    # Step 2: Process each Blueprint once, several at a time
+    results_by_blueprint, total_errors = _redirect_blueprints(work, specs, dry_run)
+
+    nodes_by_redirect = dict.fromkeys(specs, 0)
+    redirected = set()
+    for bp_name, bp_results in results_by_blueprint.items():
+        for result in bp_results:
+            if result.get("success"):
+                nodes_by_redirect[result["source_function"]] += 1
+                redirected.add((bp_name, result["old_node_id"]))
+    total_nodes = len(redirected)
+
+    return {
+        "success": len(total_errors) == 0,
+        "dry_run": dry_run,
+        "blueprints_affected": len(results_by_blueprint),
+        "nodes_redirected": total_nodes,
+        "results_by_redirect": {
+            title: {
+                "target_function": f"{spec['target_class']}::{spec['target_function']}",
+                "nodes_redirected": nodes_by_redirect[title]
+            }
+            for title, spec in specs.items()
+        },
+        "results_by_blueprint": results_by_blueprint,
+        "errors": total_errors,
+        "message": f"{'Would redirect' if dry_run else 'Redirected'} {total_nodes} nodes for {len(specs)} functions in {len(results_by_blueprint)} Blueprints"
+    }
+
+
 def verify_no_external_references(
     blueprint_path: str,
     function_name: str
@@ -427,6 +1230,12 @@ def verify_no_external_references(
         - safe_to_delete: True if no external references remain
         - remaining_refs: List of Blueprints still referencing the function
     """
+    key = disk_cache.cache_key("verify_no_external_references",
+                               {"blueprint_path": blueprint_path, "function_name": function_name})
+    cached = disk_cache.get(key)
+    if cached is not None:
+        return cached
+
     search_result = send_unreal_command("find_in_blueprints", {
         "search_query": function_name,
         "search_type": "function",
@@ -440,14 +1249,11 @@ def verify_no_external_references(
             "error": f"Search failed: {search_result.get('error')}"
         }
 
-    # Extract the Blueprint name from path
-    bp_name = blueprint_path.split("/")[-1]
-
-    # Filter out references from the Blueprint itself
+    # Filter out references from the Blueprint itself, named either way
+    own_names = {blueprint_path.rpartition("/")[2], blueprint_path}
     external_refs = []
     for match in search_result.get("matches", []):
-        match_bp = match.get("blueprint_name", "")
-        if match_bp != bp_name and match_bp != blueprint_path:
+        if match.get("blueprint_name", "") not in own_names:
             external_refs.append({
                 "blueprint": match.get("blueprint_path"),
                 "graph": match.get("graph_name"),
@@ -455,7 +1261,7 @@ def verify_no_external_references(
                 "node_title": match.get("node_title")
             })
 
-    return {
+    result = {
         "success": True,
         "function_name": function_name,
         "blueprint": blueprint_path,
@@ -463,3 +1269,5 @@ def verify_no_external_references(
         "remaining_refs_count": len(external_refs),
         "remaining_refs": external_refs
     }
+    disk_cache.put(key, result)
+    return result
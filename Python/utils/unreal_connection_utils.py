@@ -1,17 +1,49 @@
 """
 Utilities for working with Unreal Engine connections.
 
-SIMPLIFIED VERSION: All requests are serialized with a global lock.
-One request at a time - no concurrency, no race conditions.
+Commands share one persistent connection to Unreal per process, see
+UnrealConnection. Requests are pipelined: several threads or tasks may have
+a command in flight at once instead of queueing behind a global lock, and
+no connection is set up per command.
 """
 
+import asyncio
 import logging
+import selectors
 import socket
-import json
 import threading
 import os
 import datetime
-from typing import Dict, Any, Optional
+import queue
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from typing import Deque, Dict, Any, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+
+    def _json_dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    import json
+
+    _json_encoder = json.JSONEncoder(separators=(',', ':'))
+    _json_sorted_encoder = json.JSONEncoder(separators=(',', ':'), sort_keys=True)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_encoder.encode(obj).encode('utf-8')
+
+    def _json_dumps_sorted(obj: Any) -> bytes:
+        return _json_sorted_encoder.encode(obj).encode('utf-8')
+
+    def _json_loads(data: Union[bytes, bytearray, memoryview]) -> Any:
+        # json.loads does not take a memoryview
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
@@ -20,203 +52,503 @@ logger = logging.getLogger("UnrealMCP")
 UNREAL_HOST = "127.0.0.1"
 UNREAL_PORT = 55557
 
+# Seconds to wait for the response to a command
+REQUEST_TIMEOUT = 30.0
+
+# Commands that walk every Blueprint under a path and may run far longer
+COMMAND_TIMEOUTS = {
+    "build_function_call_index": 600.0,
+    "find_in_blueprints": 120.0,
+}
+
+# Unreal closes connections idle for 30 seconds; one idle this long is
+# replaced rather than reused, so a request never races that close
+IDLE_RECONNECT_SECONDS = 20.0
+
+# Connection attempts before a command fails, with exponential backoff; only
+# a refused connection (Unreal still starting) is retried
+CONNECT_ATTEMPTS = 3
+CONNECT_BACKOFF_SECONDS = 0.5
+
+# Read-only commands; an identical request already in flight is answered by
+# the same response instead of being sent again
+COALESCED_COMMANDS = frozenset({
+    "get_blueprint_metadata",
+    "get_blueprint_functions",
+    "get_blueprint_dependencies",
+    "find_blueprint_references",
+    "find_in_blueprints",
+    "get_actors_in_level",
+    "find_actors_by_name",
+    "get_actor_properties",
+    "get_level_metadata",
+    "get_project_dir",
+})
+
+# Read-only commands whose responses are also reused for a short while. Project
+# wide searches and full metadata dumps are repeated with identical params
+# throughout a migration; any other command sent drops the reused responses
+CACHED_COMMANDS = frozenset({
+    "find_in_blueprints",
+    "get_blueprint_metadata",
+    "get_project_dir",
+})
+RESPONSE_CACHE_TTL = 10.0
+RESPONSE_CACHE_SIZE = 256
+
+# Leading bytes of a gzip stream; large responses are compressed
+_GZIP_MAGIC = b'\x1f\x8b'
+
 # Debug log file
 _debug_log_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mcp_debug.log")
 
-def _debug(msg: str):
-    """Write debug message to file with timestamp."""
+# Lines waiting for the writer thread, which keeps the log file open
+_debug_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+_debug_writer: Optional[threading.Thread] = None
+_debug_writer_lock = threading.Lock()
+
+def _write_debug_lines():
+    """Append queued debug lines to the log file, flushing once per burst."""
     try:
-        with open(_debug_log_path, "a", encoding="utf-8") as f:
-            f.write(f"[{datetime.datetime.now()}] {msg}\n")
+        f = open(_debug_log_path, "a", encoding="utf-8", buffering=65536)
+    except OSError:
+        f = None
+    while True:
+        lines = [_debug_queue.get()]
+        try:
+            while True:
+                lines.append(_debug_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if f is None:
+            continue
+        try:
+            f.writelines(lines)
             f.flush()
-    except:
-        pass
+        except OSError:
+            pass
+
+def _debug(msg: str):
+    """Queue a debug message with timestamp for the writer thread."""
+    global _debug_writer
+    if _debug_writer is None:
+        with _debug_writer_lock:
+            if _debug_writer is None:
+                _debug_writer = threading.Thread(target=_write_debug_lines, name="UnrealMCPDebugLog", daemon=True)
+                _debug_writer.start()
+    _debug_queue.put(f"[{datetime.datetime.now()}] {msg}\n")
+
 
-# Global lock - only ONE request can be in-flight at a time
-_request_lock = threading.Lock()
+# Initial size of a reader's receive buffer; it grows to the largest response seen
+RECEIVE_BUFFER_SIZE = 64 * 1024
 
+# Seconds a response may go without data once it has started; Unreal sends a
+# response in one go, so a longer gap means it will not finish, and the
+# requests behind it fail now instead of timing out one by one
+RESPONSE_STALL_SECONDS = 5.0
 
-def _send_tcp_command(command_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+
+def _recv_exactly(sock: socket.socket, view: memoryview, selector: Optional[selectors.BaseSelector] = None) -> None:
     """
-    Send a single TCP command to Unreal and wait for response.
-    This is the core function - no retries, no complexity.
+    Fill view from the socket, raising ConnectionError if the connection closes
+    first. With a selector for the socket, raises TimeoutError if no data
+    arrives for RESPONSE_STALL_SECONDS.
+    """
+    size = len(view)
+    received = 0
+    while received < size:
+        if selector is not None and not selector.select(RESPONSE_STALL_SECONDS):
+            raise TimeoutError(f"Response stalled after {received} of {size} bytes")
+        count = sock.recv_into(view[received:])
+        if not count:
+            raise ConnectionResetError("Connection closed by Unreal")
+        received += count
+
+
+class UnrealConnection:
+    """
+    Persistent, pipelined connection to the Unreal MCP bridge.
+
+    Each request is one line of JSON asking Unreal to keep the connection open
+    and to length-prefix its response. Unreal runs the requests of a
+    connection one at a time and answers them in order, so a reader thread
+    resolves the pending futures first-in, first-out.
     """
-    sock = None
-    try:
-        _debug(f"TCP [{command_name}] Creating socket...")
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(30)  # 30 second timeout for everything
-        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-
-        _debug(f"TCP [{command_name}] Connecting to {UNREAL_HOST}:{UNREAL_PORT}...")
-        sock.connect((UNREAL_HOST, UNREAL_PORT))
-        _debug(f"TCP [{command_name}] Connected!")
-
-        # Send command
-        command_obj = {"type": command_name, "params": params or {}}
-        command_json = json.dumps(command_obj)
-        _debug(f"TCP [{command_name}] Sending {len(command_json)} bytes...")
-        sock.sendall(command_json.encode('utf-8'))
-        _debug(f"TCP [{command_name}] Sent! Waiting for response...")
-
-        # Receive response - simple blocking recv until we get complete JSON
-        chunks = []
-        recv_count = 0
-        while True:
-            recv_count += 1
-            _debug(f"TCP [{command_name}] recv() call #{recv_count}...")
-            chunk = sock.recv(8192)
-            _debug(f"TCP [{command_name}] recv() returned {len(chunk) if chunk else 0} bytes")
-
-            if not chunk:
-                _debug(f"TCP [{command_name}] Connection closed by server")
-                break
-            chunks.append(chunk)
 
-            # Try to parse as JSON - if successful, we have complete response
-            data = b''.join(chunks)
+    def __init__(self, host: str = UNREAL_HOST, port: int = UNREAL_PORT):
+        self.host = host
+        self.port = port
+        self._sock: Optional[socket.socket] = None
+        # (future, request, retried, coalesce) for each request awaiting its response, in send order
+        self._pending: Deque[Tuple[Future, bytes, bool, bool]] = deque()
+        # request -> future of each coalesced command awaiting its response
+        self._inflight: Dict[bytes, Future] = {}
+        # request -> (expiry, encoded response) of recent CACHED_COMMANDS responses,
+        # decoded afresh for each caller so none sees another's changes
+        self._responses: Dict[bytes, Tuple[float, bytes]] = {}
+        # Counts the commands that may change something, see _remember
+        self._generation = 0
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    def call(self, command_name: str, params: Optional[Dict[str, Any]]) -> Future:
+        """
+        Send a command and return a future for its decoded response.
+
+        A command in COALESCED_COMMANDS gets the future of an identical request
+        still in flight, if any, and one in CACHED_COMMANDS a recent response
+        to it. Any other command may change what they return, so requests sent
+        after it never share a response with those sent before.
+
+        Raises:
+            OSError: If Unreal cannot be reached
+        """
+        # Sorted, so the same params in any order coalesce and hit the cache
+        request = _json_dumps_sorted({
+            "type": command_name,
+            "params": params or {},
+            "framed": True,
+            "keep_alive": True,
+            "accept_compression": "gzip"
+        }) + b'\n'
+        coalesce = command_name in COALESCED_COMMANDS
+        if coalesce:
+            with self._lock:
+                entry = self._responses.get(request)
+                future = self._inflight.get(request)
+            if entry is not None and entry[0] > time.monotonic():
+                _debug(f"TCP [{command_name}] Reusing recent response")
+                future = Future()
+                future.set_result(_json_loads(entry[1]))
+                return future
+            if future is not None:
+                _debug(f"TCP [{command_name}] Joining identical request in flight")
+                return future
+
+        future = Future()
+        generation = self._send(future, request, retried=False, coalesce=coalesce)
+        if coalesce:
+            future.add_done_callback(lambda done: self._forget(request, done))
+        if command_name in CACHED_COMMANDS:
+            future.add_done_callback(lambda done: self._remember(request, generation, done))
+        return future
+
+    def reset(self) -> None:
+        """Close the connection, failing the commands still in flight on it."""
+        with self._lock:
+            sock = self._sock
+        if sock is not None:
+            self._connection_lost(sock, ConnectionAbortedError("Connection reset"))
+
+    def _send(self, future: Future, request: bytes, retried: bool, coalesce: bool = False) -> int:
+        """Send a request, returning the generation it was sent in."""
+        with self._lock:
+            sock = self._connect_locked()
+            self._pending.append((future, request, retried, coalesce))
             try:
-                response = json.loads(data.decode('utf-8'))
-                _debug(f"TCP [{command_name}] SUCCESS! Got complete JSON ({len(data)} bytes)")
-                return response
-            except json.JSONDecodeError:
-                _debug(f"TCP [{command_name}] Partial JSON ({len(data)} bytes), continuing...")
-                continue
-
-        # If we get here, connection closed before complete JSON
-        _debug(f"TCP [{command_name}] Connection closed, checking if we have complete data...")
-        if chunks:
-            data = b''.join(chunks)
+                sock.sendall(request)
+            except OSError:
+                self._pending.pop()
+                self._close_locked()
+                raise
+            self._last_used = time.monotonic()
+            if coalesce:
+                self._inflight[request] = future
+            else:
+                self._inflight.clear()
+                self._responses.clear()
+                self._generation += 1
+            return self._generation
+
+    def _forget(self, request: bytes, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(request) is future:
+                del self._inflight[request]
+
+    def _remember(self, request: bytes, generation: int, future: Future) -> None:
+        if future.cancelled():
+            return
+        response = future.result()
+        if response.get("success") is False or response.get("status") == "error":
+            return
+        body = _json_dumps(response)
+        now = time.monotonic()
+        with self._lock:
+            # A command sent since may have changed the answer
+            if self._generation != generation:
+                return
+            if len(self._responses) >= RESPONSE_CACHE_SIZE:
+                self._responses = {key: entry for key, entry in self._responses.items() if entry[0] > now}
+                if len(self._responses) >= RESPONSE_CACHE_SIZE:
+                    self._responses.clear()
+            self._responses[request] = (now + RESPONSE_CACHE_TTL, body)
+
+    def _connect_locked(self) -> socket.socket:
+        if self._sock is not None:
+            if self._pending or time.monotonic() - self._last_used < IDLE_RECONNECT_SECONDS:
+                return self._sock
+            _debug("TCP Replacing idle connection")
+            self._close_locked()
+
+        delay = CONNECT_BACKOFF_SECONDS
+        for attempt in range(CONNECT_ATTEMPTS):
             try:
-                response = json.loads(data.decode('utf-8'))
-                _debug(f"TCP [{command_name}] SUCCESS after close ({len(data)} bytes)")
-                return response
-            except:
-                _debug(f"TCP [{command_name}] FAILED - incomplete JSON after close")
-                pass
+                _debug(f"TCP Connecting to {self.host}:{self.port}...")
+                sock = socket.create_connection((self.host, self.port), timeout=REQUEST_TIMEOUT)
+                break
+            except OSError as e:
+                if not isinstance(e, ConnectionRefusedError) or attempt == CONNECT_ATTEMPTS - 1:
+                    _debug(f"TCP Connection failed: {e}")
+                    raise
+                logger.warning("Retrying connection to Unreal after error: %s", e)
+                # Let cached and coalesced lookups through while waiting
+                self._lock.release()
+                try:
+                    time.sleep(delay)
+                finally:
+                    self._lock.acquire()
+                delay *= 2
+                if self._sock is not None:
+                    # Another command connected meanwhile
+                    return self._sock
+
+        # Responses are waited for through the futures, so reads may block indefinitely
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._sock = sock
+        threading.Thread(target=self._read_responses, args=(sock,), name="UnrealMCPReader", daemon=True).start()
+        _debug("TCP Connected!")
+        return sock
+
+    def _close_locked(self) -> None:
+        if self._sock is not None:
+            _close_socket(self._sock)
+            self._sock = None
+
+    def _read_responses(self, sock: socket.socket) -> None:
+        # One header and one body buffer per connection, reused for every
+        # response; a body is decoded before the next one is read into it
+        header = bytearray(4)
+        header_view = memoryview(header)
+        buffer = bytearray(RECEIVE_BUFFER_SIZE)
+        # Waiting for a response to start may take as long as the command runs;
+        # only the body is read against RESPONSE_STALL_SECONDS
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        try:
+            while True:
+                _recv_exactly(sock, header_view)
+                size = int.from_bytes(header, 'little')
+                if size > len(buffer):
+                    buffer = bytearray(size)
+                body = memoryview(buffer)[:size]
+                _recv_exactly(sock, body, selector)
+                if body[:2] == _GZIP_MAGIC:
+                    body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+                _debug(f"TCP Received response ({size} bytes)")
+
+                with self._lock:
+                    future, _, _, _ = self._pending.popleft()
+                try:
+                    _resolve(future, _json_loads(body))
+                except ValueError as e:
+                    _resolve(future, {"status": "error", "error": f"Invalid response: {e}"})
+        except (OSError, zlib.error, IndexError) as e:
+            self._connection_lost(sock, e)
+        finally:
+            selector.close()
+
+    def _connection_lost(self, sock: socket.socket, error: Exception) -> None:
+        with self._lock:
+            if self._sock is not sock:
+                # Already replaced; its requests were dealt with then
+                _close_socket(sock)
+                return
+            self._close_locked()
+            pending = list(self._pending)
+            self._pending.clear()
+
+        _debug(f"TCP Connection lost with {len(pending)} request(s) in flight: {error}")
+        for future, request, retried, coalesce in pending:
+            # Unreal only closes a kept-alive connection while it is idle, so the
+            # requests it had not answered were never run, and are sent again
+            # once. An editor crash or restart resets it too, possibly after a
+            # command ran, so only read-only (coalesced) ones are.
+            if isinstance(error, ConnectionResetError) and coalesce and not retried:
+                try:
+                    self._send(future, request, retried=True, coalesce=coalesce)
+                    continue
+                except OSError as e:
+                    error = e
+            _resolve(future, {"status": "error", "error": f"Connection lost: {error}"})
 
-        _debug(f"TCP [{command_name}] FAILED - no complete response")
-        return {"status": "error", "error": "Connection closed before complete response"}
 
-    except socket.timeout:
-        _debug(f"TCP [{command_name}] TIMEOUT!")
-        return {"status": "error", "error": "Connection timeout"}
-    except ConnectionRefusedError:
-        _debug(f"TCP [{command_name}] CONNECTION REFUSED!")
+def _close_socket(sock: socket.socket) -> None:
+    # Closing alone does not wake a reader thread blocked in recv_into
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # Already disconnected
+    try:
+        sock.close()
+    except OSError:
+        pass
+
+
+def _resolve(future: Future, response: Dict[str, Any]) -> None:
+    try:
+        future.set_result(response)
+    except InvalidStateError:
+        pass  # The caller gave up on the command (an async call was cancelled)
+
+
+_connection = UnrealConnection()
+
+
+def _unwrap_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten the nested error format of the C++ MCPErrorHandler.
+
+    Other fields of a failed response are kept, e.g. the per-command results
+    of a partly failed batch.
+    """
+    if response.get("success") is False:
+        error_field = response.get("error")
+        if isinstance(error_field, dict):
+            error_message = (error_field.get("errorMessage") or
+                           error_field.get("errorDetails") or
+                           error_field.get("message") or
+                           "Unknown error")
+        elif isinstance(error_field, str):
+            error_message = error_field
+        else:
+            error_message = response.get("message", "Unknown error")
+        return {**response, "status": "error", "error": error_message}
+    return response
+
+
+def _connect_error(error: OSError) -> Dict[str, Any]:
+    if isinstance(error, ConnectionRefusedError):
         return {"status": "error", "error": "Connection refused - is Unreal Engine running?"}
-    except Exception as e:
-        _debug(f"TCP [{command_name}] EXCEPTION: {e}")
-        return {"status": "error", "error": str(e)}
-    finally:
-        _debug(f"TCP [{command_name}] Closing socket...")
-        if sock:
-            try:
-                sock.close()
-            except:
-                pass
-        _debug(f"TCP [{command_name}] Socket closed")
+    return {"status": "error", "error": str(error)}
 
 
 def send_unreal_command(command_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Send a command to Unreal Engine.
+    Send a command to Unreal Engine and wait for its response.
 
-    IMPORTANT: This function is serialized - only one request at a time.
-    If multiple threads call this, they will queue up and execute one by one.
+    Safe to call from several threads at once; their commands are pipelined
+    over the shared connection.
     """
-    _debug(f"QUEUE [{command_name}] Entered send_unreal_command")
-    _debug(f"QUEUE [{command_name}] Waiting for lock...")
+    _debug(f"TCP [{command_name}] Sending...")
+    try:
+        future = _connection.call(command_name, params)
+    except OSError as e:
+        return _connect_error(e)
+
+    try:
+        response = future.result(timeout=COMMAND_TIMEOUTS.get(command_name, REQUEST_TIMEOUT))
+    except FutureTimeoutError:
+        # Unreal still runs the command; it keeps its place in the pipeline,
+        # so its late response is matched to it and dropped, and the requests
+        # of other callers are left alone
+        _debug(f"TCP [{command_name}] TIMEOUT!")
+        return {"status": "error", "error": "Connection timeout"}
+
+    _debug(f"TCP [{command_name}] Done")
+    return _unwrap_response(response)
 
-    # Try to acquire lock with timeout to detect deadlocks
-    acquired = _request_lock.acquire(timeout=60)
-    if not acquired:
-        _debug(f"QUEUE [{command_name}] DEADLOCK! Could not acquire lock after 60s")
-        return {"status": "error", "error": "Request queue deadlock - lock not released by previous request"}
 
-    _debug(f"QUEUE [{command_name}] Got lock!")
+async def send_unreal_command_async(command_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send a command to Unreal Engine from a coroutine.
 
+    Concurrent calls are pipelined over the shared connection, so they finish
+    in about the time of the slowest one rather than the sum of all.
+    """
     try:
-        _debug(f"QUEUE [{command_name}] Calling _send_tcp_command...")
-
-        # Simple retry: try up to 2 times
-        for attempt in range(2):
-            response = _send_tcp_command(command_name, params)
-
-            # Check if it's an error we should retry
-            if response.get("status") == "error":
-                error = response.get("error", "")
-                if attempt == 0 and ("timeout" in error.lower() or "refused" in error.lower()):
-                    logger.warning(f"Retrying after error: {error}")
-                    import time
-                    time.sleep(0.5)
-                    continue
+        # Sending may have to connect first, which blocks
+        future = await asyncio.to_thread(_connection.call, command_name, params)
+    except OSError as e:
+        return _connect_error(e)
 
-            # Success or non-retryable error
-            break
-
-        # Handle nested error format from C++ MCPErrorHandler
-        if response.get("success") is False:
-            error_field = response.get("error")
-            if isinstance(error_field, dict):
-                error_message = (error_field.get("errorMessage") or
-                               error_field.get("errorDetails") or
-                               error_field.get("message") or
-                               "Unknown error")
-                return {"status": "error", "error": error_message}
-            elif isinstance(error_field, str):
-                return {"status": "error", "error": error_field}
-            else:
-                return {"status": "error", "error": response.get("message", "Unknown error")}
+    try:
+        # Shielded, as the future may be shared with other callers of a coalesced command
+        response = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)),
+                                          COMMAND_TIMEOUTS.get(command_name, REQUEST_TIMEOUT))
+    except asyncio.TimeoutError:
+        # As in send_unreal_command, the late response is dropped in its turn
+        return {"status": "error", "error": "Connection timeout"}
 
-        _debug(f"QUEUE [{command_name}] Done, returning response")
-        return response
+    return _unwrap_response(response)
 
-    finally:
-        # ALWAYS release the lock, even if an exception occurred
-        _request_lock.release()
-        _debug(f"QUEUE [{command_name}] Released lock")
+
+async def send_tcp_command(command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    send_unreal_command_async for the domain servers, whose tools check the
+    success field; connection errors and bridge failures carry none.
+    """
+    response = await send_unreal_command_async(command_type, params)
+    if response.get("status") == "error":
+        return {**response, "success": False}
+    return response
 
 
 # Legacy compatibility
 def get_unreal_engine_connection():
-    """Legacy - not used in simplified version."""
+    """Legacy - commands go through send_unreal_command."""
     return None
 
 def reset_connection():
-    """Legacy - not used in simplified version."""
-    pass
+    """Close the shared connection; the next command opens a new one."""
+    _connection.reset()
 
 
-# Cache for project info
-_project_info_cache: Dict[str, Any] = {}
+# Cached project info, filled once under _project_lock
+_MODULE_NAME: Optional[str] = None
+_MODULE_PATH: Optional[str] = None
+_project_lock = threading.Lock()
 
-def get_project_module_name() -> str:
-    """Get the current Unreal project's module name."""
-    global _project_info_cache
+def _load_project_info() -> bool:
+    """Ask Unreal for the project module once; callers hold _project_lock."""
+    global _MODULE_NAME, _MODULE_PATH
 
-    if "module_name" in _project_info_cache:
-        return _project_info_cache["module_name"]
+    if _MODULE_NAME is not None:
+        return True
 
     try:
         response = send_unreal_command("get_project_dir", {})
         if response and response.get("success") and response.get("project_name"):
             module_name = response["project_name"]
-            _project_info_cache["module_name"] = module_name
-            _project_info_cache["module_path"] = response.get("module_path", f"/Script/{module_name}")
-            return module_name
+            # Path first: readers check _MODULE_NAME without the lock
+            _MODULE_PATH = response.get("module_path", f"/Script/{module_name}")
+            _MODULE_NAME = module_name
+            return True
     except Exception as e:
         logger.warning(f"Failed to get project module name: {e}")
 
+    return False
+
+def get_project_module_name() -> str:
+    """Get the current Unreal project's module name."""
+    if _MODULE_NAME is not None:
+        return _MODULE_NAME
+
+    with _project_lock:
+        if _load_project_info():
+            return _MODULE_NAME
+
     return "MyGame"
 
 
 def get_project_module_path() -> str:
     """Get the full script module path for the current project."""
-    global _project_info_cache
+    if _MODULE_NAME is not None:
+        return _MODULE_PATH
 
-    if "module_path" in _project_info_cache:
-        return _project_info_cache["module_path"]
+    with _project_lock:
+        if _load_project_info():
+            return _MODULE_PATH
 
-    module_name = get_project_module_name()
-    return _project_info_cache.get("module_path", f"/Script/{module_name}")
+    return "/Script/MyGame"